@@ -11,27 +11,48 @@ _________________
 """
 
 # our package imports.
+from bosesoundtouchapi.asyncsoundtouchclient import AsyncSoundTouchClient
+from bosesoundtouchapi.soundtouchcircuitbreaker import SoundTouchCircuitBreaker
+from bosesoundtouchapi.soundtouchcircuitbreakerstates import SoundTouchCircuitBreakerStates
 from bosesoundtouchapi.soundtouchclient import SoundTouchClient
+from bosesoundtouchapi.soundtouchconfigurationcache import SoundTouchConfigurationCache
 from bosesoundtouchapi.soundtouchdevice import SoundTouchDevice
 from bosesoundtouchapi.soundtouchdiscovery import SoundTouchDiscovery
 from bosesoundtouchapi.soundtoucherror import SoundTouchError
+from bosesoundtouchapi.soundtouchfleet import SoundTouchFleet
 from bosesoundtouchapi.soundtouchitemtypes import SoundTouchItemTypes
 from bosesoundtouchapi.soundtouchkeys import SoundTouchKeys
 from bosesoundtouchapi.soundtouchmessage import SoundTouchMessage
+from bosesoundtouchapi.soundtouchnavigatecache import SoundTouchNavigateCache
 from bosesoundtouchapi.soundtouchnotifycategorys import SoundTouchNotifyCategorys
+from bosesoundtouchapi.soundtouchrecentlistcachewriter import SoundTouchRecentListCacheWriter
 from bosesoundtouchapi.soundtouchsources import SoundTouchSources
+from bosesoundtouchapi.soundtouchstatistics import SoundTouchStatistics
+from bosesoundtouchapi.soundtouchtimeoutpolicy import SoundTouchDeadline, SoundTouchTimeoutPolicy
+from bosesoundtouchapi.soundtouchtransport import SoundTouchTransport
 from bosesoundtouchapi.soundtouchwarning import SoundTouchWarning
 
 # all classes to import when "import *" is specified.
 __all__ = [
+    'AsyncSoundTouchClient',
+    'SoundTouchCircuitBreaker',
+    'SoundTouchCircuitBreakerStates',
     'SoundTouchClient',
+    'SoundTouchConfigurationCache',
+    'SoundTouchDeadline',
     'SoundTouchDevice',
     'SoundTouchDiscovery',
     'SoundTouchError',
+    'SoundTouchFleet',
     'SoundTouchItemTypes',
     'SoundTouchKeys',
     'SoundTouchMessage',
+    'SoundTouchNavigateCache',
     'SoundTouchNotifyCategorys',
+    'SoundTouchRecentListCacheWriter',
     'SoundTouchSources',
+    'SoundTouchStatistics',
+    'SoundTouchTimeoutPolicy',
+    'SoundTouchTransport',
     'SoundTouchWarning'
 ]
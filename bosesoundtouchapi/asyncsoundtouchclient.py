@@ -0,0 +1,1008 @@
+# external package imports.
+import asyncio
+from email.parser import BytesParser
+import functools
+from http.client import HTTPMessage
+import inspect
+import time
+
+# our package imports.
+from .bstappmessages import BSTAppMessages
+from .bstutils import export
+from .models import *
+from .soundtouchcircuitbreaker import SoundTouchCircuitBreaker
+from .soundtouchconfigurationcache import SoundTouchConfigurationCache
+from .soundtouchclient import SoundTouchClient
+from .soundtouchdevice import SoundTouchDevice
+from .soundtoucherror import SoundTouchError
+from .soundtouchstatistics import SoundTouchStatistics
+from .soundtouchtimeoutpolicy import SoundTouchDeadline
+from .soundtouchkeys import SoundTouchKeys
+from .soundtouchmessage import SoundTouchMessage
+from .soundtouchmodelrequest import SoundTouchModelRequest
+from .uri import *
+
+from .bstconst import (
+    MSG_TRACE_ACTION_KEY,
+    MSG_TRACE_DEVICE_COMMAND_WITH_PARM,
+    MSG_TRACE_SET_PROPERTY_VALUE_SIMPLE
+)
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+class _AsyncHttpConnectionPool:
+    """
+    A minimal HTTP/1.1 keep-alive connection pool for a single SoundTouch device,
+    built on top of asyncio streams.
+
+    The SoundTouch WebAPI server only speaks plain HTTP/1.1 with small xml payloads,
+    so there is no need for a full-blown http client package here.
+    """
+
+    def __init__(self, host:str, port:int, maxConnections:int=10, connectTimeout:float=30, headers:dict=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            host (str):
+                Ipv4 address of the SoundTouch device.
+            port (int):
+                Ipv4 port number the SoundTouch WebAPI is listening on.
+            maxConnections (int):
+                Maximum number of concurrent connections allowed to the device.
+            connectTimeout (float):
+                Controls how long (in seconds) a connection request is allowed to run
+                before being aborted.
+            headers (dict):
+                Headers to send with every request.
+        """
+        self._ConnectTimeout:float = float(connectTimeout)
+        self._Headers:dict = headers or {}
+        self._Host:str = host
+        self._IdleConnections:list = []
+        self._Loop:asyncio.AbstractEventLoop = None
+        self._MaxConnections:int = max(1, int(maxConnections))
+        self._Port:int = int(port)
+        self._Semaphore:asyncio.Semaphore = None
+
+
+    def _BindToRunningLoop(self) -> None:
+        """
+        Binds the pool to the currently running event loop.
+
+        Streams and semaphores are tied to the loop that created them; if the pool is
+        used from a different loop (e.g. multiple `asyncio.run` calls), then idle
+        connections from the previous loop are discarded.
+        """
+        loop = asyncio.get_running_loop()
+        if self._Loop is not loop:
+            for reader, writer in self._IdleConnections:
+                writer.transport.abort()
+            self._IdleConnections.clear()
+            self._Loop = loop
+            self._Semaphore = asyncio.Semaphore(self._MaxConnections)
+
+
+    def _BuildRequest(self, method:str, path:str, body:bytes) -> bytes:
+        """
+        Builds the raw http request bytes.
+        """
+        lines:list[str] = []
+        lines.append('%s %s HTTP/1.1' % (method, path))
+        lines.append('Host: %s:%d' % (self._Host, self._Port))
+        lines.append('Connection: keep-alive')
+        for key, value in self._Headers.items():
+            lines.append('%s: %s' % (key, value))
+        if body is not None:
+            lines.append('Content-Length: %d' % len(body))
+        elif method in ['POST', 'PUT']:
+            lines.append('Content-Length: 0')
+        request:bytes = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        if body is not None:
+            request = request + body
+        return request
+
+
+    async def _ReadResponse(self, reader:asyncio.StreamReader, method:str) -> tuple:
+        """
+        Reads an http response from the stream.
+
+        Returns:
+            A tuple of (status, headers, data, keepAlive).
+        """
+        statusLine:bytes = await reader.readline()
+        if not statusLine:
+            raise ConnectionResetError("Connection was closed by the SoundTouch device")
+        parts:list[str] = statusLine.decode('latin-1').split(None, 2)
+        version:str = parts[0]
+        status:int = int(parts[1])
+
+        # read response headers.
+        headerLines:list[bytes] = []
+        while True:
+            line:bytes = await reader.readline()
+            if line in [b'\r\n', b'\n', b'']:
+                break
+            headerLines.append(line)
+        headers:HTTPMessage = BytesParser(_class=HTTPMessage).parsebytes(b''.join(headerLines))
+        keepAlive:bool = (version == 'HTTP/1.1') and (str(headers.get('Connection', '')).lower() != 'close')
+
+        # read response body.
+        data:bytes = b''
+        if (method == 'HEAD') or (status in [204, 304]) or (100 <= status < 200):
+            pass
+        elif str(headers.get('Transfer-Encoding', '')).lower() == 'chunked':
+            chunks:list[bytes] = []
+            while True:
+                size:int = int((await reader.readline()).split(b';')[0].strip(), 16)
+                if size == 0:
+                    while (await reader.readline()) not in [b'\r\n', b'\n', b'']:
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            data = b''.join(chunks)
+        elif headers.get('Content-Length') is not None:
+            data = await reader.readexactly(int(headers.get('Content-Length')))
+        else:
+            data = await reader.read()
+            keepAlive = False
+
+        return status, headers, data, keepAlive
+
+
+    async def Close(self) -> None:
+        """
+        Closes all idle connections in the pool.
+        """
+        connections = self._IdleConnections
+        self._IdleConnections = []
+        for reader, writer in connections:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+
+    async def Request(self, method:str, path:str, body:bytes=None, connectTimeout:float=None, readTimeout:float=None) -> tuple:
+        """
+        Makes an http request to the device.
+
+        Args:
+            method (str):
+                The http method (e.g. "GET", "POST", etc).
+            path (str):
+                The request path (e.g. "/volume").
+            body (bytes):
+                The request body, or None if there is no body.
+            connectTimeout (float):
+                Amount of time (in seconds) a connection request is allowed to run, or None
+                to use the pool connect timeout.
+            readTimeout (float):
+                Amount of time (in seconds) to wait for the response, or None to wait 
+                indefinitely.
+
+        Returns:
+            A tuple of (status, headers, data).
+
+        An idle keep-alive connection is reused if one is available.  If the device has
+        closed an idle connection, then the request is retried once on a new connection.
+        """
+        self._BindToRunningLoop()
+        async with self._Semaphore:
+
+            for attempt in range(2):
+
+                isReused:bool = len(self._IdleConnections) > 0
+                if isReused:
+                    reader, writer = self._IdleConnections.pop()
+                else:
+                    reader, writer = await asyncio.wait_for(asyncio.open_connection(self._Host, self._Port), timeout=connectTimeout or self._ConnectTimeout)
+
+                try:
+                    writer.write(self._BuildRequest(method, path, body))
+                    await writer.drain()
+                    status, headers, data, keepAlive = await asyncio.wait_for(self._ReadResponse(reader, method), timeout=readTimeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if isReused and attempt == 0:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+
+                # return the connection to the pool if the device allows it.
+                if keepAlive:
+                    self._IdleConnections.append((reader, writer))
+                else:
+                    writer.close()
+                return status, headers, data
+
+
+@export
+class AsyncSoundTouchClient:
+    """
+    The AsyncSoundTouchClient provides the same method surface as the `SoundTouchClient`
+    class, where every method is an awaitable coroutine that can be driven by an asyncio
+    event loop.
+
+    Device requests are made over asyncio streams using a small keep-alive connection pool,
+    so a single event loop can drive hundreds of concurrent device requests without tying up
+    a thread per in-flight request.  The client shares the model classes, the response error
+    checking, and the `ConfigurationCache` of an underlying `SoundTouchClient` instance.
+
+    Request primitives (`MakeRequest`, `Get`, `Put`, `GetOptions`, `GetProperty`,
+    `RefreshConfiguration`, `Action`), all single-request `Get...()` configuration methods,
+    and the key / media / volume controls are implemented natively on the event loop.
+    Methods that orchestrate several device requests with delays in between (e.g. `CreateZone`,
+    `PlayUrl`, `RestoreSnapshot`, etc) are executed on a worker thread using the underlying
+    `SoundTouchClient` instance, so they do not block the event loop.
+
+    This class can also be used with an `async with` statement; idle connections are closed
+    when the block exits.
+    """
+
+    def __init__(self, device:SoundTouchDevice, raiseErrors:bool=True, maxConnections:int=10, client:SoundTouchClient=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            device (SoundTouchDevice):
+                The device to interace with.
+            raiseErrors (bool):
+                Specifies if the client should raise exceptions returned by the SoundTouch
+                device.
+                Default = True.
+            maxConnections (int):
+                Maximum number of concurrent connections allowed to the device.
+                Default is 10.
+            client (SoundTouchClient):
+                An existing `SoundTouchClient` instance to share configuration cache and
+                settings with; otherwise, None to create a new instance.
+        """
+        if (client is None) or (not isinstance(client, SoundTouchClient)):
+            client = SoundTouchClient(device, raiseErrors)
+
+        self._Client:SoundTouchClient = client
+        self._InFlightRequests:dict = {}
+        self._Pool:_AsyncHttpConnectionPool = _AsyncHttpConnectionPool(
+            device.Host,
+            device.Port,
+            maxConnections,
+            device.ConnectTimeout,
+            {'User-Agent': 'BoseSoundTouchApi/1.0.0'}
+            )
+
+
+    async def __aenter__(self) -> 'AsyncSoundTouchClient':
+        # if called via an async context manager (e.g. "async with" statement).
+        return self
+
+
+    async def __aexit__(self, etype, value, traceback) -> None:
+        # if called via an async context manager (e.g. "async with" statement).
+        await self.Close()
+
+
+    def __getitem__(self, key):
+        return self._Client[key]
+
+
+    def __setitem__(self, key, value):
+        self._Client[key] = value
+
+
+    def __iter__(self):
+        return iter(self._Client)
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def CircuitBreaker(self) -> SoundTouchCircuitBreaker:
+        """
+        The circuit breaker that tracks the health of the device; requests fail immediately
+        while the device is not responding.
+
+        This property is read-only, and returns the `CircuitBreaker` property of the device.
+        """
+        return self._Client.Device.CircuitBreaker
+
+
+    @property
+    def Client(self) -> SoundTouchClient:
+        """
+        The underlying `SoundTouchClient` instance that owns the configuration cache, and
+        executes methods that are not natively asynchronous.
+
+        This property is read-only, and is set when the class is instantiated.
+        """
+        return self._Client
+
+
+    @property
+    def ConfigurationCache(self) -> SoundTouchConfigurationCache:
+        """
+        A dictionary of cached configuration objects that have been obtained from
+        the SoundTouch device.
+
+        This is the same dictionary as the underlying `SoundTouchClient.ConfigurationCache`.
+        """
+        return self._Client.ConfigurationCache
+
+
+    @property
+    def Device(self) -> SoundTouchDevice:
+        """
+        The SoundTouchDevice object used to connect to the SoundTouch device.
+
+        This property is read-only, and is set when the class is instantiated.
+        """
+        return self._Client.Device
+
+
+    @property
+    def Statistics(self) -> SoundTouchStatistics:
+        """
+        Cache and request statistics of the client, per uri.
+
+        This is the same instance as the underlying `SoundTouchClient.Statistics`.
+        """
+        return self._Client.Statistics
+
+
+    async def _GetConfiguration(self, uri:SoundTouchUri, classType) -> object:
+        """
+        Retrieves the configuration for the given URI from the device, and returns it as an 
+        instance of the given class type (or None if the device did not return a response).
+        """
+        msg = await self.Get(uri)
+        return self._Client._GetConfigurationModel(uri, classType, msg)
+
+
+    async def Action(self, keyName:SoundTouchKeys, keyState:KeyStates=KeyStates.Both) -> None:
+        """
+        Tries to imitate a pressed key.
+
+        Args:
+            keyName (SoundTouchKeys|str):
+                The specified key to press.
+            keyState (KeyStates|str):
+                Key state to select (press, release, or both).
+        """
+        key:str = str(keyName)
+        if isinstance(keyName, SoundTouchKeys):
+            key = keyName.value
+
+        state:str = str(keyState)
+        if isinstance(keyState, KeyStates):
+            state = keyState.value
+
+        xmlRequest = f'<key state="%s" sender="Gabbo">{key}</key>'
+
+        # send press or release or both based upon state argument.
+        _logsi.LogVerbose(MSG_TRACE_ACTION_KEY % (key, state, self.Device.DeviceName))
+        if state in ['press','both']:
+            await self.Put(SoundTouchNodes.key, xmlRequest % 'press')
+        if state in ['release','both']:
+            await self.Put(SoundTouchNodes.key, xmlRequest % 'release')
+
+
+    async def Close(self) -> None:
+        """
+        Closes all idle connections to the device.
+        """
+        await self._Pool.Close()
+
+
+    def Deadline(self, seconds:float) -> SoundTouchDeadline:
+        """
+        Returns a context manager that sets an overall deadline for all device requests
+        made within it.
+
+        Args:
+            seconds (float):
+                Amount of time (in seconds) that requests made within the context are
+                allowed to take in total.
+
+        Returns:
+            A `SoundTouchDeadline` context manager, which can be used with either a `with` 
+            or an `async with` statement.
+
+        The deadline applies to the current asyncio task, and is carried over to tasks and
+        worker threads that are started within the context.
+        """
+        return SoundTouchDeadline(seconds)
+
+
+    async def Get(self, uri:SoundTouchUri) -> SoundTouchMessage:
+        """
+        Makes a GET request to retrieve a stored value.
+
+        Args:
+            uri (SoundTouchUri):
+                The node where the requested value is stored.
+
+        Returns:
+            An object storing the request uri, optional a payload that has been sent and
+            the response as an `xml.etree.ElementTree.Element`.
+
+        Raises:
+            SoundTouchError:
+                When errors should not be ignored on this client, they will raise a SoundTouchError
+                exception with all information related to that error.
+        """
+        message = SoundTouchMessage(uri)
+        if uri and uri.UriType == SoundTouchUriTypes.OP_TYPE_EVENT:
+            return message
+
+        await self.MakeRequest('GET', message)
+        return message
+
+
+    async def GetOptions(self, uri:SoundTouchUri) -> list:
+        """
+        Makes an OPTIONS request and returns the list of available HTTP-Methods.
+
+        Args:
+            uri (SoundTouchUri):
+                The node where the requested value is stored.
+
+        Returns:
+            A list of strings storing all available HTTP-Methods.
+        """
+        message = SoundTouchMessage(uri)
+        headers = await self.MakeRequest('OPTIONS', message)
+        if isinstance(headers, int):
+            return []
+        allow:str = headers.get('Allow')
+        if allow is None:
+            return []
+        return allow.split(', ')
+
+
+    async def GetProperties(self, properties:list[tuple], refresh=True, maxWorkers:int=8) -> list:
+        """
+        Returns cached properties mapped to the given URI's, refreshing them from the device
+        concurrently.
+
+        Args:
+            properties (list[tuple]):
+                A list of (uri, classType) tuples, where uri is the property key (e.g. 
+                `SoundTouchNodes.volume`, etc) and classType is the configuration class type
+                (e.g. Volume, etc).
+            refresh (bool | float):
+                True to refresh the properties with real-time information from the device;
+                otherwise, False to just return the cached values.  A maximum age (in seconds)
+                can also be specified to only refresh properties whose cached values are older
+                than that, or None to use the `ConfigurationCache` maximum age of each property.
+            maxWorkers (int):
+                Maximum number of requests to issue to the device concurrently.
+                Default is 8.
+
+        Returns:
+            A list of configuration instances of the provided classType arguments, in the
+            same order as the properties argument.
+
+        Raises:
+            SoundTouchError:
+                If any of the requests fail; the first error is raised once all requests 
+                have completed, and the cache is updated for requests that succeeded.
+
+        The requests are issued concurrently over the keep-alive connection pool, limited
+        by the maxWorkers argument and the maxConnections value of the client.
+        """
+        # determine which properties need to be refreshed (ignoring duplicates).
+        refreshList:dict = {}
+        for uri, classType in properties:
+            self._Client.ConfigurationCache.Restore(uri, classType)
+            if self._Client.ConfigurationCache.IsRefreshRequired(uri, refresh):
+                self._Client.Statistics.RecordMiss(uri)
+                refreshList[repr(uri)] = (uri, classType)
+            else:
+                self._Client.Statistics.RecordHit(uri)
+
+        # limit the number of requests that are issued concurrently.
+        semaphore:asyncio.Semaphore = asyncio.Semaphore(max(1, maxWorkers))
+        async def refreshProperty(uri:SoundTouchUri, classType) -> object:
+            async with semaphore:
+                return await self.RefreshConfiguration(uri, classType)
+
+        results:list = await asyncio.gather(*[ refreshProperty(uri, classType) for uri, classType in refreshList.values() ], return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return [ self._Client[uri] for uri, classType in properties ]
+
+
+    async def GetProperty(self, uri:SoundTouchUri, classType, refresh=True):
+        """
+        Returns a cached property mapped to the given URI.
+
+        Args:
+            uri (SoundTouchUri):
+                The property key (e.g. 'balance', 'volume', etc).
+            classType (type):
+                The configuration class type (e.g. Balance, Volume, etc).
+            refresh (bool | float):
+                True to refresh the property with real-time information from the device;
+                otherwise, False to just return the cached value.  A maximum age (in seconds)
+                can also be specified to only refresh the property if the cached value is older
+                than that, or None to use the `ConfigurationCache` maximum age for the property.
+
+        Returns:
+            A configuration instance of the provided classType argument.
+
+        This method will refresh the property from the device if the property
+        does not exist in the cache, regardless of the refresh argument value.
+        """
+        cacheDesc:str = 'cached'
+        self._Client.ConfigurationCache.Restore(uri, classType)
+        if self._Client.ConfigurationCache.IsRefreshRequired(uri, refresh):
+            self._Client.Statistics.RecordMiss(uri)
+            await self.RefreshConfiguration(uri, classType)
+            cacheDesc = 'current'
+        else:
+            self._Client.Statistics.RecordHit(uri)
+
+        if _logsi.IsOn(SILevel.Verbose):
+            _logsi.LogVerbose("AsyncSoundTouchClient configuration object (%s): '%s'" % (cacheDesc, str(self._Client[uri])))
+
+        return self._Client[uri]
+
+
+    def HasConfigurationChanged(self, uri:SoundTouchUri) -> bool:
+        """
+        Determines if the configuration for the given URI changed the last time that it
+        was refreshed from the device.
+
+        Args:
+            uri (SoundTouchUri):
+                The configuration uri key (e.g. `SoundTouchNodes.nowPlaying`, etc).
+
+        Returns:
+            True if the last refresh of the configuration returned a different response than
+            the refresh before it, or if the configuration has not been refreshed yet;
+            otherwise, False.
+
+        This method does not make a device request, and returns the 
+        `SoundTouchClient.HasConfigurationChanged` value of the wrapped client.
+        """
+        return self._Client.HasConfigurationChanged(uri)
+
+
+    async def MakeRequest(self, method:str, msg:SoundTouchMessage) -> int:
+        """
+        Performs a generic request by converting the response into the message object.
+
+        Args:
+            method (str):
+                The preferred HTTP method (e.g. "GET", "POST", etc).
+            msg (SoundTouchMessage):
+                The altered message object.
+
+        Returns:
+            The status code (integer) or the response headers.
+
+        Raises:
+            SoundTouchError:
+                If an error occurs while requesting content.
+
+        A 400 status code is immediately returned for the following scenarios:
+        - The method argument is not supplied.
+        - The msg argument is not supplied.
+        - The msg.Uri is not in the device list of supported URI's.
+        """
+        if not method or not msg:
+            return 400 # bad request
+
+        if msg.Uri not in self.Device.SupportedUris:
+            return 400
+
+        url = f'http://{self.Device.Host}:{self.Device.Port}/{msg.Uri}'
+
+        try:
+            reqbodyencoded:bytes = None
+            if msg.HasXmlMessage:
+                reqbody:str = msg.XmlMessage
+                reqbodyencoded = reqbody.encode('utf-8')
+                if _logsi.IsOn(SILevel.Verbose):
+                    _logsi.LogXml(SILevel.Verbose, "AsyncSoundTouchClient http request: '%s' (with body)" % (url), reqbody, prettyPrint=True)
+            elif _logsi.IsOn(SILevel.Verbose):
+                _logsi.LogVerbose("AsyncSoundTouchClient http request: '%s'" % (url))
+
+            # get the request timeouts for the uri, bounded by the current deadline (if any).
+            connectTimeout, readTimeout, isDeadlineBound = self._Client.Device.TimeoutPolicy.GetTimeouts(msg.Uri, self._Client.Device.DeviceName)
+
+            # fail immediately if the device is known to not be responding.
+            breaker:SoundTouchCircuitBreaker = self._Client.Device.CircuitBreaker
+            breaker.Check(self._Client.Device.DeviceName)
+
+            startTime:float = time.perf_counter()
+            try:
+                status, headers, data = await self._Pool.Request(method, '/%s' % msg.Uri, reqbodyencoded, connectTimeout, readTimeout)
+            except (OSError, EOFError, asyncio.TimeoutError) as ex:
+                # a timeout caused by the caller's deadline says nothing about the device health.
+                if isDeadlineBound:
+                    breaker.RecordIgnored()
+                else:
+                    breaker.RecordFailure(ex)
+                self._Client.Statistics.RecordError(msg.Uri, time.perf_counter() - startTime)
+                raise
+            except BaseException:
+                breaker.RecordIgnored()
+                raise
+            breaker.RecordSuccess()
+            httpTime:float = time.perf_counter() - startTime
+
+            # process the response, recording the request statistics even if the device 
+            # returned an error response.
+            parseStartTime:float = time.perf_counter()
+            try:
+                self._Client._ProcessResponse(msg, url, status, data, headers)
+            finally:
+                self._Client.Statistics.RecordRequest(msg.Uri, httpTime, time.perf_counter() - parseStartTime, len(data or b''))
+            return headers
+
+        except SoundTouchError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+
+            # format unhandled exception.
+            raise SoundTouchError(BSTAppMessages.UNHANDLED_EXCEPTION.format("AsyncSoundTouchClient.MakeRequest", str(ex)), logsi=_logsi)
+
+
+    async def MediaPreviousTrack(self, force:bool=False) -> None:
+        """
+        Move to the previous track in the current media playlist if the current track
+        has been playing for less than 10 seconds; otherwise, restart play of the current track.
+
+        Args:
+            force (bool):
+                If True, force the previous track to be played regardless of how much
+                play time has passed for the current track; otherwise, False to restart
+                the current track if more than 10 seconds have passed.
+        """
+        if force is not None and force == True:
+            await self.SetUserTrackControl(UserTrackControlTypes.PreviousForce)
+        else:
+            await self.SetUserTrackControl(UserTrackControlTypes.Previous)
+
+
+    async def Put(self, uri:SoundTouchUri, body:str, returnClassType=None) -> SoundTouchMessage:
+        """
+        Makes a POST request to apply a new value for the given node.
+
+        Args:
+            uri (SoundTouchUri):
+                The node where the requested value is stored.
+            body (SoundTouchModelRequest | str):
+                The request body xml, or a class that inherits from `SoundTouchModelRequest`
+                that implements the `ToXmlRequestBody` method.
+            returnClassType (type):
+                The configuration class type (e.g. NavigateResponse, etc) to return.
+                Default is None; do not return a class type.
+
+        Returns:
+            If the returnClassType argument is specified, then a new instance of the class
+            type is returned with the parsed message response.
+
+            Otherwise, a `SoundTouchMessage` object storing the request uri, a payload that
+            has been sent (optional), and the response as an `xml.etree.ElementTree.Element`.
+        """
+        # if body implements SoundTouchModelRequest then call it's ToXmlRequestBody()
+        # method to get the request body; otherwise, just assume it's xml already.
+        reqBody:str = body
+        if isinstance(body, SoundTouchModelRequest):
+            reqBody = body.ToXmlRequestBody()
+
+        # formulate the message, and make the request.
+        msg = SoundTouchMessage(uri, reqBody)
+        await self.MakeRequest('POST', msg)
+
+        # do we need to parse the response?  if so (and there is a response), then
+        # parse the response and return a new instance of the specified class type.
+        if returnClassType is not None:
+            if msg.Response is not None:
+                return returnClassType(root=msg.Response)
+
+        # otherwise, just return the message.
+        return msg
+
+
+    async def RefreshConfiguration(self, uri:SoundTouchUri, classType) -> object:
+        """
+        Refreshes the cached configuration for the given URI.
+
+        Args:
+            uri (SoundTouchUri):
+                The configuration uri key.
+            classType (type):
+                The configuration class type (e.g. Balance, Volume, etc) to return.
+
+        Returns:
+            A configuration instance of the provided classType argument.
+        """
+        if _logsi.IsOn(SILevel.Verbose):
+            _logsi.LogVerbose("Refreshing '%s' configuration from the SoundTouch device" % (str(uri)))
+        self._Client.Statistics.RecordRefresh(uri)
+
+        # coalesce concurrent requests for the same uri and class type into a single request;
+        # the request is shielded so that a cancelled caller does not cancel it for the others.
+        key:tuple = (str(uri), classType)
+        task:asyncio.Task = self._InFlightRequests.get(key, None)
+        if (task is None) or (task.get_loop() is not asyncio.get_running_loop()):
+            task = asyncio.ensure_future(self._GetConfiguration(uri, classType))
+            self._InFlightRequests[key] = task
+            task.add_done_callback(lambda t: self._InFlightRequests.pop(key, None) if self._InFlightRequests.get(key, None) is t else None)
+
+        config = await asyncio.shield(task)
+        self._Client._UpdateConfiguration(uri, config)
+        return self._Client[uri]
+
+
+    async def SetBassLevel(self, level:int) -> SoundTouchMessage:
+        """
+        Sets the device bass level to the given level.
+
+        Args:
+            level (int):
+                Bass level to set, usually in the range of -9 (no bass) to 0 (full bass).
+        """
+        # check if device supports this uri function; if not then we are done.
+        uriPath:str = SoundTouchNodes.bass.Path
+        if not uriPath in self.Device.SupportedUris:
+            raise SoundTouchError(BSTAppMessages.BST_DEVICE_NOT_CAPABLE_FUNCTION % (self.Device.DeviceName, uriPath), logsi=_logsi)
+
+        # device is capable - process the request.
+        _logsi.LogVerbose(MSG_TRACE_SET_PROPERTY_VALUE_SIMPLE % ("bass level", str(level), self.Device.DeviceName))
+        request:Bass = Bass(level)
+        return await self.Put(SoundTouchNodes.bass, request)
+
+
+    async def SetUserPlayControl(self, userPlayControlType:UserPlayControlTypes) -> SoundTouchMessage:
+        """
+        Sends a user play control type command to stop / pause / play / resume media content playback.
+
+        Args:
+            userPlayControlType (UserPlayControlTypes):
+                User play control type to send.
+        """
+        # validations.
+        if (userPlayControlType is None) or (not isinstance(userPlayControlType, UserPlayControlTypes)):
+            raise SoundTouchError('userPlayControlType argument was not supplied, or is not of type UserPlayControlTypes', logsi=_logsi)
+
+        # check if device supports this uri function; if not then we are done.
+        uriPath:str = SoundTouchNodes.userPlayControl.Path
+        if not uriPath in self.Device.SupportedUris:
+            raise SoundTouchError(BSTAppMessages.BST_DEVICE_NOT_CAPABLE_FUNCTION % (self.Device.DeviceName, uriPath), logsi=_logsi)
+
+        # device is capable - process the request.
+        _logsi.LogVerbose(MSG_TRACE_DEVICE_COMMAND_WITH_PARM % ("userPlayControl", userPlayControlType.value, self.Device.DeviceName))
+        userPlayControl:UserPlayControl = UserPlayControl(userPlayControlType)
+        return await self.Put(SoundTouchNodes.userPlayControl, userPlayControl)
+
+
+    async def SetUserTrackControl(self, userTrackControlType:UserTrackControlTypes, startSecond:int=None) -> SoundTouchMessage:
+        """
+        Sends a user track control type command to control track playback (next, previous,
+        repeat, shuffle, etc).
+
+        Args:
+            userTrackControlType (UserTrackControlTypes):
+                User track control type to send.
+            startSecond (int):
+                Starting position (in seconds) of where to start playing the media content.
+                Only used for `UserTrackControlTypes.SeekToTime`.
+        """
+        # validations.
+        if (userTrackControlType is None) or (not isinstance(userTrackControlType, UserTrackControlTypes)):
+            raise SoundTouchError('userTrackControlType argument was not supplied, or is not of type UserTrackControlTypes', logsi=_logsi)
+
+        # check if device supports this uri function; if not then we are done.
+        uriPath:str = SoundTouchNodes.userTrackControl.Path
+        if not uriPath in self.Device.SupportedUris:
+            raise SoundTouchError(BSTAppMessages.BST_DEVICE_NOT_CAPABLE_FUNCTION % (self.Device.DeviceName, uriPath), logsi=_logsi)
+
+        # device is capable - process the request.
+        _logsi.LogVerbose(MSG_TRACE_DEVICE_COMMAND_WITH_PARM % ("userTrackControl", userTrackControlType.value, self.Device.DeviceName))
+        userTrackControl:UserTrackControl = UserTrackControl(userTrackControlType, startSecond)
+        return await self.Put(SoundTouchNodes.userTrackControl, userTrackControl)
+
+
+    async def SetVolumeLevel(self, level:int) -> SoundTouchMessage:
+        """
+        Sets the device volume level to the given level.
+
+        Args:
+            level (int):
+                Volume level to set, in the range of 0 (mute) to 100 (full volume).
+        """
+        _logsi.LogVerbose(MSG_TRACE_SET_PROPERTY_VALUE_SIMPLE % ("volume level", str(level), self.Device.DeviceName))
+        request:Volume = Volume(level, level)
+        return await self.Put(SoundTouchNodes.volume, request)
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'AsyncSoundTouchClient:'
+        if self._Client.Device is not None:
+            msg = "%s DeviceName='%s'" % (msg, self.Device.DeviceName)
+            msg = "%s DeviceId='%s'" % (msg, self.Device.DeviceId)
+            msg = "%s Host='%s'" % (msg, self.Device.Host)
+            msg = "%s Port='%s'" % (msg, self.Device.Port)
+        return msg
+
+
+# single-request configuration methods that are implemented natively on the event loop.
+# key = method name; value = tuple of (uri, configuration class type, check device capability).
+_PROPERTY_METHODS:dict = {
+    'GetAudioDspControls': (SoundTouchNodes.audiodspcontrols, AudioDspControls, True),
+    'GetAudioProductLevelControls': (SoundTouchNodes.audioproductlevelcontrols, AudioProductLevelControls, True),
+    'GetAudioProductToneControls': (SoundTouchNodes.audioproducttonecontrols, AudioProductToneControls, True),
+    'GetAudioSpeakerAttributeAndSetting': (SoundTouchNodes.audiospeakerattributeandsetting, AudioSpeakerAttributeAndSetting, True),
+    'GetBalance': (SoundTouchNodes.balance, Balance, False),
+    'GetBass': (SoundTouchNodes.bass, Bass, False),
+    'GetBassCapabilities': (SoundTouchNodes.bassCapabilities, BassCapabilities, False),
+    'GetBlueToothInfo': (SoundTouchNodes.bluetoothInfo, BlueToothInfo, False),
+    'GetCapabilities': (SoundTouchNodes.capabilities, Capabilities, False),
+    'GetClockConfig': (SoundTouchNodes.clockDisplay, ClockConfig, False),
+    'GetClockTime': (SoundTouchNodes.clockTime, ClockTime, False),
+    'GetDspMono': (SoundTouchNodes.DSPMonoStereo, DSPMonoStereoItem, False),
+    'GetGroupStereoPairStatus': (SoundTouchNodes.getGroup, Group, True),
+    'GetInformation': (SoundTouchNodes.info, Information, True),
+    'GetLanguage': (SoundTouchNodes.language, SimpleConfig, False),
+    'GetMediaServerList': (SoundTouchNodes.listMediaServers, MediaServerList, False),
+    'GetNetworkInfo': (SoundTouchNodes.networkInfo, NetworkInfo, False),
+    'GetNetworkStatus': (SoundTouchNodes.netStats, NetworkStatus, False),
+    'GetNowPlayingStatus': (SoundTouchNodes.nowPlaying, NowPlayingStatus, False),
+    'GetPowerManagement': (SoundTouchNodes.powerManagement, PowerManagement, False),
+    'GetProductCecHdmiControl': (SoundTouchNodes.productcechdmicontrol, ProductCecHdmiControl, True),
+    'GetProductHdmiAssignmentControls': (SoundTouchNodes.producthdmiassignmentcontrols, ProductHdmiAssignmentControls, True),
+    'GetReBroadcastLatencyMode': (SoundTouchNodes.rebroadcastlatencymode, RebroadcastLatencyMode, True),
+    'GetRequestToken': (SoundTouchNodes.requestToken, SimpleConfig, False),
+    'GetServiceAvailability': (SoundTouchNodes.serviceAvailability, ServiceAvailability, True),
+    'GetSoftwareUpdateCheckInfo': (SoundTouchNodes.swUpdateCheck, SoftwareUpdateCheckResponse, True),
+    'GetSoftwareUpdateStatus': (SoundTouchNodes.swUpdateQuery, SoftwareUpdateQueryResponse, True),
+    'GetSoundTouchConfigurationStatus': (SoundTouchNodes.soundTouchConfigurationStatus, SoundTouchConfigurationStatus, True),
+    'GetSourceList': (SoundTouchNodes.sources, SourceList, False),
+    'GetSupportedUrls': (SoundTouchNodes.supportedURLs, SupportedUrls, True),
+    'GetSystemTimeout': (SoundTouchNodes.systemtimeout, SystemTimeout, False),
+    'GetTrackInfo': (SoundTouchNodes.trackInfo, TrackInfo, True),
+    'GetVolume': (SoundTouchNodes.volume, Volume, False),
+    'GetWirelessProfile': (SoundTouchNodes.getActiveWirelessProfile, WirelessProfile, False),
+    'GetWirelessSiteSurvey': (SoundTouchNodes.performWirelessSiteSurvey, PerformWirelessSiteSurveyResponse, True),
+    'GetZoneStatus': (SoundTouchNodes.getZone, Zone, False),
+}
+
+# key press methods that are implemented natively on the event loop.
+# key = method name; value = tuple of (key, key state).
+_KEY_METHODS:dict = {
+    'Mute': (SoundTouchKeys.MUTE, KeyStates.Press),
+    'Power': (SoundTouchKeys.POWER, KeyStates.Both),
+    'VolumeDown': (SoundTouchKeys.VOLUME_DOWN, KeyStates.Both),
+    'VolumeUp': (SoundTouchKeys.VOLUME_UP, KeyStates.Both),
+}
+
+# media play control methods that are implemented natively on the event loop.
+# key = method name; value = user play control type to send.
+_PLAY_CONTROL_METHODS:dict = {
+    'MediaPause': UserPlayControlTypes.Pause,
+    'MediaPlay': UserPlayControlTypes.Play,
+    'MediaPlayPause': UserPlayControlTypes.PlayPause,
+    'MediaResume': UserPlayControlTypes.Play,
+    'MediaStop': UserPlayControlTypes.Stop,
+}
+
+# media track control methods that are implemented natively on the event loop.
+# key = method name; value = user track control type to send.
+_TRACK_CONTROL_METHODS:dict = {
+    'MediaNextTrack': UserTrackControlTypes.Next,
+    'MediaRepeatAll': UserTrackControlTypes.RepeatAll,
+    'MediaRepeatOff': UserTrackControlTypes.RepeatOff,
+    'MediaRepeatOne': UserTrackControlTypes.RepeatOne,
+    'MediaShuffleOff': UserTrackControlTypes.ShuffleOff,
+    'MediaShuffleOn': UserTrackControlTypes.ShuffleOn,
+}
+
+
+def _CreatePropertyMethod(name:str, uri:SoundTouchUri, classType, isCapabilityChecked:bool):
+    """
+    Creates a native coroutine method for a single-request configuration method.
+    """
+    async def method(self:AsyncSoundTouchClient, refresh=True):
+
+        # check if device supports this uri function; if not then we are done.
+        if isCapabilityChecked:
+            if not uri.Path in self.Device.SupportedUris:
+                raise SoundTouchError(BSTAppMessages.BST_DEVICE_NOT_CAPABLE_FUNCTION % (self.Device.DeviceName, uri.Path), logsi=_logsi)
+
+        # device is capable - process the request.
+        return await self.GetProperty(uri, classType, refresh)
+
+    return method
+
+
+def _CreateKeyMethod(name:str, key:SoundTouchKeys, keyState:KeyStates):
+    """
+    Creates a native coroutine method for a key press method.
+    """
+    async def method(self:AsyncSoundTouchClient) -> None:
+        await self.Action(key, keyState)
+
+    return method
+
+
+def _CreatePlayControlMethod(name:str, userPlayControlType:UserPlayControlTypes):
+    """
+    Creates a native coroutine method for a media play control method.
+    """
+    async def method(self:AsyncSoundTouchClient) -> None:
+        await self.SetUserPlayControl(userPlayControlType)
+
+    return method
+
+
+def _CreateTrackControlMethod(name:str, userTrackControlType:UserTrackControlTypes):
+    """
+    Creates a native coroutine method for a media track control method.
+    """
+    async def method(self:AsyncSoundTouchClient) -> None:
+        await self.SetUserTrackControl(userTrackControlType)
+
+    return method
+
+
+def _CreateThreadedMethod(name:str):
+    """
+    Creates a coroutine method that executes the `SoundTouchClient` method of the same
+    name on a worker thread.
+    """
+    async def method(self:AsyncSoundTouchClient, *args, **kwargs):
+        return await asyncio.to_thread(getattr(self._Client, name), *args, **kwargs)
+
+    return method
+
+
+def _AddMethod(name:str, method) -> None:
+    """
+    Adds a generated method to the AsyncSoundTouchClient class, using the name and
+    documentation of the `SoundTouchClient` method it mirrors.
+    """
+    functools.update_wrapper(method, getattr(SoundTouchClient, name), assigned=('__name__', '__qualname__', '__doc__'))
+    method.__qualname__ = 'AsyncSoundTouchClient.%s' % name
+    method.__module__ = __name__
+    setattr(AsyncSoundTouchClient, name, method)
+
+
+# add the natively implemented table-driven methods.
+for _name, (_uri, _classType, _isCapabilityChecked) in _PROPERTY_METHODS.items():
+    _AddMethod(_name, _CreatePropertyMethod(_name, _uri, _classType, _isCapabilityChecked))
+for _name, (_key, _keyState) in _KEY_METHODS.items():
+    _AddMethod(_name, _CreateKeyMethod(_name, _key, _keyState))
+for _name, _controlType in _PLAY_CONTROL_METHODS.items():
+    _AddMethod(_name, _CreatePlayControlMethod(_name, _controlType))
+for _name, _controlType in _TRACK_CONTROL_METHODS.items():
+    _AddMethod(_name, _CreateTrackControlMethod(_name, _controlType))
+
+# add all remaining public SoundTouchClient methods as worker thread coroutines.
+for _name, _member in inspect.getmembers(SoundTouchClient, inspect.isfunction):
+    if (not _name.startswith('_')) and (not hasattr(AsyncSoundTouchClient, _name)):
+        _AddMethod(_name, _CreateThreadedMethod(_name))
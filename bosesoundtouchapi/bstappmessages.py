@@ -50,4 +50,28 @@ class BSTAppMessages:
     BST1003E - '%s': SoundTouchWebSocket eventhandler exception: %s
     """
 
-    
\ No newline at end of file
+    BST_DEVICE_DESCRIPTOR_INVALID:str = "BST1004E - SoundTouch device descriptor is not valid or is not a supported version: %s"
+    """
+    BST1004E - SoundTouch device descriptor is not valid or is not a supported version: %s
+    """
+
+    BST_DEVICE_INITIALIZE_TIMEOUT:str = "BST1005E - '%s': SoundTouch device did not complete initialization within %s seconds."
+    """
+    BST1005E - '%s': SoundTouch device did not complete initialization within %s seconds.
+    """
+
+    BST_DEVICE_CIRCUIT_OPEN:str = "BST1006E - '%s': SoundTouch device is not responding; requests are suspended for %.1f more seconds."
+    """
+    BST1006E - '%s': SoundTouch device is not responding; requests are suspended for %.1f more seconds.
+    """
+
+    BST_DEVICE_DEADLINE_EXCEEDED:str = "BST1007E - '%s': Request deadline expired before the '%s' request could be sent to the SoundTouch device."
+    """
+    BST1007E - '%s': Request deadline expired before the '%s' request could be sent to the SoundTouch device.
+    """
+
+    BST_DEVICE_CONNECTION_WAIT_TIMEOUT:str = "BST1008E - '%s': No connection to the SoundTouch device became available within %.1f seconds."
+    """
+    BST1008E - '%s': No connection to the SoundTouch device became available within %.1f seconds.
+    """
+
@@ -1,6 +1,8 @@
 # external package imports.
 from datetime import datetime
+import random
 import sys
+import threading
 from xml.etree.ElementTree import Element
 
 """
@@ -124,6 +126,137 @@ class Event:
     __len__  = getHandlerCount
 
 
+def _ExponentialBackoff(attempt:int, initialDelay:float, maxDelay:float, jitter:float=0.0) -> float:
+    """
+    Calculates an exponential backoff delay for the given attempt number.
+
+    Args:
+        attempt (int):
+            The attempt number, starting at zero for the first retry.
+        initialDelay (float):
+            Delay (in seconds) for the first retry.
+        maxDelay (float):
+            Maximum delay (in seconds) to return.
+        jitter (float):
+            Fraction of the delay (0 to 1) to randomly subtract from the delay, so that
+            retries from many clients are spread out over time.
+            Default is zero (no jitter).
+
+    Returns:
+        The delay, in seconds.
+    """
+    delay:float = min(maxDelay, initialDelay * (2 ** max(0, min(attempt, 32))))
+    if jitter > 0:
+        delay = delay - (delay * min(jitter, 1.0) * random.random())
+    return delay
+
+
+class _SingleFlightCall:
+    """
+    An in-flight call tracked by the `SingleFlight` class.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+        """
+        self.Done:threading.Event = threading.Event()
+        self.Exception:BaseException = None
+        self.Result:object = None
+        self.Waiters:int = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share the same key, so that only one call is
+    in-flight per key at any time.
+
+    The first thread to call `Do` for a key executes the function; threads that call `Do` 
+    with the same key while the function is executing wait for it to complete, and receive
+    the same result (or exception).  Once the function completes, the next call for the key
+    will execute the function again.
+
+    Coalesced callers receive the same result instance; a caller that modifies the result
+    should modify a copy of it instead.
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self, waitTimeout=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            waitTimeout (Callable[[], float]):
+                Function that returns the maximum amount of time (in seconds) that the calling
+                thread may wait for an in-flight call, or None to wait until the call completes
+                (e.g. `SoundTouchDeadline.GetRemaining`).  
+                Default is None (wait until the call completes).
+        """
+        self._Calls:dict = {}
+        self._Lock:threading.Lock = threading.Lock()
+        self._WaitTimeout = waitTimeout
+
+
+    def Do(self, key, fn, *args, **kwargs):
+        """
+        Executes the given function, unless a call with the same key is already in-flight;
+        in that case, waits for the in-flight call to complete and returns its result.
+
+        Args:
+            key (object):
+                Hashable key that identifies the call.
+            fn (Callable):
+                Function to execute.
+            *args, **kwargs:
+                Arguments to pass to the function.
+
+        Returns:
+            The function result.
+
+        Raises:
+            TimeoutError:
+                If the wait timeout of the calling thread expired while waiting for an 
+                in-flight call to complete.
+            Exception:
+                The exception raised by the function, if any.
+        """
+        with self._Lock:
+            call:_SingleFlightCall = self._Calls.get(key, None)
+            if call is not None:
+                call.Waiters += 1
+                isLeader:bool = False
+            else:
+                call = _SingleFlightCall()
+                self._Calls[key] = call
+                isLeader:bool = True
+
+        # if another thread is executing the call, then wait for it to complete.
+        if not isLeader:
+            timeout:float = None
+            if self._WaitTimeout is not None:
+                timeout = self._WaitTimeout()
+                if timeout is not None:
+                    timeout = max(timeout, 0)
+            if not call.Done.wait(timeout):
+                raise TimeoutError("Timed out after %.1f seconds waiting for an in-flight call to complete." % (timeout))
+            if call.Exception is not None:
+                raise call.Exception
+            return call.Result
+
+        try:
+            call.Result = fn(*args, **kwargs)
+            return call.Result
+        except BaseException as ex:
+            call.Exception = ex
+            raise
+        finally:
+            with self._Lock:
+                self._Calls.pop(key, None)
+            call.Done.set()
+
+
 def _xmlFind(root:Element, tag:str, default=None, defaultNoText=None) -> str:
     """
     Finds the specified xml node tag in the Element object, and returns it's inner text value.
@@ -1,4 +1,6 @@
 # external package imports.
+from collections import OrderedDict
+import copy
 import time
 from typing import Iterator
 from xml.etree.ElementTree import Element, tostring
@@ -18,6 +20,12 @@ class RecentList:
     The list of `Recent` objects are sorted by `CreatedOn` in descending
     order so that the last entry added to the recents list is the first 
     to appear in the list.
+
+    Items are stored in an ordered dictionary keyed by item identity, with a hash index keyed
+    by the item source and name next to it; this allows items to be found (`GetItemByName`), 
+    moved to the top of the list (`MoveToFront`), removed (`Remove`) and trimmed (`Trim`) in 
+    constant time, regardless of the number of items in the list.  The `Recents` list is
+    built from the items when it is accessed.
     """
 
     def __init__(self, root:Element=None) -> None:
@@ -29,8 +37,14 @@ class RecentList:
                 xmltree Element item to load arguments from.  
                 If specified, then other passed arguments are ignored.
         """
+        self._Index:dict = {}
+        self._IndexStale:bool = False
+        self._Items:OrderedDict = OrderedDict()
+        self._KeyCounts:dict = {}
+        self._Keys:dict = {}
         self._LastUpdatedOn:int = 0
-        self._Recents:list[Recent] = []
+        self._View:list = None
+        self._ViewExposed:bool = False
         
         if (root is None):
 
@@ -38,17 +52,19 @@ class RecentList:
 
         else:
 
+            recents:list[Recent] = []
             for recent in root.findall('recent'):
                 
                 config:Recent = Recent(root=recent)
-                self._Recents.append(config)
+                recents.append(config)
                 
                 if config.CreatedOn is not None and config.CreatedOn > self._LastUpdatedOn:
                     self._LastUpdatedOn = config.CreatedOn
                 
             # sort items on CreatedOn property, descending order (latest first).
-            if len(self._Recents) > 0:
-                self._Recents.sort(key=lambda x: (x.CreatedOn or 0), reverse=True)
+            if len(recents) > 0:
+                recents.sort(key=lambda x: (x.CreatedOn or 0), reverse=True)
+            self._Load(recents)
                 
         # if LastUpdatedOn not set, then use current epoch time.
         if (self._LastUpdatedOn is None) or (self._LastUpdatedOn == 0):
@@ -56,16 +72,27 @@ class RecentList:
             self._LastUpdatedOn = epoch_time
 
 
+    def __deepcopy__(self, memo:dict) -> 'RecentList':
+        # items are keyed by identity, so the copy is re-keyed with the copied items.
+        result:RecentList = RecentList()
+        memo[id(self)] = result
+        result._LastUpdatedOn = self._LastUpdatedOn
+        result._Load([copy.deepcopy(item, memo) for item in self._GetView()])
+        return result
+
+
     def __getitem__(self, key) -> Recent:
-        return self._Recents[key]
+        return self._GetView()[key]
 
 
     def __iter__(self) -> Iterator:
-        return iter(self._Recents)
+        return iter(self._GetView())
 
 
     def __len__(self) -> int:
-        return len(self._Recents)
+        if self._ViewExposed:
+            return len(self._View)
+        return len(self._Items)
 
 
     def __repr__(self) -> str:
@@ -101,8 +128,126 @@ class RecentList:
     def Recents(self) -> list[Recent]:
         """ 
         The list of `Recent` items. 
+
+        The list is built from the items when it is first accessed after a change.  Changes
+        made to the returned list (e.g. sorting it, or adding / removing items) are applied 
+        to the recent list, until the recent list is changed by one of its methods (e.g.
+        `MoveToFront`); get the list again after that to make further changes.
+        """
+        self._GetView()
+        self._ViewExposed = True
+        return self._View
+
+
+    def _AddKey(self, recent:Recent, key:tuple) -> None:
+        """
+        Indexes an item under the given source and name key.
+        """
+        self._Keys[id(recent)] = key
+        self._KeyCounts[key] = self._KeyCounts.get(key, 0) + 1
+
+
+    def _BuildIndex(self) -> None:
+        """
+        Rebuilds the source and name index from the current item `Source` and `Name` values.
+        """
+        self._Index = {}
+        self._KeyCounts = {}
+        self._Keys = {}
+        item:Recent
+        for item in self._Items.values():
+            key:tuple = (item.Source, item.Name)
+            self._Index.setdefault(key, item)
+            self._AddKey(item, key)
+        self._IndexStale = False
+
+
+    def _GetView(self) -> list[Recent]:
+        """
+        Returns the list of items (most recent first), building it if necessary.
+        """
+        if self._View is None:
+            self._View = list(self._Items.values())
+        return self._View
+
+
+    def _Load(self, recents:list) -> None:
+        """
+        Replaces the items with the given list of items (most recent first), and rebuilds
+        the index.
+        """
+        self._Items = OrderedDict()
+        item:Recent
+        for item in recents:
+            self._Items.setdefault(id(item), item)
+        self._BuildIndex()
+
+
+    def _RemoveKey(self, recent:Recent) -> None:
+        """
+        Removes an item from the source and name index.
+        """
+        key:tuple = self._Keys.pop(id(recent))
+        count:int = self._KeyCounts[key] - 1
+        if count > 0:
+            self._KeyCounts[key] = count
+        else:
+            del self._KeyCounts[key]
+        if self._Index.get(key, None) is recent:
+            del self._Index[key]
+            # another (older) item has the same source and name; it is found when the 
+            # index is rebuilt.
+            if count > 0:
+                self._IndexStale = True
+
+
+    def _Sync(self, isChanging:bool=False) -> None:
+        """
+        Applies changes made to the list returned by the `Recents` property to the items.
+
+        Args:
+            isChanging (bool):
+                True if the items are about to be changed; the list returned by the `Recents`
+                property is then detached from the items.
+        """
+        if self._ViewExposed:
+            self._Load(self._View)
+            if isChanging:
+                self._ViewExposed = False
+        if isChanging:
+            self._View = None
+        if self._IndexStale:
+            self._BuildIndex()
+
+
+    def AddToFront(self, recent:Recent) -> None:
+        """
+        Adds an item to the top of the list, or moves it to the top of the list if the 
+        item is already in the list.
+
+        Args:
+            recent (Recent):
+                The item to add; its `Source` and `Name` values should be set before it is
+                added, as they are used to index the item.
+        """
+        self.MoveToFront(recent)
+
+
+    def GetItemByName(self, source:str, name:str) -> Recent:
+        """
+        Returns the most recent list item matching the source and name value.
+        
+        Args:
+            source (str):
+                Source to find in the list.
+            name (str):
+                Name to find in the list.
+                
+        Returns:
+            The `Recent` item if found; otherwise, None.
         """
-        return self._Recents
+        self._Sync()
+        return self._Index.get((source, name), None)
 
 
     def IndexOfName(self, source:str, name:str) -> Recent:
@@ -117,16 +262,99 @@ class RecentList:
                 
         Returns:
             The index of the item if found; otherwise, -1.
+
+        Determining the position of an item takes linear time; use the `GetItemByName` 
+        method to find an item without determining its position.
         """
-        item:Recent
-        for idx, item in enumerate(self._Recents):
-            if source == item.Source and item.Name == name:
-                return idx
+        recent:Recent = self.GetItemByName(source, name)
+        if recent is not None:
+            for idx, item in enumerate(self._GetView()):
+                if item is recent:
+                    return idx
             
         # if not found then return -1.
         return -1
 
 
+    def MoveToFront(self, recent:Recent) -> None:
+        """
+        Moves an item to the top of the list, or adds it to the top of the list if the 
+        item is not in the list.
+
+        Args:
+            recent (Recent):
+                The item to move; the item is re-indexed with its current `Source` and 
+                `Name` values.
+        """
+        self._Sync(True)
+
+        key:tuple = (recent.Source, recent.Name)
+        itemId:int = id(recent)
+        if itemId in self._Items:
+            if self._Keys[itemId] == key:
+                self._Items.move_to_end(itemId, last=False)
+                self._Index[key] = recent
+                return
+            self._RemoveKey(recent)
+        else:
+            self._Items[itemId] = recent
+        self._Items.move_to_end(itemId, last=False)
+        self._AddKey(recent, key)
+        self._Index[key] = recent
+
+
+    def RebuildIndex(self) -> None:
+        """
+        Rebuilds the source and name index of the list items.
+
+        This is only necessary if the `Source` or `Name` value of an item in the list was
+        changed without calling the `MoveToFront` method.
+        """
+        self._Sync()
+        self._BuildIndex()
+
+
+    def Remove(self, recent:Recent) -> bool:
+        """
+        Removes an item from the list.
+
+        Args:
+            recent (Recent):
+                The item to remove.
+
+        Returns:
+            True if the item was removed; otherwise, False if the item was not in the list.
+        """
+        self._Sync(True)
+        if self._Items.pop(id(recent), None) is None:
+            return False
+        self._RemoveKey(recent)
+        return True
+
+
+    def Trim(self, maxItems:int) -> list[Recent]:
+        """
+        Removes the oldest items from the list, until the list contains no more than the
+        given number of items.
+
+        Args:
+            maxItems (int):
+                Maximum number of items to keep in the list.
+
+        Returns:
+            A list of the items that were removed, oldest item last.
+        """
+        removed:list[Recent] = []
+        if len(self) <= max(0, maxItems):
+            return removed
+        self._Sync(True)
+        while len(self._Items) > max(0, maxItems):
+            recent:Recent = self._Items.popitem(last=True)[1]
+            self._RemoveKey(recent)
+            removed.append(recent)
+        return removed
+
+
     def ToDictionary(self, encoding:str='utf-8') -> dict:
         """
         Returns a dictionary representation of the class.
@@ -143,7 +371,7 @@ class RecentList:
         
         if self._LastUpdatedOn is not None: 
             result['LastUpdatedOn'] = self._LastUpdatedOn
-        result['Recents'] = [ item.ToDictionary(encoding) for item in self._Recents ]
+        result['Recents'] = [ item.ToDictionary(encoding) for item in self._GetView() ]
 
         return result
 
@@ -160,7 +388,7 @@ class RecentList:
         elm = Element('recents')
         
         item:Recent
-        for item in self._Recents:
+        for item in self._GetView():
             elm.append(item.ToElement())
         return elm
 
@@ -176,11 +404,11 @@ class RecentList:
         """
         msg:str = 'RecentList:'
         msg = '%s LastUpdatedOn="%s"' % (msg, str(self._LastUpdatedOn))
-        msg = "%s (%d items)" % (msg, len(self._Recents))
+        msg = "%s (%d items)" % (msg, len(self))
         
         if includeItems == True:
             item:Recent
-            for item in self._Recents:
+            for item in self._GetView():
                 msg = "%s\n- %s" % (msg, item.ToString())
             
         return msg
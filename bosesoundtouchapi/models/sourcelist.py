@@ -13,6 +13,9 @@ class SourceList:
        
     This class contains the attributes and sub-items that represent the
     sources configuration of the device.
+
+    Source titles are resolved with a hash index over the source items, which is built
+    the first time that it is needed, and rebuilt only when the `SourceItems` list changes.
     """
 
     def __init__(self, root:Element=None) -> None:
@@ -25,7 +28,10 @@ class SourceList:
                 If specified, then other passed arguments are ignored.
         """
         self._DeviceId:str = None
+        self._IndexSignature:tuple = None
+        self._ItemsByTitle:dict = None
         self._SourceItems:list[SourceItem] = []
+        self._TitlesBySource:dict = None
         
         if (root is None):
             
@@ -55,6 +61,7 @@ class SourceList:
             for item in self._SourceItems:
                 if item.Source == key:
                     return item
+            return None
         else:
             return self._SourceItems[key]
 
@@ -85,10 +92,39 @@ class SourceList:
     def SourceItems(self) -> list[SourceItem]:
         """ 
         The list of `SourceItem` items. 
+
+        The source title index is rebuilt when items are added to or removed from the list.
         """
         return self._SourceItems
 
 
+    def _BuildIndex(self) -> None:
+        """
+        Builds the source title indexes, if the `SourceItems` list changed since they were
+        last built.
+        """
+        signature:tuple = (id(self._SourceItems), len(self._SourceItems))
+        if (self._TitlesBySource is not None) and (self._IndexSignature == signature):
+            return
+
+        # entries are only added for the first matching item, so that lookups return the
+        # same item as a linear scan of the list would.
+        itemsByTitle:dict = {}
+        titlesBySource:dict = {}
+        item:SourceItem
+        for item in self._SourceItems:
+            titlesBySource.setdefault((item.Source, item.SourceAccount), item.SourceTitle)
+            # source list will never contain a 'sourceAccount=""' (empty string) value; 
+            # the sourceAccount attribute will not be specified in this case (e.g. TUNEIN, BLUETOOTH, etc).
+            if item.SourceAccount is None:
+                titlesBySource.setdefault((item.Source, ''), item.SourceTitle)
+            itemsByTitle.setdefault(item.SourceTitle, item)
+
+        self._ItemsByTitle = itemsByTitle
+        self._TitlesBySource = titlesBySource
+        self._IndexSignature = signature
+
+
     def GetSourceItemByTitle(self, title:str) -> SourceItem:
         """
         Returns a `SourceItem` instance for the given source title value.
@@ -101,11 +137,8 @@ class SourceList:
         Returns:
             A `SourceItem` if the title argument value was found; otherwise, None.
         """
-        item:SourceItem
-        for item in self._SourceItems:
-            if title == item.SourceTitle:
-                return item
-        return None
+        self._BuildIndex()
+        return self._ItemsByTitle.get(title, None)
         
 
     def GetTitleBySource(self, source:str, sourceAccount:str=None) -> str:
@@ -135,18 +168,39 @@ class SourceList:
         
         # source list will never contain a 'sourceAccount=""' (empty string) value; 
         # the sourceAccount attribute will not be specified in this case (e.g. TUNEIN, BLUETOOTH, etc).
-        # Sometimes a NowPlaying event will generate a 'sourceAccount=""' value for a source.
-        item:SourceItem
-        for item in self._SourceItems:
-            if source == item.Source:
-                itemSourceAccount:str = item.SourceAccount
-                if (itemSourceAccount == sourceAccount):
-                    return item.SourceTitle
-                elif (itemSourceAccount is None) and (sourceAccount == ''):
-                    return item.SourceTitle
+        # Sometimes a NowPlaying event will generate a 'sourceAccount=""' value for a source;
+        # the index contains an entry for the empty string value in this case.
+        self._BuildIndex()
+        title:str = self._TitlesBySource.get((source, sourceAccount), None)
+        if title is not None:
+            return title
                 
         # if we can't resolve the title, then just display the raw source information.
         return "%s:%s" % (source, sourceAccount or '')
+
+
+    def ResolveSourceTitles(self, items) -> int:
+        """
+        Sets the `SourceTitle` property value of all given items.
+        
+        Args:
+            items (Iterable):
+                The items to resolve source titles for (e.g. a `PresetList`, `RecentList`,
+                list of `Recent` items, etc); each item must have `Source`, `SourceAccount`
+                and `SourceTitle` properties.
+                
+        Returns:
+            The number of items that were resolved.
+
+        The source title index is built once for all items, so that resolving titles for a 
+        large list takes linear time.
+        """
+        self._BuildIndex()
+        count:int = 0
+        for item in items:
+            item.SourceTitle = self.GetTitleBySource(item.Source, item.SourceAccount)
+            count += 1
+        return count
         
 
     def ToDictionary(self, encoding:str='utf-8') -> dict:
@@ -0,0 +1,341 @@
+# external package imports.
+import threading
+import time
+
+# our package imports.
+from .bstappmessages import BSTAppMessages
+from .bstutils import export, _ExponentialBackoff
+from .soundtouchcircuitbreakerstates import SoundTouchCircuitBreakerStates
+from .soundtoucherror import SoundTouchError
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+@export
+class SoundTouchCircuitBreaker:
+    """
+    Tracks the health of a SoundTouch device, and fails requests immediately while the
+    device is not responding.
+
+    The circuit breaker starts in the `Closed` state, where requests are sent to the device.
+    Once `FailureThreshold` consecutive requests fail to reach the device (e.g. connection
+    refused, connect timeout, etc), the breaker moves to the `Open` state; requests will then
+    fail immediately with a `SoundTouchError`, without contacting the device.  Once the retry
+    delay expires, the breaker moves to the `HalfOpen` state and allows a single probe request
+    through to the device: if it succeeds the breaker is closed again, otherwise it is re-opened
+    with an exponentially increasing retry delay (from `RetryDelay` up to `MaxRetryDelay`).
+
+    Only failures to communicate with the device are counted; error responses returned by the
+    device itself (e.g. an invalid request) indicate a healthy device.
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self, failureThreshold:int=3, retryDelay:float=5, maxRetryDelay:float=300, isEnabled:bool=True) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            failureThreshold (int):
+                Number of consecutive failed requests that will open the circuit.
+                Default is 3.
+            retryDelay (float):
+                Amount of time (in seconds) to wait before probing the device the first time
+                after the circuit is opened.
+                Default is 5 seconds.
+            maxRetryDelay (float):
+                Maximum amount of time (in seconds) to wait between probes; the delay doubles
+                after each failed probe, up to this value.
+                Default is 300 seconds.
+            isEnabled (bool):
+                True if the circuit breaker is enabled; otherwise, False to always send
+                requests to the device.
+                Default is True.
+        """
+        # validations.
+        if (failureThreshold is None) or (failureThreshold < 1):
+            failureThreshold = 1
+        if (retryDelay is None) or (retryDelay <= 0):
+            retryDelay = 5
+        if (maxRetryDelay is None) or (maxRetryDelay < retryDelay):
+            maxRetryDelay = retryDelay
+
+        # initialize instance properties.
+        self._FailureCount:int = 0
+        self._FailureThreshold:int = int(failureThreshold)
+        self._IsEnabled:bool = bool(isEnabled)
+        self._IsProbeInProgress:bool = False
+        self._LastError:str = None
+        self._Lock:threading.Lock = threading.Lock()
+        self._MaxRetryDelay:float = float(maxRetryDelay)
+        self._OpenCount:int = 0
+        self._RetryAt:float = 0
+        self._RetryDelay:float = float(retryDelay)
+        self._State:SoundTouchCircuitBreakerStates = SoundTouchCircuitBreakerStates.Closed
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def FailureCount(self) -> int:
+        """
+        Number of consecutive requests that failed to reach the device.
+        """
+        return self._FailureCount
+
+
+    @property
+    def FailureThreshold(self) -> int:
+        """
+        Number of consecutive failed requests that will open the circuit.
+        """
+        return self._FailureThreshold
+
+    @FailureThreshold.setter
+    def FailureThreshold(self, value:int):
+        """
+        Sets the FailureThreshold property value.
+        """
+        if isinstance(value, int) and value > 0:
+            self._FailureThreshold = value
+
+
+    @property
+    def IsEnabled(self) -> bool:
+        """
+        True if the circuit breaker is enabled; otherwise, False to always send requests
+        to the device.
+        """
+        return self._IsEnabled
+
+    @IsEnabled.setter
+    def IsEnabled(self, value:bool):
+        """
+        Sets the IsEnabled property value.
+        """
+        if isinstance(value, bool):
+            self._IsEnabled = value
+            if not value:
+                self.Reset()
+
+
+    @property
+    def LastError(self) -> str:
+        """
+        Description of the last failure to reach the device, or None if there was none.
+        """
+        return self._LastError
+
+
+    @property
+    def MaxRetryDelay(self) -> float:
+        """
+        Maximum amount of time (in seconds) to wait between probes.
+        """
+        return self._MaxRetryDelay
+
+    @MaxRetryDelay.setter
+    def MaxRetryDelay(self, value:float):
+        """
+        Sets the MaxRetryDelay property value.
+        """
+        if isinstance(value, (int, float)) and value > 0:
+            self._MaxRetryDelay = float(value)
+
+
+    @property
+    def RetryDelay(self) -> float:
+        """
+        Amount of time (in seconds) to wait before probing the device the first time
+        after the circuit is opened.
+        """
+        return self._RetryDelay
+
+    @RetryDelay.setter
+    def RetryDelay(self, value:float):
+        """
+        Sets the RetryDelay property value.
+        """
+        if isinstance(value, (int, float)) and value > 0:
+            self._RetryDelay = float(value)
+
+
+    @property
+    def RetryInSeconds(self) -> float:
+        """
+        Amount of time (in seconds) until the next probe request is allowed, or zero if
+        requests are currently allowed.
+        """
+        if self._State != SoundTouchCircuitBreakerStates.Open:
+            return 0
+        return max(0, self._RetryAt - time.monotonic())
+
+
+    @property
+    def State(self) -> SoundTouchCircuitBreakerStates:
+        """
+        Current state of the circuit breaker.
+        """
+        return self._State
+
+
+    def AllowRequest(self) -> bool:
+        """
+        Determines if a request can be sent to the device.
+
+        Returns:
+            True if the request can be sent to the device; otherwise, False if the request
+            should fail immediately.
+
+        If True is returned, then the caller must report the outcome of the request with the
+        `RecordSuccess`, `RecordFailure` or `RecordIgnored` method.
+        """
+        if not self._IsEnabled:
+            return True
+
+        with self._Lock:
+
+            if self._State == SoundTouchCircuitBreakerStates.Closed:
+                return True
+
+            if self._State == SoundTouchCircuitBreakerStates.Open:
+                if time.monotonic() < self._RetryAt:
+                    return False
+                self._State = SoundTouchCircuitBreakerStates.HalfOpen
+                _logsi.LogVerbose("SoundTouchCircuitBreaker state changed to %s; probing device." % (self._State.value))
+
+            # half-open - only one probe request is allowed at a time.
+            if self._IsProbeInProgress:
+                return False
+            self._IsProbeInProgress = True
+            return True
+
+
+    def Check(self, deviceName:str) -> None:
+        """
+        Raises an exception if a request cannot be sent to the device.
+
+        Args:
+            deviceName (str):
+                Device name (or host) to include in the exception message.
+
+        Raises:
+            SoundTouchError:
+                SoundTouch device is not responding; requests are suspended.
+
+        If no exception is raised, then the caller must report the outcome of the request
+        with the `RecordSuccess`, `RecordFailure` or `RecordIgnored` method.
+        """
+        if not self.AllowRequest():
+            raise SoundTouchError(BSTAppMessages.BST_DEVICE_CIRCUIT_OPEN % (deviceName, self.RetryInSeconds), logsi=_logsi)
+
+
+    def RecordFailure(self, ex:Exception=None) -> None:
+        """
+        Reports that a request failed to reach the device.
+
+        Args:
+            ex (Exception):
+                The exception that describes the failure, if any.
+        """
+        if not self._IsEnabled:
+            return
+
+        with self._Lock:
+
+            self._FailureCount += 1
+            self._LastError = str(ex) if ex is not None else None
+            wasProbe:bool = self._IsProbeInProgress
+            self._IsProbeInProgress = False
+
+            if (self._State == SoundTouchCircuitBreakerStates.HalfOpen) or (wasProbe) or \
+               (self._State == SoundTouchCircuitBreakerStates.Closed and self._FailureCount >= self._FailureThreshold):
+
+                # open the circuit, increasing the retry delay each time a probe fails.
+                delay:float = _ExponentialBackoff(self._OpenCount, self._RetryDelay, self._MaxRetryDelay, 0.1)
+                self._OpenCount += 1
+                self._RetryAt = time.monotonic() + delay
+                self._State = SoundTouchCircuitBreakerStates.Open
+                _logsi.LogWarning("SoundTouchCircuitBreaker state changed to %s after %d failures; retry in %.1f seconds: %s" % (self._State.value, self._FailureCount, delay, self._LastError))
+
+
+    def RecordIgnored(self) -> None:
+        """
+        Reports that a request completed with an outcome that does not indicate whether the
+        device is healthy or not (e.g. the request was cancelled).
+        """
+        with self._Lock:
+            self._IsProbeInProgress = False
+
+
+    def RecordSuccess(self) -> None:
+        """
+        Reports that a request reached the device.
+        """
+        if (self._State == SoundTouchCircuitBreakerStates.Closed) and (self._FailureCount == 0):
+            return
+
+        with self._Lock:
+            if self._State != SoundTouchCircuitBreakerStates.Closed:
+                _logsi.LogMessage("SoundTouchCircuitBreaker state changed to %s; device is responding." % (SoundTouchCircuitBreakerStates.Closed.value))
+            self._FailureCount = 0
+            self._IsProbeInProgress = False
+            self._OpenCount = 0
+            self._RetryAt = 0
+            self._State = SoundTouchCircuitBreakerStates.Closed
+
+
+    def Reset(self) -> None:
+        """
+        Closes the circuit, and clears all failure information.
+        """
+        with self._Lock:
+            self._FailureCount = 0
+            self._IsProbeInProgress = False
+            self._LastError = None
+            self._OpenCount = 0
+            self._RetryAt = 0
+            self._State = SoundTouchCircuitBreakerStates.Closed
+
+
+    def ToDictionary(self) -> dict:
+        """
+        Returns a dictionary representation of the class.
+        """
+        result:dict = \
+        {
+            'state': self._State.value,
+            'failure_count': self._FailureCount,
+            'failure_threshold': self._FailureThreshold,
+            'is_enabled': self._IsEnabled,
+            'last_error': self._LastError,
+            'max_retry_delay': self._MaxRetryDelay,
+            'retry_delay': self._RetryDelay,
+            'retry_in_seconds': self.RetryInSeconds,
+        }
+        return result
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SoundTouchCircuitBreaker:'
+        msg = '%s State="%s"' % (msg, self._State.value)
+        msg = '%s FailureCount=%d' % (msg, self._FailureCount)
+        if self._State == SoundTouchCircuitBreakerStates.Open:
+            msg = '%s RetryInSeconds=%.1f' % (msg, self.RetryInSeconds)
+        return msg
@@ -0,0 +1,28 @@
+# external package imports.
+from enum import Enum
+
+# our package imports.
+from .bstutils import export
+
+@export
+class SoundTouchCircuitBreakerStates(Enum):
+    """
+    Circuit Breaker States enumeration.
+    """
+    
+    Closed = "CLOSED"
+    """
+    Device is healthy; requests are sent to the device.
+    """
+
+    HalfOpen = "HALF_OPEN"
+    """
+    Device was not responding, and a single probe request is allowed to test if the
+    device is responding again; other requests fail immediately.
+    """
+
+    Open = "OPEN"
+    """
+    Device is not responding; requests fail immediately without contacting the device
+    until the retry delay expires.
+    """
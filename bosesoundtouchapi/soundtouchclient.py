@@ -1,6 +1,10 @@
 # external package imports.
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import copy
 from datetime import datetime
 from functools import reduce
+import hashlib
 from io import BytesIO
 import os
 import platformdirs
@@ -9,6 +13,7 @@ import time
 from tinytag import TinyTag
 import urllib.parse
 from urllib3 import PoolManager, Timeout
+from urllib3.exceptions import HTTPError
 from xml.etree.ElementTree import fromstring, Element
 from xml.etree import ElementTree
 
@@ -16,11 +21,18 @@ from xml.etree import ElementTree
 from .bstappmessages import BSTAppMessages
 from .bstutils import export
 from .models import *
+from .soundtouchcircuitbreaker import SoundTouchCircuitBreaker
+from .soundtouchconfigurationcache import SoundTouchConfigurationCache
 from .soundtouchdevice import SoundTouchDevice
 from .soundtoucherror import SoundTouchError
+from .soundtouchstatistics import SoundTouchStatistics
+from .soundtouchtimeoutpolicy import SoundTouchDeadline, SoundTouchTimeoutPolicy
+from .soundtouchtransport import SoundTouchTransport
 from .soundtouchkeys import SoundTouchKeys
 from .soundtouchmessage import SoundTouchMessage
 from .soundtouchmodelrequest import SoundTouchModelRequest
+from .soundtouchnavigatecache import SoundTouchNavigateCache
+from .soundtouchrecentlistcachewriter import SoundTouchRecentListCacheWriter
 from .soundtouchsources import SoundTouchSources
 from .uri import *
 
@@ -52,8 +64,10 @@ class SoundTouchClient:
     This client communicates with a Bose device on port 8090 by default (the
     standard WebAPI port), but the port number can be changed.
 
-    The client uses an urllib3.PoolManager instance to delegate the HTTP-requests.
-    Set a custom manager with the manage_traffic() method.
+    The client uses a SoundTouchTransport instance to delegate the HTTP-requests; by
+    default, this is the same shared transport that is used by the device, so that
+    keep-alive connections are pooled and capped across all devices and clients in the
+    process.  Set a custom manager with the `Manager` property.
 
     Like the BoseWebSocket, this client can be used in two ways: 1. create a
     client manually or 2. use the client within a _with_ statement. Additionally,
@@ -61,7 +75,8 @@ class SoundTouchClient:
     can be accessed by typing: `config = client[<config_name>]`
     """
 
-    def __init__(self, device:SoundTouchDevice, raiseErrors:bool=True, manager:PoolManager=None) -> None:
+    def __init__(self, device:SoundTouchDevice, raiseErrors:bool=True, manager:PoolManager=None,
+                 transport:SoundTouchTransport=None) -> None:
         """
         Initializes a new instance of the class.
         
@@ -75,35 +90,42 @@ class SoundTouchClient:
                 response object in a SoundTouchMessage).
                 Default = 'raise'.
             manager (urllib3.PoolManager):
-                The manager for HTTP requests to the device.
-        """
-        self._ConfigurationCache:dict = {}
+                A custom manager for HTTP requests to the device.
+                Default is None, which uses the transport argument value.
+            transport (SoundTouchTransport):
+                The shared transport for HTTP requests to the device.
+                Default is None, which uses the same transport as the device.  
+                Ignored if the manager argument is specified.
+        """
+        self._ConfigurationCache:SoundTouchConfigurationCache = SoundTouchConfigurationCache()
+        self._ConfigurationChanged:dict = {}
+        self._ConfigurationDigests:dict = {}
         self._Device:SoundTouchDevice = device
-        self._Manager:PoolManager = manager
+        self._NavigateCache:SoundTouchNavigateCache = SoundTouchNavigateCache()
         self._RaiseErrors:bool = bool(raiseErrors)
         self._RecentListCache:RecentList = RecentList()
         self._RecentListCacheEnabled:bool = False
         self._RecentListCacheMaxItems:int = 100
         self._RecentListCachePath:str = None
+        self._RecentListCacheWriter:SoundTouchRecentListCacheWriter = None
         self._SnapshotSettings:dict = {}
-        
-        # if pool manager instance is none or not a PoolManager instance, then create one.
-        # we increase the maximum number of connections to keep in the pool (maxsize=) to avoid the following warnings:
-        # "WARNING:urllib3.connectionpool:Connection pool is full, discarding connection: x.x.x.x. Connection pool size: 1"
-        if (manager is None) or (not isinstance(manager,PoolManager)):
-
-            # create new pool manager with specified timeouts and limits.
-            timeout = Timeout(connect=float(device.ConnectTimeout), read=None)
-            self._Manager = PoolManager(headers={'User-Agent': 'BoseSoundTouchApi/1.0.0'},
-                                        timeout=timeout,
-                                        num_pools=10,   # number of connection pools to allocate.
-                                        maxsize=30,     # maximum number of connections to keep in the pool.
-                                        block=True      # limit number of connections to the device.
-                                        )
+        self._Statistics:SoundTouchStatistics = SoundTouchStatistics()
+        self._Transport:SoundTouchTransport = None
+        
+        # if a custom pool manager was specified, then it gets a transport of its own (without 
+        # connection caps) so that its settings are honored; otherwise, borrow connections
+        # from the shared transport that is also used by the device.
+        if (manager is not None) and (isinstance(manager,PoolManager)):
+            self.Manager = manager
+        else:
+            self._Transport = transport or device.Transport or SoundTouchTransport.GetDefault()
         
         # cache configurations that we have already obtained.
         self._ConfigurationCache[SoundTouchNodes.info.Path] = device._Information
         self._ConfigurationCache[SoundTouchNodes.supportedURLs.Path] = device._SupportedUrls
+
+        # the device replaces the cached configurations above when it is revalidated.
+        device._Clients.add(self)
         
 
     def __enter__(self) -> 'SoundTouchClient':
@@ -117,8 +139,7 @@ class SoundTouchClient:
     
 
     def __getitem__(self, key):
-        if repr(key) in self._ConfigurationCache:
-            return self._ConfigurationCache[repr(key)]
+        return self._ConfigurationCache.get(repr(key), None)
 
 
     def __setitem__(self, key, value):
@@ -128,7 +149,8 @@ class SoundTouchClient:
 
 
     def __iter__(self):
-        return iter(self._ConfigurationCache)
+        # iterate over a snapshot, as other threads can change the cache while iterating.
+        return iter(self._ConfigurationCache.GetSnapshot())
 
 
     def __repr__(self) -> str:
@@ -140,19 +162,37 @@ class SoundTouchClient:
 
 
     @property
-    def ConfigurationCache(self) -> dict:
+    def CircuitBreaker(self) -> SoundTouchCircuitBreaker:
+        """ 
+        The circuit breaker that tracks the health of the device; requests fail immediately
+        while the device is not responding.
+
+        This property is read-only, and returns the `CircuitBreaker` property of the device.
+        """
+        return self._Device.CircuitBreaker
+
+
+    @property
+    def ConfigurationCache(self) -> SoundTouchConfigurationCache:
         """ 
         A dictionary of cached configuration objects that have been obtained from
         the SoundTouch device.  Use the objects in this cache whenever it is
         too expensive or time consuming to make a real-time request from the device.
 
         The configuration cache is updated for any "Get...()" methods that return
-        device information.  All of the "Get...()" methods have a `refresh:bool`
+        device information.  All of the "Get...()" methods have a `refresh`
         argument that controls where information is obtained from; if refresh=True,
         then the device is queried for real-time configuration information. If
         refresh=False, then the configuration information is pulled from the configuration
         cache dictionary; if the cache does not contain the object, then the device
         is queried for real-time configuration information.
+
+        The refresh argument can also be a maximum age (in seconds), in which case the 
+        device is only queried if the cached object is older than that; or None, in which 
+        case the maximum age configured in the cache for the uri is used (see the 
+        `SoundTouchConfigurationCache.SetMaxAge` method).  The cache records the time that
+        each object was stored, which can be inspected with the `GetAge` and `GetTimestamp`
+        methods.
         
         It is obviously MUCH faster to retrieve device configuration objects from the 
         cache than from real-time device queries.  This works very well for configuration
@@ -193,9 +233,12 @@ class SoundTouchClient:
         to the device.
         
         Returns:
-            The `_Manager' property value.
+            The pool manager of the `Transport` property value.
+
+        Setting this property assigns a private transport that delegates to the 
+        specified pool manager, and does not apply any connection caps.
         """
-        return self._Manager
+        return self._Transport.Manager
     
     @Manager.setter
     def Manager(self, value:PoolManager):
@@ -204,7 +247,26 @@ class SoundTouchClient:
         """
         if value != None:
             if isinstance(value, PoolManager):
-                self._Manager = value
+                self._Transport = SoundTouchTransport(maxConnections=None, maxConnectionsPerHost=None, manager=value)
+
+
+    @property
+    def NavigateCache(self) -> SoundTouchNavigateCache:
+        """ 
+        A bounded cache of music library / music service navigation results, that is used
+        by the `GetMusicLibraryItems` and `GetMusicServiceStations` methods when they are
+        called with `refresh=False`.
+
+        This property is read-only, and is set when the class is instantiated.
+
+        <details>
+          <summary>Sample Code</summary>
+        ```python
+        .. include:: ../docs/include/samplecode/SoundTouchClient/NavigateCache.py
+        ```
+        </details>
+        """
+        return self._NavigateCache
 
 
     @property
@@ -261,6 +323,54 @@ class SoundTouchClient:
         return self._SnapshotSettings
 
 
+    @property
+    def Statistics(self) -> SoundTouchStatistics:
+        """ 
+        Cache and request statistics of the client, per uri (e.g. cache hits and misses,
+        bytes received, http and parse latency histograms, etc).
+
+        This property is read-only, and is set when the class is instantiated.
+
+        <details>
+          <summary>Sample Code</summary>
+        ```python
+        .. include:: ../docs/include/samplecode/SoundTouchClient/Statistics.py
+        ```
+        </details>
+        """
+        return self._Statistics
+
+
+    @property
+    def TimeoutPolicy(self) -> SoundTouchTimeoutPolicy:
+        """ 
+        The timeout policy that determines the connect and read timeouts of requests to 
+        the device, based upon the uri being requested.
+
+        This property is read-only, and returns the `TimeoutPolicy` property of the device.
+        """
+        return self._Device.TimeoutPolicy
+
+
+    @property
+    def Transport(self) -> SoundTouchTransport:
+        """ 
+        The transport used for http requests to the device.
+        """
+        return self._Transport
+
+
+    def _BuildConfigurationModel(self, uri:SoundTouchUri, classType, msg:SoundTouchMessage) -> object:
+        """
+        Builds an instance of the given class type from a device response, and records the
+        build time in the "build_time" request statistics.
+        """
+        buildStartTime:float = time.perf_counter()
+        config = classType(root=msg.Response)
+        self._Statistics.RecordBuild(msg.Uri or uri, time.perf_counter() - buildStartTime)
+        return config
+
+
     def _CheckResponseForErrors(self, element:Element):
         """
         Checks a device response for errors.  If found, a `SoundTouchError`
@@ -308,10 +418,50 @@ class SoundTouchClient:
         return
 
 
+    def _GetConfiguration(self, uri:SoundTouchUri, classType) -> object:
+        """
+        Retrieves the configuration for the given URI from the device, and returns it as an 
+        instance of the given class type (or None if the device did not return a response).
+        """
+        msg = self.Get(uri)
+        return self._GetConfigurationModel(uri, classType, msg)
+
+
+    def _GetConfigurationModel(self, uri:SoundTouchUri, classType, msg:SoundTouchMessage) -> object:
+        """
+        Returns an instance of the given class type for a device response (or None if the 
+        device did not return a response).
+
+        If the raw response is identical to the response that the cached configuration was 
+        created from, then the cached configuration instance is returned instead of creating
+        a new one.
+        """
+        if msg.Response is None:
+            return None
+        if msg.ResponseData is None:
+            return self._BuildConfigurationModel(uri, classType, msg)
+
+        key:str = repr(uri)
+        digest:bytes = hashlib.blake2b(msg.ResponseData, digest_size=16).digest()
+
+        # if the response has not changed, and the cached configuration is still the one 
+        # that was created from it, then re-use the cached configuration.
+        entry:tuple = self._ConfigurationDigests.get(key, None)
+        if (entry is not None) and (entry[0] == digest) and (entry[1] is classType):
+            config = entry[2]
+            if self._ConfigurationCache.get(key, None) is config:
+                return config
+
+        config = self._BuildConfigurationModel(uri, classType, msg)
+        self._ConfigurationDigests[key] = (digest, classType, config)
+        self._ConfigurationCache.Persist(key, msg.ResponseData)
+        return config
+
+
     def _GetMetadataFromUrl_nBytes(self, url, size):
 
         headers={'Range': 'bytes=%s-%s' % (0, size-1)}
-        response = self._Manager.request("GET", url, headers=headers, retries=False, timeout=Timeout(connect=0.1, read=0.1))
+        response = self._Transport.Request("GET", url, headers=headers, retries=False, timeout=Timeout(connect=0.1, read=0.1))
 
         # req = request.Request(url)
         # req.headers['Range'] = 'bytes=%s-%s' % (0, size-1)
@@ -360,21 +510,89 @@ class SoundTouchClient:
             return None
         
 
+    def _Navigate(self, navigate:Navigate, refresh=True) -> NavigateResponse:
+        """
+        Issues a navigate request to the device, using the `NavigateCache` if requested.
+        """
+        key:str = navigate.ToXmlRequestBody()
+        if refresh is not True:
+            result:NavigateResponse = self._NavigateCache.Get(key, None if (refresh is None) or (refresh is False) else refresh)
+            if result is not None:
+                if _logsi.IsOn(SILevel.Verbose):
+                    _logsi.LogVerbose("SoundTouchClient navigate result (cached): '%s'" % (navigate.ContainerTitle))
+                return result
+
+        msg:SoundTouchMessage = self.Put(SoundTouchNodes.navigate, navigate)
+        if msg.Response is None:
+            return msg
+        result:NavigateResponse = NavigateResponse(root=msg.Response)
+
+        # add the source title to the results from the cached source list.
+        sourceList:SourceList = self.GetProperty(SoundTouchNodes.sources, SourceList, False)
+        if sourceList is not None:
+            result.SourceTitle = sourceList.GetTitleBySource(result.Source, result.SourceAccount)
+
+        self._NavigateCache.Set(key, result, len(msg.ResponseData or b''), navigate.Source, navigate.SourceAccount)
+        return result
+
+
+    def _ProcessResponse(self, msg:SoundTouchMessage, url:str, status:int, data:bytes, headers) -> None:
+        """
+        Processes a raw http response returned by the device, converting the response data
+        into the message object and checking it for errors.
+        
+        Args:
+            msg (SoundTouchMessage): 
+                The message object to update with the parsed response.
+            url (str):
+                The url that the request was made to.
+            status (int):
+                The http status code returned by the device.
+            data (bytes):
+                The raw response data returned by the device.
+            headers (object):
+                The http response headers returned by the device.
+
+        Raises:
+            SoundTouchError: 
+                If the response represents an error response.
+                
+        This method is shared by all transports (e.g. `SoundTouchClient`, `AsyncSoundTouchClient`),
+        so that responses are processed the same way regardless of how the request was made.
+        """
+        # only decode the response for tracing if it will be logged.
+        if _logsi.IsOn(SILevel.Verbose):
+            _logsi.LogXml(SILevel.Verbose, "SoundTouchClient http response: (%s) %s" % (status, url), data.decode("utf-8"), prettyPrint=True)
+        if _logsi.IsOn(SILevel.Debug):
+            if (headers):
+                _logsi.LogCollection(SILevel.Debug, "SoundTouchClient http response headers", headers.items())
+
+        if status == 200:
+            if data:
+                msg.Response = fromstring(data)
+                msg.ResponseData = data
+                self._CheckResponseForErrors(msg.Response)
+        else:
+            # soundtouch server can also issue errors response for http status codes other than 200 (e.g. 500, etc)
+            # example - select AUX source with no sourceAccount specified.
+            # request: <ContentItem source="AUX" />
+            # result:  <errors deviceID="9070658C9D4A"><error value="1005" name="UNKNOWN_SOURCE_ERROR" severity="Unknown">1005</error></errors>
+            if data:
+                msg.Response = fromstring(data)
+                self._CheckResponseForErrors(msg.Response)
+
+
     def _RecentListCacheLoad(self) -> None:
         """
         Loads the `RecentListcache` from the local file system.
         """
         try:
             
-            # does the cache storage file exist?
-            if os.path.exists(self._RecentListCachePath):
-
-                # load cache file contents.
-                tree = ElementTree.parse(self._RecentListCachePath)
-                root:Element = tree.getroot()
-                self._RecentListCache = RecentList(root=root)
+            # load cache file contents (and replay the change journal, if any).
+            self._RecentListCache = self._RecentListCacheWriter.Load(self._RecentListCacheMaxItems)
                 
-                # trace.
+            # trace.
+            if os.path.exists(self._RecentListCachePath):
                 _logsi.LogXmlFile(SILevel.Verbose, "RecentListCache file loaded for device '%s' - path: %s" % (self.Device.DeviceName, self.RecentListCachePath), self._RecentListCachePath,)
         
         except Exception as ex:
@@ -386,26 +604,25 @@ class SoundTouchClient:
             self._RecentListCache = RecentList()
 
 
-    def _RecentListCacheStore(self) -> None:
+    def _RecentListCacheStore(self, changed:Recent=None) -> None:
         """
-        Stores the `RecentListcache` to the local file system.
+        Schedules the `RecentListcache` to be stored to the local file system.
+
+        Args:
+            changed (Recent):
+                The item that was added or changed (if any).
+
+        The cache is written by a background thread (see `SoundTouchRecentListCacheWriter`), 
+        so that the caller (e.g. the websocket event thread) never blocks on disk i/o.
         """
         try:
             
             # is caching enabled?  if not, then don't bother.
-            if not self._RecentListCacheEnabled:
+            if (not self._RecentListCacheEnabled) or (self._RecentListCacheWriter is None):
                 return
 
-            # get xml element representation of the cache.
-            root:Element = self.RecentListCache.ToElement()
-            ElementTree.indent(root)  # pretty print
-            tree = ElementTree.ElementTree(root)
-
-            # save the cache to disk.
-            tree.write(self._RecentListCachePath, encoding='utf-8', xml_declaration=True)
-
-            # trace.
-            _logsi.LogXmlFile(SILevel.Verbose, "RecentListCache file saved for device '%s' - path: %s" % (self.Device.DeviceName, self.RecentListCachePath), self._RecentListCachePath,)
+            # schedule the cache to be saved to disk.
+            self._RecentListCacheWriter.Schedule(self.RecentListCache, changed)
 
         except Exception as ex:
             
@@ -413,6 +630,20 @@ class SoundTouchClient:
             _logsi.LogException("RecentListCache file save error for device '%s' (path=%s): %s" % (self.Device.DeviceName, self._RecentListCachePath, str(ex)), ex)
 
 
+    def _UpdateConfiguration(self, uri:SoundTouchUri, config:object, isPushed:bool=False) -> None:
+        """
+        Stores a refreshed (or pushed) configuration in the cache, and records whether it changed.
+        """
+        if config is None:
+            return
+        key:str = repr(uri)
+        if isPushed:
+            previous = self._ConfigurationCache.SetPushed(key, config)
+        else:
+            previous = self._ConfigurationCache.SetValue(key, config)
+        self._ConfigurationChanged[key] = previous is not config
+
+
     def _ValidateDelay(self, delay:int, default:int=5, maxDelay:int=10) -> int:
         """
         Validates a delay value
@@ -595,6 +826,9 @@ class SoundTouchClient:
         # device is capable - process the request.
         _logsi.LogVerbose(MSG_TRACE_DEVICE_COMMAND_WITH_PARM % ("addStation", addStation.ToString(), self.Device.DeviceName))
         result:SoundTouchMessage = self.Put(SoundTouchNodes.addStation, addStation)
+
+        # cached navigation results of the music service no longer contain all stations.
+        self._NavigateCache.Invalidate(addStation.Source, addStation.SourceAccount)
         return result
 
 
@@ -883,6 +1117,36 @@ class SoundTouchClient:
         return zone
 
 
+    def Deadline(self, seconds:float) -> SoundTouchDeadline:
+        """
+        Returns a context manager that sets an overall deadline for all device requests 
+        made within it.
+
+        Args:
+            seconds (float):
+                Amount of time (in seconds) that requests made within the context are
+                allowed to take in total.
+                
+        Returns:
+            A `SoundTouchDeadline` context manager.
+
+        Use this method to bound the total time taken by methods that make multiple device 
+        requests (e.g. `AddZoneMembers`, `RestoreSnapshot`, etc).  Each request is given the 
+        smaller of its timeout policy value and the time remaining until the deadline; once the 
+        deadline has expired, requests fail immediately with a `SoundTouchError`.  The deadline
+        applies to the current thread (or asyncio task), and is carried over to the concurrent
+        requests made by the `GetProperties` method.
+
+        <details>
+          <summary>Sample Code</summary>
+        ```python
+        .. include:: ../docs/include/samplecode/SoundTouchClient/Deadline.py
+        ```
+        </details>
+        """
+        return SoundTouchDeadline(seconds)
+
+
     def EnterBluetoothPairing(self) -> SoundTouchMessage:
         """
         Enters bluetooth pairing mode, and waits for a compatible device to pair with.
@@ -963,9 +1227,12 @@ class SoundTouchClient:
         Gets the current audio DSP controls configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `AudioDspControls` object that contains audio dsp control
@@ -1004,9 +1271,12 @@ class SoundTouchClient:
         Gets the current audio product level controls configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `AudioProductLevelControls` object that contains audio product level control
@@ -1045,9 +1315,12 @@ class SoundTouchClient:
         Gets the current audio product tone controls configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `AudioProductToneControls` object that contains audio product tone control
@@ -1086,9 +1359,12 @@ class SoundTouchClient:
         Gets the current audio speaker attrribute and setting configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `AudioSpeakerAttributeAndSetting` object that contains audio speaker attribute and setting
@@ -1127,9 +1403,12 @@ class SoundTouchClient:
         Gets the current balance configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `Balance` object that contains balance configuration of the device.
@@ -1150,9 +1429,12 @@ class SoundTouchClient:
         Gets the current bass configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `Bass` object that contains bass configuration of the device.
@@ -1173,9 +1455,12 @@ class SoundTouchClient:
         Gets the current bass capability configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `BassCapabilities` object that contains bass capabilities configuration of the device.
@@ -1196,9 +1481,12 @@ class SoundTouchClient:
         Gets the current bluetooth configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `BlueToothInfo` object that contains bluetooth configuration of the device.
@@ -1219,9 +1507,12 @@ class SoundTouchClient:
         Gets the current bass capability configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `Capabilities` object that contains capabilities configuration of the device.
@@ -1245,9 +1536,12 @@ class SoundTouchClient:
         Gets the current clock configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `ClockConfig` object that contains clock configuration of the device.
@@ -1268,9 +1562,12 @@ class SoundTouchClient:
         Gets the current clock time configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `ClockTime` object that contains clock time configuration of the device.
@@ -1291,9 +1588,12 @@ class SoundTouchClient:
         Gets the current digital signal processor configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `DSPMonoStereoItem` object that contains DSP configuration of the device.
@@ -1314,9 +1614,12 @@ class SoundTouchClient:
         Gets the current left / right stereo pair speaker group configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `Group` object that contains the result.
@@ -1345,9 +1648,12 @@ class SoundTouchClient:
         Gets the information configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `Information` object that contains the results.
@@ -1416,9 +1722,12 @@ class SoundTouchClient:
         Gets the current language configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `SimpleConfig` object that contains language configuration of the device.
@@ -1439,9 +1748,12 @@ class SoundTouchClient:
         Gets the list of UPnP media servers found by the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `MediaServerList` object that contains media server configuration of the device.
@@ -1457,13 +1769,19 @@ class SoundTouchClient:
         return self.GetProperty(SoundTouchNodes.listMediaServers, MediaServerList, refresh)
 
 
-    def GetMusicLibraryItems(self, navigate:Navigate) -> NavigateResponse:
+    def GetMusicLibraryItems(self, navigate:Navigate, refresh=True) -> NavigateResponse:
         """
         Gets a list of music library data from the specified music library (e.g. STORED_MUSIC, etc).
         
         Args:
             navigate (Navigate):
                 Navigate criteria used to search the music library.
+            refresh (bool | float):
+                True to query the device for real-time information; otherwise, False (or None)
+                to return a result from the `NavigateCache` for identical criteria if one is 
+                available.  A maximum age (in seconds) can also be specified to only use a 
+                cached result that is younger than that.
+                Default is True.
 
         Returns:
             A `NavigateResponse` object that contains the navigation response.
@@ -1505,23 +1823,22 @@ class SoundTouchClient:
 
         # device is capable - process the request.
         _logsi.LogVerbose(MSG_TRACE_DEVICE_COMMAND_WITH_PARM % ("navigate", navigate.ContainerTitle, self.Device.DeviceName))
-        result:NavigateResponse = self.Put(SoundTouchNodes.navigate, navigate, NavigateResponse)
-        
-        # add the source title to the results from the cached source list.
-        sourceList:SourceList = self.GetProperty(SoundTouchNodes.sources, SourceList, False)
-        if sourceList is not None:
-            result.SourceTitle = sourceList.GetTitleBySource(result.Source, result.SourceAccount)
-
-        return result
+        return self._Navigate(navigate, refresh)
 
 
-    def GetMusicServiceStations(self, navigate:Navigate) -> NavigateResponse:
+    def GetMusicServiceStations(self, navigate:Navigate, refresh=True) -> NavigateResponse:
         """
         Gets a list of your stored stations from the specified music service (e.g. PANDORA, etc).
         
         Args:
             navigate (Navigate):
                 Navigate criteria used to search the music service.
+            refresh (bool | float):
+                True to query the device for real-time information; otherwise, False (or None)
+                to return a result from the `NavigateCache` for identical criteria if one is 
+                available.  A maximum age (in seconds) can also be specified to only use a 
+                cached result that is younger than that.
+                Default is True.
 
         Returns:
             A `NavigateResponse` object that contains the navigation response.
@@ -1549,14 +1866,7 @@ class SoundTouchClient:
 
         # device is capable - process the request.
         _logsi.LogVerbose(MSG_TRACE_DEVICE_COMMAND_WITH_PARM % ("navigate", navigate.ContainerTitle, self.Device.DeviceName))
-        result:NavigateResponse = self.Put(SoundTouchNodes.navigate, navigate, NavigateResponse)
-        
-        # add the source title to the results from the cached source list.
-        sourceList:SourceList = self.GetProperty(SoundTouchNodes.sources, SourceList, False)
-        if sourceList is not None:
-            result.SourceTitle = sourceList.GetTitleBySource(result.Source, result.SourceAccount)
-
-        return result
+        return self._Navigate(navigate, refresh)
 
 
     def GetName(self, refresh=True) -> SimpleConfig:
@@ -1565,9 +1875,12 @@ class SoundTouchClient:
         class device name if possible.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `SimpleConfig` object that contains name configuration of the device.
@@ -1593,9 +1906,12 @@ class SoundTouchClient:
         Gets the current network information configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `NetworkInfo` object that contains network information configuration of the device.
@@ -1616,9 +1932,12 @@ class SoundTouchClient:
         Gets the current network status configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `NetworkStatus` object that contains network status configuration of the device.
@@ -1643,9 +1962,12 @@ class SoundTouchClient:
         Gets the now playing status configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `NowPlayingStatus` object that contains now playing status configuration of the device.
@@ -1715,9 +2037,12 @@ class SoundTouchClient:
         Gets the current power management status configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `PowerManagement` object that contains power management configuration of the device.
@@ -1738,12 +2063,16 @@ class SoundTouchClient:
         Gets the current preset list configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
             resolveSourceTitles (bool):
                 True to resolve the `SourceTitle` property value for all preset items
-                in the list; otherwise, False to return the list without source titles.
+                in a copy of the list (the cached list is not modified); otherwise, False to 
+                return the list without source titles.
 
         Returns:
             A `PresetList` object that contains preset list configuration of the device.
@@ -1764,10 +2093,10 @@ class SoundTouchClient:
             # get source list configuration.
             sourceList:SourceList = self.GetProperty(SoundTouchNodes.sources, SourceList, refresh)
             
-            # resolve source title for all list items.
-            preset:Preset
-            for preset in presetList:
-                preset.SourceTitle = sourceList.GetTitleBySource(preset.Source, preset.SourceAccount)
+            # resolve source title for all list items; the cached list is shared with other
+            # callers, so resolve the titles of a copy.
+            presetList = copy.deepcopy(presetList)
+            sourceList.ResolveSourceTitles(presetList)
         
         return presetList
     
@@ -1777,9 +2106,12 @@ class SoundTouchClient:
         Gets the current product CEC HDMI control configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `ProductCecHdmiControl` object that contains product CEC HDMI control
@@ -1818,9 +2150,12 @@ class SoundTouchClient:
         Gets the current product HDMI assignment controls configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `ProductHdmiAssignmentControls` object that contains product HDMI assignment control
@@ -1854,6 +2189,73 @@ class SoundTouchClient:
         return self.GetProperty(SoundTouchNodes.producthdmiassignmentcontrols, ProductHdmiAssignmentControls, refresh)
 
 
+    def GetProperties(self, properties:list[tuple], refresh=True, maxWorkers:int=8) -> list:
+        """
+        Returns cached properties mapped to the given URI's, refreshing them from the device
+        concurrently.
+        
+        Args:
+            properties (list[tuple]):
+                A list of (uri, classType) tuples, where uri is the property key (e.g. 
+                `SoundTouchNodes.volume`, etc) and classType is the configuration class type
+                (e.g. Volume, etc).
+            refresh (bool | float):
+                True to refresh the properties with real-time information from the device;
+                otherwise, False to just return the cached values.  A maximum age (in seconds)
+                can also be specified to only refresh properties whose cached values are older
+                than that, or None to use the `ConfigurationCache` maximum age of each property.
+            maxWorkers (int):
+                Maximum number of requests to issue to the device concurrently.
+                Default is 8.
+                
+        Returns:
+            A list of configuration instances of the provided classType arguments, in the
+            same order as the properties argument.
+
+        Raises:
+            SoundTouchError:
+                If any of the requests fail; the first error is raised once all requests 
+                have completed, and the cache is updated for requests that succeeded.
+
+        This method issues the requests concurrently over keep-alive connections from the
+        client transport, so refreshing several properties costs about one device round-trip
+        instead of one round-trip per property.  Properties that do not exist in the cache
+        are refreshed from the device, regardless of the refresh argument value.
+
+        <details>
+          <summary>Sample Code</summary>
+        ```python
+        .. include:: ../docs/include/samplecode/SoundTouchClient/GetProperties.py
+        ```
+        </details>
+        """
+        # determine which properties need to be refreshed (ignoring duplicates).
+        refreshList:dict = {}
+        for uri, classType in properties:
+            self._ConfigurationCache.Restore(uri, classType)
+            if self._ConfigurationCache.IsRefreshRequired(uri, refresh):
+                self._Statistics.RecordMiss(uri)
+                refreshList[repr(uri)] = (uri, classType)
+            else:
+                self._Statistics.RecordHit(uri)
+
+        if len(refreshList) == 1:
+            uri, classType = list(refreshList.values())[0]
+            self.RefreshConfiguration(uri, classType)
+        elif len(refreshList) > 1:
+            if _logsi.IsOn(SILevel.Verbose):
+                _logsi.LogVerbose("Refreshing %d configurations concurrently from the SoundTouch device: %s" % (len(refreshList), str(list(refreshList.keys()))))
+            with ThreadPoolExecutor(max_workers=max(1, min(maxWorkers, len(refreshList))), thread_name_prefix='SoundTouchClient') as executor:
+                # run each request in a copy of the caller's context, so the current deadline (if any) applies.
+                futures:list = [ executor.submit(contextvars.copy_context().run, self.RefreshConfiguration, uri, classType) for uri, classType in refreshList.values() ]
+            for future in futures:
+                ex = future.exception()
+                if ex is not None:
+                    raise ex
+
+        return [ self[uri] for uri, classType in properties ]
+
+
     def GetProperty(self, uri:SoundTouchUri, classType, refresh=True):
         """
         Returns a cached property mapped to the given URI.
@@ -1863,9 +2265,11 @@ class SoundTouchClient:
                 The property key (e.g. 'balance', 'volume', etc).
             classType (type):
                 The configuration class type (e.g. Balance, Volume, etc).
-            refresh (bool):
+            refresh (bool | float):
                 True to refresh the property with real-time information from the device;
-                otherwise, False to just return the cached value.
+                otherwise, False to just return the cached value.  A maximum age (in seconds)
+                can also be specified to only refresh the property if the cached value is older
+                than that, or None to use the `ConfigurationCache` maximum age for the property.
                 
         Returns:
             A configuration instance of the provided classType argument.
@@ -1874,9 +2278,13 @@ class SoundTouchClient:
         does not exist in the cache, regardless of the refresh argument value.
         """
         cacheDesc:str = 'cached'
-        if repr(uri) not in self or refresh:
+        self._ConfigurationCache.Restore(uri, classType)
+        if self._ConfigurationCache.IsRefreshRequired(uri, refresh):
+            self._Statistics.RecordMiss(uri)
             self.RefreshConfiguration(uri, classType)
             cacheDesc = 'current'
+        else:
+            self._Statistics.RecordHit(uri)
 
         if _logsi.IsOn(SILevel.Verbose):
             _logsi.LogVerbose("SoundTouchClient configuration object (%s): '%s'" % (cacheDesc, str(self[uri])))
@@ -1889,9 +2297,12 @@ class SoundTouchClient:
         Gets the current rebroadcast latency mode configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `RebroadcastLatencyMode` object that contains rebroadcast latency mode
@@ -1930,12 +2341,16 @@ class SoundTouchClient:
         Gets the current recent list configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
             resolveSourceTitles (bool):
                 True to resolve the `SourceTitle` property value for all recent items
-                in the list; otherwise, False to return the list without source titles.
+                in a copy of the list (the cached list is not modified); otherwise, False to 
+                return the list without source titles.
             filterSourceTitle (str):
                 Limits the results of the recents list to the specified source title.
                 Setting this argument automatically sets the `resolveSourceTitles` argument to True.
@@ -1965,10 +2380,10 @@ class SoundTouchClient:
             # get source list configuration.
             sourceList:SourceList = self.GetProperty(SoundTouchNodes.sources, SourceList, refresh)
             
-            # resolve source title for all list items.
-            recent:Recent
-            for recent in recentList:
-                recent.SourceTitle = sourceList.GetTitleBySource(recent.Source, recent.SourceAccount)
+            # resolve source title for all list items; the cached list is shared with other
+            # callers, so resolve the titles of a copy.
+            recentList = copy.deepcopy(recentList)
+            sourceList.ResolveSourceTitles(recentList)
                 
         # was filter source title specified?  if so, then return only results for the source title.
         if filterSourceTitle is not None:
@@ -1987,9 +2402,12 @@ class SoundTouchClient:
         Gets a new bearer token generated by the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `SimpleConfig` object that contains the request token in the Attribute property.
@@ -2010,9 +2428,12 @@ class SoundTouchClient:
         Gets the current service availability configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `ServiceAvailability` object that contains service availability configuration of the device.
@@ -2044,9 +2465,12 @@ class SoundTouchClient:
         Gets the status of a SoundTouch software update for the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `SoftwareUpdateQueryResponse` object that contains software update status
@@ -2084,9 +2508,12 @@ class SoundTouchClient:
         Gets the latest available software update release version information for the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `SoftwareUpdateCheckResponse` object that contains software release information
@@ -2124,9 +2551,12 @@ class SoundTouchClient:
         Gets the current SoundTouch configuration status configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `SoundTouchConfigurationStatus` object that contains SoundTouch configuration status of the device.
@@ -2158,9 +2588,12 @@ class SoundTouchClient:
         Gets the current source list configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `SourceList` object that contains source list configuration of the device.
@@ -2181,9 +2614,12 @@ class SoundTouchClient:
         Gets the supported urls configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `SupportedUrls` object that contains the results.
@@ -2215,9 +2651,12 @@ class SoundTouchClient:
         Gets the current system timeout configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `SystemTimeout` object that contains system timeout configuration of the device.
@@ -2240,9 +2679,12 @@ class SoundTouchClient:
         Gets extended track information for the current playing music service media.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `TrackInfo` object that contains track information.
@@ -2280,9 +2722,12 @@ class SoundTouchClient:
         Gets the current volume configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `Volume` object that contains volume configuration of the device.
@@ -2306,9 +2751,12 @@ class SoundTouchClient:
         Gets the current wireless profile configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `WirelessProfile` object that contains wireless profile configuration of the device.
@@ -2329,9 +2777,12 @@ class SoundTouchClient:
         Gets a list of wireless networks that can be detected by the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `PerformWirelessSiteSurveyResponse` object that contains wireless survey
@@ -2369,9 +2820,12 @@ class SoundTouchClient:
         Gets the current wireless zone status configuration of the device.
 
         Args:
-            refresh (bool):
+            refresh (bool | float):
                 True to query the device for realtime information and refresh the cache;
-                otherwise, False to just return the cached information.
+                otherwise, False to just return the cached information.  A maximum age (in 
+                seconds) can also be specified to only query the device if the cached 
+                information is older than that, or None to use the `ConfigurationCache` 
+                maximum age for the information.
 
         Returns:
             A `Zone` object that contains zone configuration of the device.
@@ -2387,6 +2841,34 @@ class SoundTouchClient:
         return self.GetProperty(SoundTouchNodes.getZone, Zone, refresh)
 
 
+    def HasConfigurationChanged(self, uri:SoundTouchUri) -> bool:
+        """
+        Determines if the configuration for the given URI changed the last time that it
+        was refreshed from the device.
+
+        Args:
+            uri (SoundTouchUri):
+                The configuration uri key (e.g. `SoundTouchNodes.nowPlaying`, etc).
+
+        Returns:
+            True if the last refresh of the configuration returned a different response than
+            the refresh before it, or if the configuration has not been refreshed yet;
+            otherwise, False if the device returned the same response, and the cached 
+            configuration instance was re-used.
+
+        Use this method when polling the device to skip processing of configurations that
+        have not changed.  
+
+        <details>
+          <summary>Sample Code</summary>
+        ```python
+        .. include:: ../docs/include/samplecode/SoundTouchClient/HasConfigurationChanged.py
+        ```
+        </details>
+        """
+        return self._ConfigurationChanged.get(repr(uri), True)
+
+
     def MakeRequest(self, method:str, msg:SoundTouchMessage) -> int:
         """
         Performs a generic request by converting the response into the message object.
@@ -2425,32 +2907,46 @@ class SoundTouchClient:
         url = f'http://{self.Device.Host}:{self.Device.Port}/{msg.Uri}'
         
         try:
-            if msg.HasXmlMessage:
-                reqbody:str = msg.XmlMessage
-                reqbodyencoded:bytes = reqbody.encode('utf-8')
-                _logsi.LogXml(SILevel.Verbose, "SoundTouchClient http request: '%s' (with body)" % (url), reqbody, prettyPrint=True)
-                response = self._Manager.request(method, url, body=reqbodyencoded)
-            else:
-                _logsi.LogVerbose("SoundTouchClient http request: '%s'" % (url))
-                response = self._Manager.request(method, url)
-
-            _logsi.LogXml(SILevel.Verbose, "SoundTouchClient http response: (%s) %s" % (response.status, url), response.data.decode("utf-8"), prettyPrint=True)
-            if _logsi.IsOn(SILevel.Debug):
-                if (response.headers):
-                    _logsi.LogCollection(SILevel.Debug, "SoundTouchClient http response headers", response.headers.items())
-
-            if response.status == 200:
-                if response.data:
-                    msg.Response = fromstring(response.data)
-                    self._CheckResponseForErrors(msg.Response)
-            else:
-                # soundtouch server can also issue errors response for http status codes other than 200 (e.g. 500, etc)
-                # example - select AUX source with no sourceAccount specified.
-                # request: <ContentItem source="AUX" />
-                # result:  <errors deviceID="9070658C9D4A"><error value="1005" name="UNKNOWN_SOURCE_ERROR" severity="Unknown">1005</error></errors>
-                if response.data:
-                    msg.Response = fromstring(response.data)
-                    self._CheckResponseForErrors(msg.Response)
+            # get the request timeout for the uri, bounded by the current deadline (if any).
+            timeout, isDeadlineBound = self._Device.TimeoutPolicy.GetTimeout(msg.Uri, self.Device.DeviceName)
+
+            # fail immediately if the device is known to not be responding.
+            breaker:SoundTouchCircuitBreaker = self._Device.CircuitBreaker
+            breaker.Check(self.Device.DeviceName)
+
+            startTime:float = time.perf_counter()
+            try:
+                if msg.HasXmlMessage:
+                    reqbody:str = msg.XmlMessage
+                    reqbodyencoded:bytes = reqbody.encode('utf-8')
+                    if _logsi.IsOn(SILevel.Verbose):
+                        _logsi.LogXml(SILevel.Verbose, "SoundTouchClient http request: '%s' (with body)" % (url), reqbody, prettyPrint=True)
+                    response = self._Transport.Request(method, url, body=reqbodyencoded, timeout=timeout, retries=self._Device.TimeoutPolicy.GetRetries(isDeadlineBound))
+                else:
+                    if _logsi.IsOn(SILevel.Verbose):
+                        _logsi.LogVerbose("SoundTouchClient http request: '%s'" % (url))
+                    response = self._Transport.Request(method, url, timeout=timeout, retries=self._Device.TimeoutPolicy.GetRetries(isDeadlineBound))
+            except HTTPError as ex:
+                # a timeout caused by the caller's deadline says nothing about the device health.
+                if isDeadlineBound:
+                    breaker.RecordIgnored()
+                else:
+                    breaker.RecordFailure(ex)
+                self._Statistics.RecordError(msg.Uri, time.perf_counter() - startTime)
+                raise
+            except BaseException:
+                breaker.RecordIgnored()
+                raise
+            breaker.RecordSuccess()
+            httpTime:float = time.perf_counter() - startTime
+
+            # process the response, recording the request statistics even if the device 
+            # returned an error response.
+            parseStartTime:float = time.perf_counter()
+            try:
+                self._ProcessResponse(msg, url, response.status, response.data, response.headers)
+            finally:
+                self._Statistics.RecordRequest(msg.Uri, httpTime, time.perf_counter() - parseStartTime, len(response.data or b''))
 
             response.close()
             return response.headers
@@ -3251,14 +3747,27 @@ class SoundTouchClient:
 
         This method will call the `Get()` method to refresh the configuration with
         real-time information from the device, and store the results in the cache.
+
+        Concurrent calls for the same device, uri and class type (from any client of
+        the device) are coalesced into a single request; all callers receive the same
+        configuration instance, which is also the cached instance; callers must modify a
+        copy of it, not the instance itself.  A caller that is waiting for the request of 
+        another caller waits no longer than the time remaining until its current 
+        `SoundTouchDeadline` (if any).
+
+        If the device returns the same response as the last refresh, then the cached 
+        configuration instance is returned as-is (instead of creating a new instance),
+        and the `HasConfigurationChanged` method will return False for the uri.
         """
         if _logsi.IsOn(SILevel.Verbose):
             _logsi.LogVerbose("Refreshing '%s' configuration from the SoundTouch device" % (str(uri)))
+        self._Statistics.RecordRefresh(uri)
         
-        msg = self.Get(uri)
-        if msg.Response is not None:
-            self[uri] = classType(root=msg.Response)
-            
+        try:
+            config = self._Device._SingleFlight.Do((str(uri), classType, self._RaiseErrors), self._GetConfiguration, uri, classType)
+        except TimeoutError:
+            raise SoundTouchError(BSTAppMessages.BST_DEVICE_DEADLINE_EXCEEDED % (self.Device.DeviceName, str(uri)), logsi=_logsi)
+        self._UpdateConfiguration(uri, config)
         return self[uri]
 
 
@@ -3433,6 +3942,9 @@ class SoundTouchClient:
         # device is capable - process the request.
         _logsi.LogVerbose(MSG_TRACE_DEVICE_COMMAND_WITH_PARM % ("removeStation", removeStation.ToString(), self.Device.DeviceName))
         result:SoundTouchMessage = self.Put(SoundTouchNodes.removeStation, removeStation)
+
+        # cached navigation results of the music service may contain the removed station.
+        self._NavigateCache.Invalidate(removeStation.Source, removeStation.SourceAccount)
         return result
 
 
@@ -4933,6 +5445,69 @@ class SoundTouchClient:
         return msg
 
 
+    def UpdateConfigurationCacheStatus(self,
+                                       enabled:bool=True,
+                                       cacheStorageDirectory:str=None,
+                                       uris:list=None,
+                                       ) -> None:
+        """
+        Controls persistence of the configuration cache to the local file system.
+
+        Args:
+            enabled (bool):
+                True to enable persistence; false to disable persistence.
+            cacheStorageDirectory (str):
+                Local file system directory location where the cache file will be stored.  
+                The platformdirs site configuration location will be used if not specified.  
+            uris (list[SoundTouchUri]):
+                Uri's (or uri paths) of the configurations to persist.  
+                Default is None, which persists slow-changing configurations only (e.g. 
+                `capabilities`, `sources`, `presets`, etc).  
+                
+        If enabled, device responses for the persisted uri's are stored to the local file 
+        system each time they change.  The file is located in the directory specified by the 
+        `cacheStorageDirectory` argument.  The name of the cache file is 
+        `configuration_cache_<DEVICE_ID>.json`, where DEVICE_ID is the SoundTouch device 
+        identifier (e.g. `configuration_cache_9070658C9D4A.json`).
+        
+        The cache file is loaded on the first call to `GetProperty` (or any of the `Get*` 
+        methods that use it); configurations that are not yet cached are restored from the 
+        file instead of being requested from the device, and are then subject to the 
+        `ConfigurationCache` maximum age for the uri.  The file is discarded if the device 
+        firmware version has changed since it was stored.
+        
+        <details>
+          <summary>Sample Code</summary>
+        ```python
+        .. include:: ../docs/include/samplecode/SoundTouchClient/UpdateConfigurationCacheStatus.py
+        ```
+        </details>
+        """
+        # is cache persistence enabled?
+        if (enabled):
+            
+            # verify cache storage directory exists.
+            if cacheStorageDirectory is None:
+                cacheStorageDirectory = platformdirs.site_config_dir('bosesoundtouchapi', ensure_exists=True, appauthor=False)
+            os.makedirs(cacheStorageDirectory, exist_ok=True)  # succeeds even if directory exists.
+
+            # formulate the cache storage file name.
+            path:str = os.path.join(cacheStorageDirectory, "configuration_cache_%s.json" % (self.Device.DeviceId))
+            
+            # enable persistence; the cache file is loaded when it is first used.
+            self._ConfigurationCache.EnablePersistence(path, uris, self.Device.FirmwareVersion)
+
+            # trace.
+            _logsi.LogVerbose("ConfigurationCache persistence is enabled for device '%s' (path=%s)" % (self.Device.DeviceName, path))
+
+        else:
+
+            self._ConfigurationCache.DisablePersistence()
+
+            # trace.
+            _logsi.LogVerbose("ConfigurationCache persistence is disabled for device '%s'" % self.Device.DeviceName)
+
+
     def UpdateGroupStereoPairName(self, name:str) -> Group:
         """
         Updates the name of the current left / right stereo pair speaker group configuration 
@@ -5061,6 +5636,8 @@ class SoundTouchClient:
                                     enabled:bool=True,
                                     cacheStorageDirectory:str=None,
                                     maxItems:int=100,
+                                    writeDelay:float=2,
+                                    useJournal:bool=False,
                                     ) -> None:
         """
         Controls tracking of the local recently played items cache.
@@ -5075,6 +5652,14 @@ class SoundTouchClient:
                 Maximum number of items to store in the cache; older items are dropped from
                 the cache once this value is reached.  
                 Default is 100.  
+            writeDelay (float):
+                Amount of time (in seconds) to wait for further changes before the cache file
+                is written.  
+                Default is 2 seconds.  
+            useJournal (bool):
+                True to append each change to a journal file, which is replayed when the cache
+                is loaded; otherwise, False.  
+                Default is False.  
                 
         If enabled, the `RecentListCache` property will be updated with played media content
         information.  The maximum number of items to keep in the cache is controlled by the 
@@ -5082,7 +5667,14 @@ class SoundTouchClient:
         maximum number of items has been reached.  A value of 1 is assigned if the `maxItems` 
         argument is less than 1.
         
-        The cache is stored to the local file system each time an item is added to the cache.  
+        The cache is stored to the local file system by a background thread once no items have
+        been added to the cache for `writeDelay` seconds, so that a burst of track changes 
+        results in a single write; the file is written to a temporary file first, and then 
+        renamed over the existing file.  If `useJournal` is True, each added item is also 
+        appended to a journal file (`recently_played_cache_<DEVICE_ID>.xml.journal`), and the
+        cache file is only rewritten (and the journal truncated) once the journal holds 100 
+        items.  Pending changes are written when the cache is disabled, and when the process ends.
+        
         The file is located in the directory specified by the `cacheStorageDirectory` argument.  
         The name of the cache file is `recently_played_cache_<DEVICE_ID>.xml`, where DEVICE_ID 
         is the SoundTouch device identifier (e.g. `recently_played_cache_9070658C9D4A.xml`).
@@ -5118,6 +5710,11 @@ class SoundTouchClient:
 
             # formulate the cache storage file name.
             self._RecentListCachePath = os.path.join(cacheStorageDirectory, "recently_played_cache_%s.xml" % (self.Device.DeviceId))
+
+            # write pending changes of a previous writer, and create a new writer.
+            if self._RecentListCacheWriter is not None:
+                self._RecentListCacheWriter.Close()
+            self._RecentListCacheWriter = SoundTouchRecentListCacheWriter(self._RecentListCachePath, writeDelay=writeDelay, useJournal=useJournal)
             
             # load the cache.
             self._RecentListCacheLoad()
@@ -5127,6 +5724,11 @@ class SoundTouchClient:
 
         else:
 
+            # write pending changes, and stop the writer.
+            if self._RecentListCacheWriter is not None:
+                self._RecentListCacheWriter.Close()
+                self._RecentListCacheWriter = None
+
             # trace.
             _logsi.LogVerbose("RecentListCache is disabled for device '%s'" % self.Device.DeviceName)
             
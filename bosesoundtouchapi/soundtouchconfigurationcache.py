@@ -0,0 +1,843 @@
+# external package imports.
+import json
+import os
+import tempfile
+import threading
+import time
+from xml.etree.ElementTree import fromstring
+
+# our package imports.
+from .bstutils import export
+from .uri.soundtouchuri import SoundTouchUri
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+@export
+class SoundTouchConfigurationCache(dict):
+    """
+    A dictionary of cached configuration objects that have been obtained from a SoundTouch
+    device, keyed by uri path.
+
+    In addition to the cached objects, the cache records the time that each entry was
+    stored, and a maximum age (in seconds) for each uri path that determines how long an
+    entry is considered fresh.  Configurations that rarely change (e.g. `capabilities`,
+    `supportedURLs`, etc) never expire by default, while configurations that change often
+    (e.g. `volume`, `nowPlaying`, etc) expire after a second or two.  The maximum age for
+    any uri can be changed with the `SetMaxAge` method.
+
+    The maximum ages are used by the `SoundTouchClient.Get...()` methods when they are
+    called with `refresh=None`; the refresh argument can also be a number of seconds, to
+    specify the maximum age for a single call.
+
+    Entries can also be pushed into the cache from device notifications (see the
+    `SoundTouchWebSocket` updateConfigurationCache argument); pushed entries are kept
+    current by the device, and are considered fresh regardless of their age until they
+    are replaced by a device query or the notification connection is closed.
+
+    The cache can also be persisted to the local file system (see the `EnablePersistence`
+    method), so that slow-changing configurations (e.g. `capabilities`, `sources`, `presets`, 
+    etc) are available immediately after a process restart without querying the device.
+
+    Each entry carries a version number, which is assigned from a counter that is incremented
+    every time the cache is changed; the `GetEntry` and `CompareAndSet` methods can be used to
+    update an entry only if it was not changed by another thread in the meantime, and the
+    `AddOrUpdate` and `GetOrAdd` methods perform an atomic read-modify-write of an entry.  The
+    `GetSnapshot` method returns a consistent copy of several entries at once.
+
+    Threadsafety:
+        This class is fully thread-safe; entries can be read and changed by multiple threads
+        (e.g. caller threads and the `SoundTouchWebSocket` notification thread) concurrently.
+    """
+
+    DEFAULT_MAX_AGES:dict = \
+    {
+        'balance': 2,
+        'bass': 2,
+        'bassCapabilities': None,
+        'capabilities': None,
+        'getZone': 5,
+        'info': None,
+        'nowPlaying': 2,
+        'presets': 300,
+        'recents': 60,
+        'sources': None,
+        'supportedURLs': None,
+        'volume': 1,
+    }
+    """
+    Default maximum ages (in seconds) for specific uri paths, where None indicates that the
+    entry never expires; uri paths that are not listed use the `DefaultMaxAge` value.
+    """
+
+    DEFAULT_PERSISTENT_PATHS:list = \
+    [
+        'bassCapabilities',
+        'capabilities',
+        'networkInfo',
+        'presets',
+        'sources',
+    ]
+    """
+    Default uri paths of the entries that are persisted to the local file system, if
+    persistence is enabled.
+    """
+
+    PERSISTENT_CACHE_VERSION:int = 1
+    """
+    Version of the persistent cache file format; files (and entries) with a different 
+    version are ignored.
+    """
+
+    def __init__(self, defaultMaxAge:float=0, maxAges:dict=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            defaultMaxAge (float):
+                Maximum age (in seconds) of entries for uri's that do not have a specific
+                maximum age, or None if the entries never expire.
+                Default is 0 (entries are always refreshed).
+            maxAges (dict):
+                Maximum ages (in seconds) keyed by uri path, that override the
+                `DEFAULT_MAX_AGES` values.
+                Default is None.
+        """
+        super().__init__()
+        self._DefaultMaxAge:float = defaultMaxAge
+        self._Lock:threading.RLock = threading.RLock()
+        self._MaxAges:dict = dict(SoundTouchConfigurationCache.DEFAULT_MAX_AGES)
+        self._PersistentEntries:dict = None
+        self._PersistentFirmwareVersion:str = None
+        self._PersistentLock:threading.RLock = threading.RLock()
+        self._PersistentPath:str = None
+        self._PersistentPaths:set = set()
+        self._PushedKeys:set = set()
+        self._Timestamps:dict = {}
+        self._Version:int = 0
+        self._Versions:dict = {}
+        if maxAges is not None:
+            for path, seconds in maxAges.items():
+                self.SetMaxAge(path, seconds)
+
+
+    def __delitem__(self, key) -> None:
+        key = SoundTouchConfigurationCache._GetKey(key)
+        with self._Lock:
+            super().__delitem__(key)
+            self._RemoveEntry(key)
+
+
+    def __setitem__(self, key, value) -> None:
+        with self._Lock:
+            self._SetEntry(SoundTouchConfigurationCache._GetKey(key), value)
+
+
+    @property
+    def DefaultMaxAge(self) -> float:
+        """
+        Maximum age (in seconds) of entries for uri's that do not have a specific maximum age,
+        or None if the entries never expire.
+        """
+        return self._DefaultMaxAge
+
+    @DefaultMaxAge.setter
+    def DefaultMaxAge(self, value:float):
+        """
+        Sets the DefaultMaxAge property value.
+        """
+        if (value is None) or (isinstance(value, (int, float)) and value >= 0):
+            self._DefaultMaxAge = value
+
+
+    @property
+    def IsPersistent(self) -> bool:
+        """
+        True if entries are persisted to the local file system; otherwise, False.
+        """
+        return self._PersistentPath is not None
+
+
+    @property
+    def PersistentPath(self) -> str:
+        """
+        Path of the file that entries are persisted to, if persistence is enabled; 
+        otherwise, None.
+        """
+        return self._PersistentPath
+
+
+    @property
+    def PersistentPaths(self) -> list:
+        """
+        Uri paths of the entries that are persisted to the local file system.
+        """
+        return sorted(self._PersistentPaths)
+
+
+    @property
+    def Version(self) -> int:
+        """
+        Version of the cache, which is incremented every time the cache is changed.
+        """
+        return self._Version
+
+
+    @staticmethod
+    def _GetKey(key) -> str:
+        """
+        Returns the cache key for a uri (or uri path).
+        """
+        if isinstance(key, str):
+            return key
+        return repr(key)
+
+
+    def _PersistentCacheLoad(self) -> None:
+        """
+        Loads the persisted entries from the local file system.
+
+        Entries are not added to the cache here; they are restored one at a time by the 
+        `Restore` method, as the configuration class type of each entry is only known when
+        the entry is requested.
+        """
+        self._PersistentEntries = {}
+        try:
+
+            # does the cache storage file exist?
+            if not os.path.exists(self._PersistentPath):
+                return
+
+            with open(self._PersistentPath, 'r', encoding='utf-8') as file:
+                data:dict = json.load(file)
+
+            # ignore the file if it is a different version, or was created from different 
+            # device firmware (as the device configuration may have changed with it).
+            if data.get('version', None) != SoundTouchConfigurationCache.PERSISTENT_CACHE_VERSION:
+                _logsi.LogVerbose("Persistent configuration cache file ignored (unsupported version) - path: %s" % (self._PersistentPath))
+                return
+            if (self._PersistentFirmwareVersion is not None) and (data.get('firmware_version', None) != self._PersistentFirmwareVersion):
+                _logsi.LogVerbose("Persistent configuration cache file ignored (firmware version changed) - path: %s" % (self._PersistentPath))
+                return
+
+            for path, entry in data.get('entries', {}).items():
+                if (isinstance(entry, dict)) and (entry.get('version', None) == SoundTouchConfigurationCache.PERSISTENT_CACHE_VERSION):
+                    self._PersistentEntries[path] = entry
+
+            # trace.
+            _logsi.LogVerbose("Persistent configuration cache file loaded (%d entries) - path: %s" % (len(self._PersistentEntries), self._PersistentPath))
+
+        except Exception as ex:
+
+            # trace and ignore exceptions.
+            _logsi.LogException("Persistent configuration cache file load error (path=%s): %s" % (self._PersistentPath, str(ex)), ex)
+
+
+    def _PersistentCacheStore(self) -> None:
+        """
+        Stores the persisted entries to the local file system.
+
+        The file is written to a temporary file first, and then renamed over the existing 
+        file, so that the file is never left partially written.
+        """
+        tempPath:str = None
+        try:
+
+            data:dict = \
+            {
+                'version': SoundTouchConfigurationCache.PERSISTENT_CACHE_VERSION,
+                'firmware_version': self._PersistentFirmwareVersion,
+                'entries': self._PersistentEntries,
+            }
+
+            fd, tempPath = tempfile.mkstemp(prefix=os.path.basename(self._PersistentPath) + '.', suffix='.tmp', dir=os.path.dirname(self._PersistentPath))
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(data, file, indent=2)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tempPath, self._PersistentPath)
+            tempPath = None
+
+            # trace.
+            _logsi.LogVerbose("Persistent configuration cache file saved (%d entries) - path: %s" % (len(self._PersistentEntries), self._PersistentPath))
+
+        except Exception as ex:
+
+            # trace and ignore exceptions.
+            _logsi.LogException("Persistent configuration cache file save error (path=%s): %s" % (self._PersistentPath, str(ex)), ex)
+
+        finally:
+
+            # remove the temporary file if it was not renamed.
+            if tempPath is not None:
+                try:
+                    os.remove(tempPath)
+                except Exception:
+                    pass
+
+
+    def _RemoveEntry(self, key:str) -> None:
+        """
+        Removes the metadata of an entry that was removed from the dictionary.
+
+        The caller must hold the lock.
+        """
+        self._PushedKeys.discard(key)
+        self._Timestamps.pop(key, None)
+        self._Versions.pop(key, None)
+        self._Version += 1
+
+
+    def _SetEntry(self, key:str, value, isPushed:bool=False, timestamps:tuple=None) -> object:
+        """
+        Stores an entry and its metadata, and returns the previous value of the entry (or 
+        None if the cache did not contain an entry).
+
+        The caller must hold the lock.
+        """
+        previous = super().get(key, None)
+        super().__setitem__(key, value)
+        if isPushed:
+            self._PushedKeys.add(key)
+        else:
+            self._PushedKeys.discard(key)
+        self._Timestamps[key] = timestamps or (time.monotonic(), time.time())
+        self._Version += 1
+        self._Versions[key] = self._Version
+        return previous
+
+
+    def clear(self) -> None:
+        with self._Lock:
+            super().clear()
+            self._PushedKeys.clear()
+            self._Timestamps.clear()
+            self._Versions.clear()
+            self._Version += 1
+
+
+    def pop(self, key, *args):
+        key = SoundTouchConfigurationCache._GetKey(key)
+        with self._Lock:
+            if super().__contains__(key):
+                self._RemoveEntry(key)
+            return super().pop(key, *args)
+
+
+    def popitem(self) -> tuple:
+        with self._Lock:
+            key, value = super().popitem()
+            self._RemoveEntry(key)
+            return key, value
+
+
+    def setdefault(self, key, default=None):
+        key = SoundTouchConfigurationCache._GetKey(key)
+        with self._Lock:
+            if not super().__contains__(key):
+                self._SetEntry(key, default)
+            return super().__getitem__(key)
+
+
+    def update(self, *args, **kwargs) -> None:
+        items:dict = dict(*args, **kwargs)
+        with self._Lock:
+            for key, value in items.items():
+                self._SetEntry(SoundTouchConfigurationCache._GetKey(key), value)
+
+
+    def AddOrUpdate(self, key:SoundTouchUri, addValue, updateMethod) -> object:
+        """
+        Atomically adds an entry if the cache does not contain one for the given uri, or
+        updates the existing entry.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+            addValue (object):
+                The value to store if the cache does not contain an entry for the uri.
+            updateMethod (Callable[[str, object], object]):
+                A method that is called with the uri path and the current value, and returns
+                the value to store if the cache contains an entry for the uri.
+
+        Returns:
+            The value that was stored.
+
+        The update method is called while the cache is locked, so it should return quickly
+        and must not query the device.
+        """
+        key = SoundTouchConfigurationCache._GetKey(key)
+        with self._Lock:
+            if super().__contains__(key):
+                value = updateMethod(key, super().__getitem__(key))
+            else:
+                value = addValue
+            self._SetEntry(key, value)
+            return value
+
+
+    def ClearPushed(self) -> None:
+        """
+        Marks all pushed entries as regular entries, so that their maximum ages apply again.
+
+        This method is called when the notification connection that pushes entries into
+        the cache is closed, as the entries will no longer be kept current by the device.
+        """
+        with self._Lock:
+            self._PushedKeys.clear()
+
+
+    def CompareAndSet(self, key:SoundTouchUri, value, version:int) -> bool:
+        """
+        Stores an entry only if the entry was not changed since the given version.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+            value (object):
+                The value to store.
+            version (int):
+                The version of the entry that the value was derived from (as returned by the
+                `GetEntry` or `GetVersion` method), or None if the cache must not contain an
+                entry for the uri.
+
+        Returns:
+            True if the entry was stored; otherwise, False if the entry was changed (or removed)
+            by another thread in the meantime.
+        """
+        key = SoundTouchConfigurationCache._GetKey(key)
+        with self._Lock:
+            if self._Versions.get(key, None) != version:
+                return False
+            self._SetEntry(key, value)
+            return True
+
+
+    def DisablePersistence(self) -> None:
+        """
+        Stops persisting entries to the local file system.
+
+        The persistent cache file is not removed.
+        """
+        with self._PersistentLock:
+            self._PersistentEntries = None
+            self._PersistentPath = None
+
+
+    def EnablePersistence(self, path:str, paths:list=None, firmwareVersion:str=None) -> None:
+        """
+        Persists entries to the local file system, and restores them from it.
+
+        Args:
+            path (str):
+                Path of the file to persist entries to.
+            paths (list[str]):
+                Uri paths of the entries to persist.
+                Default is None, which uses the `DEFAULT_PERSISTENT_PATHS` values.
+            firmwareVersion (str):
+                Firmware version of the device; persisted entries are discarded if the
+                device firmware version changes.
+                Default is None.
+
+        The file is loaded on the first call to the `Restore` method (e.g. the first 
+        `SoundTouchClient.GetProperty` call), and is saved whenever a persisted entry is
+        changed by the `Persist` method.
+        """
+        if paths is None:
+            paths = SoundTouchConfigurationCache.DEFAULT_PERSISTENT_PATHS
+        with self._PersistentLock:
+            self._PersistentEntries = None
+            self._PersistentFirmwareVersion = firmwareVersion
+            self._PersistentPath = path
+            self._PersistentPaths = set([ SoundTouchConfigurationCache._GetKey(key) for key in paths ])
+
+
+    def GetAge(self, key:SoundTouchUri) -> float:
+        """
+        Returns the age (in seconds) of the cache entry for the given uri, or None if the
+        cache does not contain an entry for the uri.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+        """
+        timestamps:tuple = self._Timestamps.get(SoundTouchConfigurationCache._GetKey(key), None)
+        if timestamps is None:
+            return None
+        return time.monotonic() - timestamps[0]
+
+
+    def GetEntry(self, key:SoundTouchUri) -> tuple:
+        """
+        Returns the value and version of the cache entry for the given uri.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+
+        Returns:
+            A tuple of (value, version), or (None, None) if the cache does not contain an 
+            entry for the uri.
+        """
+        key = SoundTouchConfigurationCache._GetKey(key)
+        with self._Lock:
+            if not super().__contains__(key):
+                return None, None
+            return super().__getitem__(key), self._Versions.get(key, None)
+
+
+    def GetMaxAge(self, key:SoundTouchUri) -> float:
+        """
+        Returns the maximum age (in seconds) of cache entries for the given uri, or None if
+        the entries never expire.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) to get the maximum age for.
+        """
+        return self._MaxAges.get(SoundTouchConfigurationCache._GetKey(key), self._DefaultMaxAge)
+
+
+    def GetOrAdd(self, key:SoundTouchUri, valueFactory) -> object:
+        """
+        Returns the cache entry for the given uri, adding it if the cache does not contain 
+        an entry for the uri.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+            valueFactory (Callable[[str], object]):
+                A method that is called with the uri path, and returns the value to add.
+
+        Returns:
+            The existing value, or the value that was added.
+
+        The value factory is called without the cache being locked, so it can query the 
+        device; if another thread adds an entry for the uri in the meantime, then the 
+        value of that entry is returned and the created value is discarded.
+        """
+        key = SoundTouchConfigurationCache._GetKey(key)
+        with self._Lock:
+            if super().__contains__(key):
+                return super().__getitem__(key)
+
+        value = valueFactory(key)
+        with self._Lock:
+            if super().__contains__(key):
+                return super().__getitem__(key)
+            self._SetEntry(key, value)
+            return value
+
+
+    def GetSnapshot(self, keys:list=None) -> dict:
+        """
+        Returns a consistent copy of several cache entries at once.
+
+        Args:
+            keys (list[SoundTouchUri | str]):
+                The uri's (or uri paths) of the cache entries to copy.
+                Default is None, which copies all entries.
+
+        Returns:
+            A dictionary of values keyed by uri path; uri's that the cache does not contain
+            an entry for are not included.
+
+        The values are not copied, so the snapshot is cheap to create; all values are read
+        at the same point in time, so that no thread can change some of them in between.
+        """
+        with self._Lock:
+            if keys is None:
+                return dict(self.items())
+            result:dict = {}
+            for key in keys:
+                key = SoundTouchConfigurationCache._GetKey(key)
+                if super().__contains__(key):
+                    result[key] = super().__getitem__(key)
+            return result
+
+
+    def GetTimestamp(self, key:SoundTouchUri) -> float:
+        """
+        Returns the time (in seconds since the epoch) that the cache entry for the given uri
+        was stored, or None if the cache does not contain an entry for the uri.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+        """
+        timestamps:tuple = self._Timestamps.get(SoundTouchConfigurationCache._GetKey(key), None)
+        if timestamps is None:
+            return None
+        return timestamps[1]
+
+
+    def GetVersion(self, key:SoundTouchUri) -> int:
+        """
+        Returns the version of the cache entry for the given uri, or None if the cache does
+        not contain an entry for the uri.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+
+        Entry versions increase every time an entry is stored, so a higher version indicates
+        a more recently stored entry.
+        """
+        return self._Versions.get(SoundTouchConfigurationCache._GetKey(key), None)
+
+
+    def IsPushed(self, key:SoundTouchUri) -> bool:
+        """
+        Returns True if the cache entry for the given uri was pushed into the cache from a
+        device notification; otherwise, False.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+        """
+        return SoundTouchConfigurationCache._GetKey(key) in self._PushedKeys
+
+
+    def IsRefreshRequired(self, key:SoundTouchUri, refresh=None) -> bool:
+        """
+        Determines if the cache entry for the given uri must be refreshed from the device.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+            refresh (bool | float):
+                True to always refresh the entry; False to never refresh the entry (if it
+                exists); a number of seconds to refresh the entry if it is older than that;
+                or None to refresh the entry if it is older than the maximum age for the uri
+                (pushed entries are never refreshed).
+                Default is None.
+
+        Returns:
+            True if the entry does not exist in the cache, or must be refreshed;
+            otherwise, False.
+        """
+        key = SoundTouchConfigurationCache._GetKey(key)
+        if key not in self:
+            return True
+
+        if isinstance(refresh, bool):
+            return refresh
+        if refresh is None:
+            if key in self._PushedKeys:
+                return False
+            maxAge:float = self.GetMaxAge(key)
+        else:
+            maxAge:float = refresh
+
+        if maxAge is None:
+            return False
+        age:float = self.GetAge(key)
+        return (age is None) or (age >= maxAge)
+
+
+    def Persist(self, key:SoundTouchUri, data:bytes) -> None:
+        """
+        Persists the raw device response for the given uri to the local file system, if 
+        persistence is enabled for the uri.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+            data (bytes):
+                The raw device response that the cache entry was created from.
+
+        The file is only saved if the response differs from the persisted response.
+        """
+        if self._PersistentPath is None:
+            return
+        key = SoundTouchConfigurationCache._GetKey(key)
+        if (key not in self._PersistentPaths) or (not data):
+            return
+
+        with self._PersistentLock:
+            if self._PersistentPath is None:
+                return
+            if self._PersistentEntries is None:
+                self._PersistentCacheLoad()
+
+            xml:str = data.decode('utf-8')
+            entry:dict = self._PersistentEntries.get(key, None)
+            if (entry is not None) and (entry.get('xml', None) == xml):
+                return
+
+            self._PersistentEntries[key] = \
+            {
+                'version': SoundTouchConfigurationCache.PERSISTENT_CACHE_VERSION,
+                'stored_on': time.time(),
+                'xml': xml,
+            }
+            self._PersistentCacheStore()
+
+
+    def ResetMaxAge(self, key:SoundTouchUri) -> None:
+        """
+        Removes the maximum age for the given uri, so that the `DefaultMaxAge` value is used.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) to reset the maximum age for.
+        """
+        self._MaxAges.pop(SoundTouchConfigurationCache._GetKey(key), None)
+
+
+    def Restore(self, key:SoundTouchUri, classType) -> bool:
+        """
+        Restores the entry for the given uri from the local file system, if persistence is
+        enabled and the cache does not already contain an entry for the uri.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+            classType (type):
+                The configuration class type (e.g. Capabilities, SourceList, etc) to create
+                from the persisted device response.
+
+        Returns:
+            True if the entry was restored; otherwise, False.
+
+        A restored entry keeps the time that it was originally stored, so that its maximum
+        age applies across process restarts.
+        """
+        if self._PersistentPath is None:
+            return False
+        key = SoundTouchConfigurationCache._GetKey(key)
+        if (key not in self._PersistentPaths) or (key in self):
+            return False
+
+        with self._PersistentLock:
+            if self._PersistentPath is None:
+                return False
+            if self._PersistentEntries is None:
+                self._PersistentCacheLoad()
+
+            entry:dict = self._PersistentEntries.get(key, None)
+            if (entry is None) or (key in self):
+                return False
+
+            try:
+                config = classType(root=fromstring(entry['xml'].encode('utf-8')))
+            except Exception as ex:
+                _logsi.LogException("Persistent configuration cache entry '%s' could not be restored: %s" % (key, str(ex)), ex)
+                self._PersistentEntries.pop(key, None)
+                return False
+
+            # store the entry (unless another thread stored one in the meantime), preserving 
+            # the time that it was originally stored.
+            storedOn:float = float(entry.get('stored_on', 0))
+            with self._Lock:
+                if super().__contains__(key):
+                    return False
+                self._SetEntry(key, config, timestamps=(time.monotonic() - max(0, time.time() - storedOn), storedOn))
+
+            if _logsi.IsOn(SILevel.Verbose):
+                _logsi.LogVerbose("Persistent configuration cache entry '%s' restored" % (key))
+            return True
+
+
+    def SetFirmwareVersion(self, firmwareVersion:str) -> bool:
+        """
+        Sets the firmware version of the device that persisted entries are created from.
+
+        Args:
+            firmwareVersion (str):
+                Firmware version of the device.
+
+        Returns:
+            True if the firmware version changed; otherwise, False.
+
+        If the firmware version changed and persistence is enabled, then the persisted
+        entries are discarded (and the persistent cache file is removed), and the entries
+        of the persisted uri paths are removed from the cache, so that they are queried
+        from the device on the next request.
+        """
+        with self._PersistentLock:
+            if firmwareVersion == self._PersistentFirmwareVersion:
+                return False
+            self._PersistentFirmwareVersion = firmwareVersion
+            if self._PersistentPath is None:
+                return True
+
+            # discard the entries that were persisted from the previous firmware.
+            self._PersistentEntries = {}
+            try:
+                if os.path.exists(self._PersistentPath):
+                    os.remove(self._PersistentPath)
+            except Exception as ex:
+                _logsi.LogException("Persistent configuration cache file remove error (path=%s): %s" % (self._PersistentPath, str(ex)), ex)
+
+            for key in self._PersistentPaths:
+                self.pop(key, None)
+
+            _logsi.LogVerbose("Persistent configuration cache file discarded (firmware version changed to '%s') - path: %s" % (firmwareVersion, self._PersistentPath))
+            return True
+
+
+    def SetMaxAge(self, key:SoundTouchUri, seconds:float) -> None:
+        """
+        Sets the maximum age (in seconds) of cache entries for the given uri.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) to set the maximum age for.
+            seconds (float):
+                The maximum age (in seconds), or None if entries for the uri never expire.
+                Use the `ResetMaxAge` method to use the `DefaultMaxAge` value.
+        """
+        if (seconds is None) or (isinstance(seconds, (int, float)) and seconds >= 0):
+            self._MaxAges[SoundTouchConfigurationCache._GetKey(key)] = seconds
+
+
+    def SetPushed(self, key:SoundTouchUri, value) -> object:
+        """
+        Stores an entry that was pushed into the cache from a device notification.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+            value (object):
+                The configuration object to store.
+
+        Returns:
+            The previous value of the entry, or None if the cache did not contain an entry.
+        """
+        with self._Lock:
+            return self._SetEntry(SoundTouchConfigurationCache._GetKey(key), value, isPushed=True)
+
+
+    def SetValue(self, key:SoundTouchUri, value) -> object:
+        """
+        Stores an entry, and returns the previous value of the entry.
+
+        Args:
+            key (SoundTouchUri | str):
+                The uri (or uri path) of the cache entry.
+            value (object):
+                The configuration object to store.
+
+        Returns:
+            The previous value of the entry, or None if the cache did not contain an entry.
+        """
+        with self._Lock:
+            return self._SetEntry(SoundTouchConfigurationCache._GetKey(key), value)
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SoundTouchConfigurationCache:'
+        msg = '%s (%d items)' % (msg, len(self))
+        msg = '%s Version=%d' % (msg, self._Version)
+        msg = '%s DefaultMaxAge=%s' % (msg, self._DefaultMaxAge)
+        return msg
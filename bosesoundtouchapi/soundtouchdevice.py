@@ -1,13 +1,20 @@
 # external package imports.
 import re
 import telnetlib 
+import threading
+from typing import Callable
+import weakref
 from urllib3 import PoolManager, ProxyManager, Timeout, HTTPResponse
+from urllib3.exceptions import HTTPError
 from xml.etree.ElementTree import Element, fromstring
 
 # our package imports.
 from .bstappmessages import BSTAppMessages
-from .bstutils import export
+from .bstutils import export, SingleFlight
+from .soundtouchcircuitbreaker import SoundTouchCircuitBreaker
 from .soundtoucherror import SoundTouchError
+from .soundtouchtimeoutpolicy import SoundTouchDeadline, SoundTouchTimeoutPolicy
+from .soundtouchtransport import SoundTouchTransport
 from .models import Component, Information, InformationNetworkInfo, SupportedUrls, SupportedUrl
 from .uri.soundtouchnodes import SoundTouchNodes
 from .uri.soundtouchuri import SoundTouchUri, SoundTouchUriTypes
@@ -26,6 +33,9 @@ _logsi.SystemLogger = logging.getLogger(__name__)
 
 RE_IPV4_ADDRESS = r"\d{1,3}([.]\d{1,3}){3}"
 
+DEVICE_DESCRIPTOR_VERSION:int = 1
+""" Version number of the dictionary format returned by `SoundTouchDevice.ToDescriptor`. """
+
 @export
 class SoundTouchDevice:
     """
@@ -44,7 +54,8 @@ class SoundTouchDevice:
     Click the **Sample Code** links in the individual methods for sample code examples.
     """
 
-    def __init__(self, host:str, connectTimeout:int=30, proxyManager:ProxyManager=None, port:int=8090) -> None:
+    def __init__(self, host:str, connectTimeout:int=30, proxyManager:ProxyManager=None, port:int=8090,
+                 transport:SoundTouchTransport=None) -> None:
         """
         Initializes a new instance of the class.
         
@@ -55,14 +66,18 @@ class SoundTouchDevice:
             connectTimeout (int):
                 Controls how long (in seconds) a connection request is allowed to run 
                 before being aborted.  
-                Only used if the proxy argument is null (e.g. default proxy manager is used).  
                 Default is 30 seconds.
             proxyManager (Optional[urllib3.ProxyManager]):
                 If a custom proxy should be used, it can be specified here;
-                otherwise, a default urllib3.PoolManager is used for http requests / responses.
+                otherwise, the shared transport is used for http requests / responses.
             port (int):
                 IPV4 port number the Bose WebAPI is listening on for incoming requests on the device.
                 Default is 8090, the standard WebAPI port number.
+            transport (SoundTouchTransport):
+                The shared transport to use for http requests / responses.
+                Default is None, which uses the process-wide default transport returned by
+                `SoundTouchTransport.GetDefault()`.  
+                Ignored if the proxyManager argument is specified.
                 
         Raises:
             SoundTouchError:
@@ -81,14 +96,7 @@ class SoundTouchDevice:
         ```
         </details>
         """
-        self._ConnectTimeout:int = connectTimeout
-        self._Information:Information = Information()
-        self._Host:str = host
-        self._Port:int = int(port)
-        self._SupportedUris:list[SoundTouchUri] = []
-        self._SupportedUrls:SupportedUrls = None
-        self._UnknownUrlNames:list[str] = []
-        self._UnSupportedUrlNames:list[str] = []
+        self._Initialize(host, connectTimeout, proxyManager, port, transport)
 
         try:
 
@@ -98,71 +106,12 @@ class SoundTouchDevice:
             if (host is None) or (not re.match(RE_IPV4_ADDRESS, host)):
                 raise SoundTouchError(BSTAppMessages.BST_HOST_ADDRESS_INVALID % (host), None, _logsi)
 
-            # assign the proxy manager used for http requests and responses.
-            manager = proxyManager 
-            if proxyManager is None:
-        
-                # create new pool manager with specified timeouts and limits.
-                # note that we do not need many connections for the device class, as client will
-                # be the heavy lifter and consuming the most connections.
-                timeout = Timeout(connect=float(connectTimeout), read=None)
-                manager = PoolManager(headers={'User-Agent': 'BoseSoundTouchApi/1.0.0'},
-                                      timeout=timeout,
-                                      num_pools=10,   # number of connection pools to allocate.
-                                      maxsize=5,      # maximum number of connections to keep in the pool.
-                                      block=True      # limit number of connections to the device.
-                                     )
-        
             # get SoundTouch device information; if it fails then we are done.
-            _logsi.LogVerbose("Retrieving SoundTouch device information.")
-            reqUrl:str = f'http://{host}:{port}/info'
-            response:HTTPResponse = manager.request('GET', reqUrl)
-            if response.status != 200:
-                raise SoundTouchError("Could not retrieve SoundTouch device info: (%s) - '%s'" % (response.status, reqUrl), None, _logsi)
-
-            # convert xml string response to xmltree Element and create information object.
-            info:Element = fromstring(response.data)
-            self._Information:Information = Information(root=info)
-            response.close()
+            self._LoadInformation(self._RequestXml('info', "Could not retrieve SoundTouch device info"))
         
             # get SoundTouch supported url information; if it fails then we are done.
-            _logsi.LogVerbose("Retrieving SoundTouch device supported URI list.")
-            reqUrl:str = f'http://{host}:{port}/supportedURLs'
-            response:HTTPResponse = manager.request('GET', reqUrl)
-            if response.status != 200:
-                raise SoundTouchError("Could not retrieve SoundTouch device supported urls: (%s) - '%s'" % (response.status, reqUrl), None, _logsi)
-            
-            # load supported url's list.
-            elmNode:Element = fromstring(response.data)
-            self._SupportedUrls = SupportedUrls(root=elmNode)
-
-            # get list of ALL supported SoundTouch uri's that are possible regardless of device type.
-            # we will add all of the 'request' type names to the UnSupportedUrlNames list, then 
-            # filter them out below based upon what is returned by the device '/supportedUrls' call.  
-            # this will leave a list of 'request' type names that are NOT supported by the device.
-            allUris:dict = SoundTouchNodes._AllUris
-            EVENT_TYPE:str = SoundTouchUriTypes.OP_TYPE_EVENT.name
-            for name in allUris.keys():
-                uri:SoundTouchUri = allUris[name]
-                if uri.UriType != EVENT_TYPE:
-                    self._UnSupportedUrlNames.append(name)
-        
-            # load the list of SoundTouch uri's that THIS device supports.
-            # it could be everything in the ALL supported uri's list, but probably not as
-            # SoundTouch devices can support different features.
-            url:SupportedUrl
-            for url in self._SupportedUrls.Urls:
-                name:str = url.Location[1:]               # drop the forward slash prefix.
-                if name in allUris:
-                    if name in self._UnSupportedUrlNames: # in case the name is listed multiple times.
-                        self._UnSupportedUrlNames.remove(name)
-                        self._SupportedUris.append(allUris[name])
-                else:
-                    if name not in self._UnknownUrlNames: # in case the name is listed multiple times.
-                        self._UnknownUrlNames.append(name)
-
-            response.close()
-            
+            self._LoadSupportedUrls(self._RequestXml('supportedURLs', "Could not retrieve SoundTouch device supported urls"))
+
             if _logsi.IsOn(SILevel.Verbose):
                 _logsi.LogObject(SILevel.Verbose, "SoundTouch Device object: '%s' (%s)" % (self.DeviceName, self.Host), self)
                 
@@ -185,6 +134,25 @@ class SoundTouchDevice:
         return iter(self.Components)
 
 
+    @property
+    def CircuitBreaker(self) -> SoundTouchCircuitBreaker:
+        """
+        The circuit breaker that tracks the health of the device, and fails requests
+        immediately while the device is not responding.
+
+        The circuit breaker is shared by all clients of the device.
+        """
+        return self._CircuitBreaker
+
+    @CircuitBreaker.setter
+    def CircuitBreaker(self, value:SoundTouchCircuitBreaker):
+        """
+        Sets the CircuitBreaker property value.
+        """
+        if isinstance(value, SoundTouchCircuitBreaker):
+            self._CircuitBreaker = value
+
+
     @property
     def Components(self) -> list[Component]:
         """
@@ -198,8 +166,8 @@ class SoundTouchDevice:
     def ConnectTimeout(self) -> int:
         """ 
         Controls how long (in seconds) a connection request is allowed to run before being aborted.  
-        Only valid if the proxy argument is null (e.g. default proxy manager is used) on the class
-        constructor.
+
+        This is the initial `TimeoutPolicy.ConnectTimeout` value.
         """
         return self._ConnectTimeout
 
@@ -234,6 +202,18 @@ class SoundTouchDevice:
         return self._Information._DeviceType
 
 
+    @property
+    def FirmwareVersion(self) -> str:
+        """
+        Software version of the device's SCM component (e.g. '27.0.6.46330.5043500 epdbuild...'),
+        or None if the device did not report one.
+        """
+        for component in self.Components:
+            if component.ComponentCategory == 'SCM':
+                return component.SoftwareVersion
+        return None
+
+
     @property
     def Host(self) -> str:
         """ 
@@ -338,6 +318,36 @@ class SoundTouchDevice:
         return f'http://{self.Host}/pts.dat'
 
 
+    @property
+    def TimeoutPolicy(self) -> SoundTouchTimeoutPolicy:
+        """ 
+        The timeout policy that determines the connect and read timeouts of requests to
+        the device, based upon the uri being requested.
+
+        The timeout policy is shared by all clients of the device.
+        """
+        return self._TimeoutPolicy
+
+    @TimeoutPolicy.setter
+    def TimeoutPolicy(self, value:SoundTouchTimeoutPolicy):
+        """
+        Sets the TimeoutPolicy property value.
+        """
+        if isinstance(value, SoundTouchTimeoutPolicy):
+            self._TimeoutPolicy = value
+
+
+    @property
+    def Transport(self) -> SoundTouchTransport:
+        """ 
+        The transport used for http requests / responses to the device.
+
+        Clients created for this device will use the same transport, unless a custom pool 
+        manager is specified on the client constructor.
+        """
+        return self._Transport
+
+
     @property
     def UnknownUrlNames(self) -> list[str]:
         """
@@ -388,6 +398,185 @@ class SoundTouchDevice:
         return self._Information._VariantMode
 
 
+    def _Initialize(self, host:str, connectTimeout:int, proxyManager:ProxyManager, port:int, transport:SoundTouchTransport) -> None:
+        """
+        Initializes internal storage and the transport used for http requests and responses.
+        
+        No network i/o is performed by this method.
+        """
+        self._CircuitBreaker:SoundTouchCircuitBreaker = SoundTouchCircuitBreaker()
+        self._Clients:weakref.WeakSet = weakref.WeakSet()
+        self._ConnectTimeout:int = connectTimeout
+        self._Information:Information = Information()
+        self._InformationXml:bytes = None
+        self._Host:str = host
+        self._Port:int = int(port)
+        self._RevalidateLock:threading.Lock = threading.Lock()
+        self._SingleFlight:SingleFlight = SingleFlight(SoundTouchDeadline.GetRemaining)
+        self._SupportedUris:list[SoundTouchUri] = []
+        self._SupportedUrls:SupportedUrls = None
+        self._SupportedUrlsXml:bytes = None
+        self._TimeoutPolicy:SoundTouchTimeoutPolicy = SoundTouchTimeoutPolicy(connectTimeout=connectTimeout)
+        self._Transport:SoundTouchTransport = None
+        self._UnknownUrlNames:list[str] = []
+        self._UnSupportedUrlNames:list[str] = []
+
+        # assign the transport used for http requests and responses.
+        # if a custom proxy manager was specified, then it gets a transport of its own
+        # (without connection caps) so that its settings are honored; otherwise, the
+        # shared transport is used so that connections are pooled across all devices.
+        if proxyManager is not None:
+            self._Transport = SoundTouchTransport(maxConnections=None, maxConnectionsPerHost=None, manager=proxyManager)
+        else:
+            self._Transport = transport or SoundTouchTransport.GetDefault()
+
+
+    def _LoadInformation(self, xmlData:bytes) -> None:
+        """
+        Loads device information from the xml response of the `/info` request.
+        """
+        info:Element = fromstring(xmlData)
+        self._Information = Information(root=info)
+        self._InformationXml = xmlData
+
+
+    def _LoadSupportedUrls(self, xmlData:bytes) -> None:
+        """
+        Loads the supported url's list from the xml response of the `/supportedURLs` request,
+        and builds the supported uri, unsupported url name and unknown url name lists.
+        """
+        elmNode:Element = fromstring(xmlData)
+        supportedUrls:SupportedUrls = SupportedUrls(root=elmNode)
+        supportedUris:list[SoundTouchUri] = []
+        unknownUrlNames:list[str] = []
+        unSupportedUrlNames:list[str] = []
+
+        # get list of ALL supported SoundTouch uri's that are possible regardless of device type.
+        # we will add all of the 'request' type names to the UnSupportedUrlNames list, then 
+        # filter them out below based upon what is returned by the device '/supportedUrls' call.  
+        # this will leave a list of 'request' type names that are NOT supported by the device.
+        allUris:dict = SoundTouchNodes._AllUris
+        EVENT_TYPE:str = SoundTouchUriTypes.OP_TYPE_EVENT.name
+        for name in allUris.keys():
+            uri:SoundTouchUri = allUris[name]
+            if uri.UriType != EVENT_TYPE:
+                unSupportedUrlNames.append(name)
+        
+        # load the list of SoundTouch uri's that THIS device supports.
+        # it could be everything in the ALL supported uri's list, but probably not as
+        # SoundTouch devices can support different features.
+        url:SupportedUrl
+        for url in supportedUrls.Urls:
+            name:str = url.Location[1:]               # drop the forward slash prefix.
+            if name in allUris:
+                if name in unSupportedUrlNames:       # in case the name is listed multiple times.
+                    unSupportedUrlNames.remove(name)
+                    supportedUris.append(allUris[name])
+            else:
+                if name not in unknownUrlNames:       # in case the name is listed multiple times.
+                    unknownUrlNames.append(name)
+
+        self._SupportedUrls = supportedUrls
+        self._SupportedUrlsXml = xmlData
+        self._SupportedUris = supportedUris
+        self._UnknownUrlNames = unknownUrlNames
+        self._UnSupportedUrlNames = unSupportedUrlNames
+
+
+    def _RequestXml(self, path:str, errorText:str) -> bytes:
+        """
+        Issues a GET request for the specified device path, and returns the raw xml response.
+        """
+        if _logsi.IsOn(SILevel.Verbose):
+            _logsi.LogVerbose("Retrieving SoundTouch device '%s' data." % path)
+        reqUrl:str = f'http://{self._Host}:{self._Port}/{path}'
+        timeout, isDeadlineBound = self._TimeoutPolicy.GetTimeout(path, self._Host)
+        self._CircuitBreaker.Check(self._Host)
+        try:
+            response:HTTPResponse = self._Transport.Request('GET', reqUrl, timeout=timeout, retries=self._TimeoutPolicy.GetRetries(isDeadlineBound))
+        except HTTPError as ex:
+            if isDeadlineBound:
+                self._CircuitBreaker.RecordIgnored()
+            else:
+                self._CircuitBreaker.RecordFailure(ex)
+            raise
+        except BaseException:
+            self._CircuitBreaker.RecordIgnored()
+            raise
+        self._CircuitBreaker.RecordSuccess()
+        if response.status != 200:
+            raise SoundTouchError("%s: (%s) - '%s'" % (errorText, response.status, reqUrl), None, _logsi)
+        xmlData:bytes = response.data
+        response.close()
+        return xmlData
+
+
+    @staticmethod
+    def FromDescriptor(descriptor:dict, proxyManager:ProxyManager=None, transport:SoundTouchTransport=None) -> 'SoundTouchDevice':
+        """
+        Creates a new device instance from a descriptor that was previously returned by the 
+        `ToDescriptor` method, without performing any network i/o.
+        
+        Args:
+            descriptor (dict):
+                Device descriptor dictionary, as returned by the `ToDescriptor` method.
+            proxyManager (Optional[urllib3.ProxyManager]):
+                If a custom proxy should be used, it can be specified here;
+                otherwise, the shared transport is used for http requests / responses.
+            transport (SoundTouchTransport):
+                The shared transport to use for http requests / responses.
+                Default is None, which uses the process-wide default transport.
+                
+        Returns:
+            A `SoundTouchDevice` instance.
+                
+        Raises:
+            SoundTouchError:
+                SoundTouch device descriptor is not valid or is not a supported version.  
+                SoundTouch host address is not recognized as a valid IPV4 network address.  
+                
+        Since the descriptor may be stale (e.g. the device firmware was updated since it was 
+        saved), call the `StartRevalidation` method to verify the descriptor against the device
+        in the background once the device is reachable.
+        """
+        if (not isinstance(descriptor, dict)) or (descriptor.get('version', None) != DEVICE_DESCRIPTOR_VERSION):
+            raise SoundTouchError(BSTAppMessages.BST_DEVICE_DESCRIPTOR_INVALID % ("unsupported version"), logsi=_logsi)
+
+        host:str = descriptor.get('host', None)
+        if (host is None) or (not re.match(RE_IPV4_ADDRESS, host)):
+            raise SoundTouchError(BSTAppMessages.BST_HOST_ADDRESS_INVALID % (host), None, _logsi)
+
+        try:
+
+            _logsi.LogVerbose("Initializing SoundTouch device '%s' from descriptor." % host)
+
+            device:SoundTouchDevice = SoundTouchDevice.__new__(SoundTouchDevice)
+            device._Initialize(host, 
+                               int(descriptor.get('connect_timeout', 30)), 
+                               proxyManager, 
+                               int(descriptor.get('port', 8090)),
+                               transport)
+
+            # load device information and supported url's from the persisted device responses.
+            device._LoadInformation(descriptor['information'].encode('utf-8'))
+            device._LoadSupportedUrls(descriptor['supported_urls'].encode('utf-8'))
+
+            # supported uri and url name lists are restored as they were persisted, in case the
+            # uri's known to this package have changed since the descriptor was saved.
+            urisByPath:dict = { uri.Path: uri for uri in SoundTouchNodes._AllUris.values() }
+            device._SupportedUris = [ urisByPath[path] for path in descriptor['supported_uris'] if path in urisByPath ]
+            device._UnknownUrlNames = list(descriptor['unknown_url_names'])
+            device._UnSupportedUrlNames = list(descriptor['unsupported_url_names'])
+
+            return device
+
+        except SoundTouchError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+        
+            # format descriptor exception.
+            raise SoundTouchError(BSTAppMessages.BST_DEVICE_DESCRIPTOR_INVALID % (str(ex)), logsi=_logsi)
+
+
     def GetComponents(self, componentCategory:str) -> Component:
         """
         Iterates over all components discovered at class initialization that match 
@@ -470,6 +659,114 @@ class SoundTouchDevice:
         return response
         
         
+    def Revalidate(self) -> bool:
+        """
+        Verifies the device information against the device, and reloads the supported url's
+        list if the device firmware has changed.
+        
+        Returns:
+            True if the device firmware has changed (and supported url's were reloaded);
+            otherwise, False.
+
+        The `info` (and `supportedURLs`, if reloaded) configurations that are cached by the
+        clients of this device are replaced with the revalidated values.  If the firmware has
+        changed, then configurations that the clients persisted from the previous firmware
+        are discarded (see `SoundTouchConfigurationCache.SetFirmwareVersion`).
+                
+        Raises:
+            SoundTouchError:
+                Could not retrieve SoundTouch device information.  
+                Could not retrieve SoundTouch device supported urls.  
+                If the method fails for any other reason.
+                
+        This method is typically used for devices that were created by the `FromDescriptor`
+        method; use the `StartRevalidation` method to revalidate in the background.
+        """
+        try:
+
+            with self._RevalidateLock:
+
+                _logsi.LogVerbose("Revalidating SoundTouch device '%s' (%s)." % (self.DeviceName, self.Host))
+
+                oldVersion:str = self.FirmwareVersion
+                self._LoadInformation(self._RequestXml('info', "Could not retrieve SoundTouch device info"))
+                isChanged:bool = (self.FirmwareVersion != oldVersion)
+
+                if isChanged:
+                    _logsi.LogMessage("SoundTouch device '%s' (%s) firmware changed from '%s' to '%s'; reloading supported urls." % (self.DeviceName, self.Host, oldVersion, self.FirmwareVersion))
+                    self._LoadSupportedUrls(self._RequestXml('supportedURLs', "Could not retrieve SoundTouch device supported urls"))
+
+                # replace the configurations that clients cached from the previous values; if
+                # the firmware changed, then configurations persisted from the previous firmware
+                # are discarded as well.
+                for client in list(self._Clients):
+                    client.ConfigurationCache.SetFirmwareVersion(self.FirmwareVersion)
+                    client.ConfigurationCache[SoundTouchNodes.info.Path] = self._Information
+                    if isChanged:
+                        client.ConfigurationCache[SoundTouchNodes.supportedURLs.Path] = self._SupportedUrls
+                return isChanged
+
+        except SoundTouchError: raise  # pass handled exceptions on thru
+        except Exception as ex:
+        
+            # format unhandled exception.
+            raise SoundTouchError(BSTAppMessages.UNHANDLED_EXCEPTION.format("SoundTouchDevice.Revalidate", str(ex)), logsi=_logsi)
+
+
+    def StartRevalidation(self, onChanged:Callable[['SoundTouchDevice'], None]=None) -> threading.Thread:
+        """
+        Starts a background (daemon) thread that calls the `Revalidate` method.
+        
+        Args:
+            onChanged (Callable[[SoundTouchDevice], None]):
+                Method to call if the device firmware has changed; the device instance is
+                passed as the only argument.  
+                Default is None.
+                
+        Returns:
+            The thread that is performing the revalidation.
+                
+        Exceptions raised by the revalidation are logged, and are not passed to the caller.
+        """
+        def _Revalidate() -> None:
+            try:
+                if self.Revalidate() and (onChanged is not None):
+                    onChanged(self)
+            except Exception as ex:
+                _logsi.LogException("SoundTouch device '%s' revalidation failed: %s" % (self.Host, str(ex)), ex)
+
+        thread:threading.Thread = threading.Thread(target=_Revalidate, name='SoundTouchDeviceRevalidate_%s' % self.Host, daemon=True)
+        thread.start()
+        return thread
+
+
+    def ToDescriptor(self) -> dict:
+        """
+        Returns a descriptor dictionary that can be used to re-create the device instance 
+        with the `FromDescriptor` method, without any network i/o.
+        
+        Returns:
+            A dictionary that contains the device host, port, raw device information and
+            supported url's responses, and the supported uri / unsupported url / unknown url
+            name lists.  The dictionary only contains basic types, and can be serialized with
+            `json.dumps`.
+        """
+        result:dict = \
+        {
+            'version': DEVICE_DESCRIPTOR_VERSION,
+            'host': self._Host,
+            'port': self._Port,
+            'connect_timeout': self._ConnectTimeout,
+            'firmware_version': self.FirmwareVersion,
+            'information': self._InformationXml.decode('utf-8') if self._InformationXml is not None else None,
+            'supported_urls': self._SupportedUrlsXml.decode('utf-8') if self._SupportedUrlsXml is not None else None,
+            'supported_uris': [ uri.Path for uri in self._SupportedUris ],
+            'unknown_url_names': list(self._UnknownUrlNames),
+            'unsupported_url_names': list(self._UnSupportedUrlNames),
+        }
+        return result
+
+
     def ToDictionary(self) -> dict:
         """
         Returns a dictionary representation of the class.
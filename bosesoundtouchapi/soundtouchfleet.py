@@ -0,0 +1,308 @@
+# external package imports.
+from queue import Queue, Empty
+import threading
+import time
+
+# our package imports.
+from .bstappmessages import BSTAppMessages
+from .bstutils import export
+from .soundtouchclient import SoundTouchClient
+from .soundtouchdevice import SoundTouchDevice
+from .soundtoucherror import SoundTouchError
+from .soundtouchtransport import SoundTouchTransport
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+@export
+class SoundTouchFleet:
+    """
+    This class contains methods used to initialize `SoundTouchDevice` and `SoundTouchClient`
+    instances for many SoundTouch devices concurrently.
+
+    Devices are initialized in parallel on a bounded pool of worker threads, and each device
+    is given its own deadline; a device that does not respond in time (e.g. it is powered off
+    or unplugged) is reported as a failure without delaying the other devices.  A complete
+    fleet is ready in roughly the time it takes to initialize the slowest reachable device.
+
+    Click the **Sample Code** links in the individual methods for sample code examples.
+    """
+
+    def __init__(self, maxWorkers:int=16, timeout:float=10, raiseErrors:bool=True, transport:SoundTouchTransport=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxWorkers (int):
+                Maximum number of devices to initialize concurrently.
+                Default is 16.
+            timeout (float):
+                Maximum amount of time (in seconds) that a single device is allowed to take
+                to initialize, measured from the time its initialization starts.  This value
+                is also used as the device connect timeout.
+                Default is 10 seconds.
+            raiseErrors (bool):
+                Value to pass to the `SoundTouchClient` raiseErrors argument for clients
+                that are created.
+                Default is True.
+            transport (SoundTouchTransport):
+                The shared transport to use for http requests / responses.
+                Default is None, which uses the process-wide default transport.
+        """
+        # validations.
+        if (maxWorkers is None) or (maxWorkers < 1):
+            maxWorkers = 1
+        if (timeout is None) or (timeout <= 0):
+            timeout = 10
+
+        # initialize instance properties.
+        self._Clients:dict = {}
+        self._ElapsedSeconds:float = 0
+        self._Failures:dict = {}
+        self._MaxWorkers:int = int(maxWorkers)
+        self._RaiseErrors:bool = raiseErrors
+        self._Timeout:float = float(timeout)
+        self._Transport:SoundTouchTransport = transport
+
+
+    def __getitem__(self, key) -> SoundTouchClient:
+        return self._Clients.get(key, None)
+
+
+    def __iter__(self):
+        return iter(self._Clients.values())
+
+
+    def __len__(self) -> int:
+        return len(self._Clients)
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def Clients(self) -> dict:
+        """
+        A dictionary of `SoundTouchClient` instances for devices that were successfully
+        initialized by the last call to the `Initialize` method.
+
+        Dictionary keys will be the host values that were passed to the `Initialize` method,
+        and are in the same order.
+        """
+        return self._Clients
+
+
+    @property
+    def ElapsedSeconds(self) -> float:
+        """
+        Amount of time (in seconds) that the last call to the `Initialize` method took.
+        """
+        return self._ElapsedSeconds
+
+
+    @property
+    def Failures(self) -> dict:
+        """
+        A dictionary of devices that could not be initialized by the last call to the
+        `Initialize` method.
+
+        Dictionary keys will be the host values that were passed to the `Initialize` method.
+
+        Dictionary values will be the `SoundTouchError` exception that describes why the
+        device could not be initialized.
+        """
+        return self._Failures
+
+
+    @property
+    def MaxWorkers(self) -> int:
+        """
+        Maximum number of devices to initialize concurrently.
+        """
+        return self._MaxWorkers
+
+
+    @property
+    def Timeout(self) -> float:
+        """
+        Maximum amount of time (in seconds) that a single device is allowed to take to initialize.
+        """
+        return self._Timeout
+
+
+    def _InitializeClient(self, host:str, port:int, descriptor:dict, revalidate:bool) -> SoundTouchClient:
+        """
+        Initializes a device and client for a single host.
+        """
+        if descriptor is not None:
+            device:SoundTouchDevice = SoundTouchDevice.FromDescriptor(descriptor, transport=self._Transport)
+            if revalidate:
+                device.StartRevalidation()
+        else:
+            device:SoundTouchDevice = SoundTouchDevice(host, connectTimeout=self._Timeout, port=port, transport=self._Transport)
+
+        return SoundTouchClient(device, raiseErrors=self._RaiseErrors, transport=self._Transport)
+
+
+    def Initialize(self, hosts:list[str], port:int=8090, descriptors:dict=None, revalidate:bool=True) -> dict:
+        """
+        Initializes a `SoundTouchDevice` and `SoundTouchClient` instance for each host
+        concurrently.
+
+        Args:
+            hosts (list[str]):
+                A list of device hosts to initialize; each host is an ipv4 address, optionally
+                followed by a colon and port number (e.g. "192.168.1.81", "192.168.1.82:8090").
+            port (int):
+                Port number to use for hosts that do not specify a port number.
+                Default is 8090, the standard WebAPI port number.
+            descriptors (dict):
+                A dictionary of device descriptors (as returned by `SoundTouchDevice.ToDescriptor`)
+                keyed by host value.  Devices that have a descriptor are created without any
+                network i/o.
+                Default is None.
+            revalidate (bool):
+                True to revalidate devices that are created from a descriptor in the background;
+                otherwise, False.
+                Default is True.
+
+        Returns:
+            A dictionary of successfully initialized `SoundTouchClient` instances, keyed by host;
+            this is the same value as the `Clients` property.  Hosts that failed to initialize
+            are listed in the `Failures` property.
+
+        Devices that do not complete initialization within the `Timeout` value are reported
+        as failures; their initialization continues on a background (daemon) thread, but the 
+        result is discarded.
+        """
+        if descriptors is None:
+            descriptors = {}
+        hosts = list(dict.fromkeys(hosts))   # remove duplicates, preserving order.
+
+        _logsi.LogVerbose("Initializing SoundTouch fleet of %d devices (maxWorkers=%d, timeout=%s)." % (len(hosts), self._MaxWorkers, self._Timeout))
+        startTime:float = time.monotonic()
+
+        condition:threading.Condition = threading.Condition()
+        hostQueue:Queue = Queue()
+        results:dict = {}
+        startTimes:dict = {}
+        for host in hosts:
+            hostQueue.put(host)
+
+        def _Worker() -> None:
+            while True:
+                try:
+                    host:str = hostQueue.get_nowait()
+                except Empty:
+                    return
+
+                with condition:
+                    startTimes[host] = time.monotonic()
+                    condition.notify_all()
+
+                try:
+                    hostAddress:str = host
+                    hostPort:int = port
+                    if ':' in host:
+                        hostAddress, hostPort = host.split(':', 1)
+                    result = self._InitializeClient(hostAddress, int(hostPort), descriptors.get(host, None), revalidate)
+                except SoundTouchError as ex:
+                    result = ex
+                except Exception as ex:
+                    result = SoundTouchError(BSTAppMessages.UNHANDLED_EXCEPTION.format("SoundTouchFleet.Initialize", str(ex)), logsi=_logsi)
+
+                with condition:
+                    # if the device timed out, then the result was already reported as a failure;
+                    # in that case, this worker is no longer counted, so do not start another device.
+                    if host in results:
+                        return
+                    results[host] = result
+                    condition.notify_all()
+
+        def _StartWorker() -> None:
+            thread:threading.Thread = threading.Thread(target=_Worker, name='SoundTouchFleet', daemon=True)
+            thread.start()
+
+        # start the workers; note that workers are daemon threads, so that a device that
+        # stops responding cannot prevent the process from ending.
+        for _ in range(min(self._MaxWorkers, len(hosts))):
+            _StartWorker()
+
+        # wait for devices to initialize, enforcing the deadline of each device that
+        # has started initializing.
+        with condition:
+            while len(results) < len(hosts):
+
+                now:float = time.monotonic()
+                waitTime:float = self._Timeout
+                for host, hostStartTime in startTimes.items():
+                    if host in results:
+                        continue
+                    remaining:float = hostStartTime + self._Timeout - now
+                    if remaining <= 0:
+                        results[host] = SoundTouchError(BSTAppMessages.BST_DEVICE_INITIALIZE_TIMEOUT % (host, self._Timeout), logsi=_logsi)
+                        # replace the worker that is stuck on the timed out device.
+                        if not hostQueue.empty():
+                            _StartWorker()
+                    else:
+                        waitTime = min(waitTime, remaining)
+
+                if len(results) < len(hosts):
+                    condition.wait(timeout=waitTime)
+
+        # build results in the order the hosts were specified.
+        self._Clients = {}
+        self._Failures = {}
+        for host in hosts:
+            result = results[host]
+            if isinstance(result, SoundTouchClient):
+                self._Clients[host] = result
+            else:
+                self._Failures[host] = result
+
+        self._ElapsedSeconds = time.monotonic() - startTime
+        _logsi.LogVerbose("Initialized SoundTouch fleet in %.3f seconds: %d clients, %d failures." % (self._ElapsedSeconds, len(self._Clients), len(self._Failures)))
+        return self._Clients
+
+
+    def ToDescriptors(self) -> dict:
+        """
+        Returns a dictionary of device descriptors for all initialized clients, keyed by host.
+
+        The returned dictionary can be persisted, and passed to the `Initialize` method
+        descriptors argument to initialize the fleet without any network i/o.
+        """
+        return { host: client.Device.ToDescriptor() for host, client in self._Clients.items() }
+
+
+    def ToString(self, includeItems:bool=False) -> str:
+        """
+        Returns a displayable string representation of the class.
+
+        Args:
+            includeItems (bool):
+                True to include all items in the list; otherwise False to only
+                include the base list.
+        """
+        msg:str = 'SoundTouchFleet:'
+        msg = "%s (%d clients, %d failures)" % (msg, len(self._Clients), len(self._Failures))
+        msg = "%s ElapsedSeconds=%.3f" % (msg, self._ElapsedSeconds)
+
+        if includeItems == True:
+            for host, client in self._Clients.items():
+                msg = "%s\n- %s - %s" % (msg, host, client.Device.DeviceName)
+            for host, ex in self._Failures.items():
+                msg = "%s\n- %s - FAILED: %s" % (msg, host, ex.Message)
+
+        return msg
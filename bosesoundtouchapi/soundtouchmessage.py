@@ -31,6 +31,7 @@ class SoundTouchMessage:
         self._Uri = uri
         self._XmlMessage = xmlMessage
         self._Response = response
+        self._ResponseData = None
 
       
     def __repr__(self) -> str:
@@ -74,6 +75,22 @@ class SoundTouchMessage:
             self._Response = value
         
 
+    @property
+    def ResponseData(self) -> bytes:
+        """ 
+        Returns the raw device response data, as received from the device. 
+        """
+        return self._ResponseData
+
+    @ResponseData.setter
+    def ResponseData(self, value:bytes):
+        """ 
+        Sets the ResponseData property value.
+        """
+        if isinstance(value, bytes):
+            self._ResponseData = value
+
+
     @property
     def Uri(self) -> str: 
         """ 
@@ -0,0 +1,339 @@
+# external package imports.
+from collections import OrderedDict
+import threading
+import time
+
+# our package imports.
+from .bstutils import export
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+class _SoundTouchNavigateCacheEntry:
+    """
+    A cached navigation result.
+    """
+
+    __slots__ = ('CreatedAt', 'Size', 'Source', 'SourceAccount', 'Value')
+
+    def __init__(self, value, size:int, source:str, sourceAccount:str) -> None:
+        self.CreatedAt:float = time.monotonic()
+        self.Size:int = size
+        self.Source:str = source
+        self.SourceAccount:str = sourceAccount
+        self.Value = value
+
+
+@export
+class SoundTouchNavigateCache:
+    """
+    A bounded least-recently-used cache of music library / music service navigation results
+    (e.g. `SoundTouchClient.GetMusicLibraryItems`, `SoundTouchClient.GetMusicServiceStations`).
+
+    Results are keyed by the normalized navigate criteria (source, source account, container,
+    start item, number of items, etc), so that identical requests (e.g. when navigating back
+    to a previous container) are answered without querying the device.  Results expire after
+    `TimeToLive` seconds, and the least-recently-used results are discarded once the cache
+    holds more than `MaxItems` results or more than `MaxBytes` bytes of device responses.
+
+    The cache is cleared when the device reports that its sources changed (see the
+    `SoundTouchWebSocket` class), and results for a source are discarded when a station is
+    added to or removed from the source; use the `Invalidate` method to discard results
+    explicitly.
+
+    Cached results are returned as-is (they are not copied), so they should not be changed
+    by the caller (e.g. sorting the `NavigateResponse.Items` list in place).
+
+    Threadsafety:
+        This class is fully thread-safe.
+
+    <details>
+      <summary>Sample Code</summary>
+    ```python
+    .. include:: ../docs/include/samplecode/SoundTouchClient/NavigateCache.py
+    ```
+    </details>
+    """
+
+    def __init__(self, maxItems:int=256, maxBytes:int=8388608, timeToLive:float=300, isEnabled:bool=True) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxItems (int):
+                Maximum number of results to keep in the cache.
+                Default is 256.
+            maxBytes (int):
+                Maximum number of device response bytes to keep in the cache.
+                Default is 8388608 (8 MB).
+            timeToLive (float):
+                Amount of time (in seconds) that results are kept in the cache.
+                Default is 300 seconds.
+            isEnabled (bool):
+                True if results are cached; otherwise, False.
+                Default is True.
+        """
+        # validations.
+        if (maxItems is None) or (maxItems < 1):
+            maxItems = 1
+        if (maxBytes is None) or (maxBytes < 1):
+            maxBytes = 1
+        if (timeToLive is None) or (timeToLive < 0):
+            timeToLive = 0
+
+        # initialize instance properties.
+        self._Entries:OrderedDict = OrderedDict()
+        self._Hits:int = 0
+        self._IsEnabled:bool = bool(isEnabled)
+        self._Lock:threading.Lock = threading.Lock()
+        self._MaxBytes:int = int(maxBytes)
+        self._MaxItems:int = int(maxItems)
+        self._Misses:int = 0
+        self._Size:int = 0
+        self._TimeToLive:float = float(timeToLive)
+
+
+    def __len__(self) -> int:
+        return len(self._Entries)
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def Hits(self) -> int:
+        """
+        Number of requests that were answered from the cache.
+        """
+        return self._Hits
+
+
+    @property
+    def IsEnabled(self) -> bool:
+        """
+        True if results are cached; otherwise, False.
+
+        Setting this property to False also clears the cache.
+        """
+        return self._IsEnabled
+
+    @IsEnabled.setter
+    def IsEnabled(self, value:bool):
+        """
+        Sets the IsEnabled property value.
+        """
+        if isinstance(value, bool):
+            self._IsEnabled = value
+            if not value:
+                self.Clear()
+
+
+    @property
+    def MaxBytes(self) -> int:
+        """
+        Maximum number of device response bytes to keep in the cache.
+        """
+        return self._MaxBytes
+
+    @MaxBytes.setter
+    def MaxBytes(self, value:int):
+        """
+        Sets the MaxBytes property value.
+        """
+        if isinstance(value, int) and value > 0:
+            with self._Lock:
+                self._MaxBytes = value
+                self._Evict()
+
+
+    @property
+    def MaxItems(self) -> int:
+        """
+        Maximum number of results to keep in the cache.
+        """
+        return self._MaxItems
+
+    @MaxItems.setter
+    def MaxItems(self, value:int):
+        """
+        Sets the MaxItems property value.
+        """
+        if isinstance(value, int) and value > 0:
+            with self._Lock:
+                self._MaxItems = value
+                self._Evict()
+
+
+    @property
+    def Misses(self) -> int:
+        """
+        Number of requests that were not found in the cache.
+        """
+        return self._Misses
+
+
+    @property
+    def Size(self) -> int:
+        """
+        Number of device response bytes currently held in the cache.
+        """
+        return self._Size
+
+
+    @property
+    def TimeToLive(self) -> float:
+        """
+        Amount of time (in seconds) that results are kept in the cache.
+        """
+        return self._TimeToLive
+
+    @TimeToLive.setter
+    def TimeToLive(self, value:float):
+        """
+        Sets the TimeToLive property value.
+        """
+        if isinstance(value, (int, float)) and value >= 0:
+            self._TimeToLive = float(value)
+
+
+    def _Evict(self) -> None:
+        """
+        Discards the least-recently-used results until the cache is within its limits.
+
+        The caller must hold the lock.
+        """
+        while (len(self._Entries) > self._MaxItems) or ((self._Size > self._MaxBytes) and (len(self._Entries) > 0)):
+            key, entry = self._Entries.popitem(last=False)
+            self._Size -= entry.Size
+
+
+    def Clear(self) -> None:
+        """
+        Discards all results.
+        """
+        with self._Lock:
+            self._Entries.clear()
+            self._Size = 0
+
+
+    def Get(self, key:str, maxAge:float=None) -> object:
+        """
+        Returns the cached result for the given key, or None if the cache does not contain
+        a current result.
+
+        Args:
+            key (str):
+                The normalized navigate criteria (e.g. `Navigate.ToXmlRequestBody()` value).
+            maxAge (float):
+                Maximum age (in seconds) of the result to return, or None to return any
+                result that has not expired.
+                Default is None.
+        """
+        if not self._IsEnabled:
+            return None
+
+        with self._Lock:
+            entry:_SoundTouchNavigateCacheEntry = self._Entries.get(key, None)
+            if entry is not None:
+                age:float = time.monotonic() - entry.CreatedAt
+                if age >= self._TimeToLive:
+                    del self._Entries[key]
+                    self._Size -= entry.Size
+                    entry = None
+                elif (maxAge is not None) and (age >= maxAge):
+                    entry = None
+            if entry is None:
+                self._Misses += 1
+                return None
+            self._Entries.move_to_end(key)
+            self._Hits += 1
+            return entry.Value
+
+
+    def Invalidate(self, source:str=None, sourceAccount:str=None) -> int:
+        """
+        Discards the results for the given source (and source account).
+
+        Args:
+            source (str):
+                Source of the results to discard (e.g. "PANDORA", "STORED_MUSIC", etc), or
+                None to discard all results.
+            sourceAccount (str):
+                Source account of the results to discard, or None to discard the results of
+                all accounts of the source.
+
+        Returns:
+            The number of results that were discarded.
+        """
+        with self._Lock:
+            keys:list = []
+            for key, entry in self._Entries.items():
+                if (source is not None) and (entry.Source != str(source)):
+                    continue
+                if (sourceAccount is not None) and (entry.SourceAccount != sourceAccount):
+                    continue
+                keys.append(key)
+            for key in keys:
+                entry = self._Entries.pop(key)
+                self._Size -= entry.Size
+
+        if (len(keys) > 0) and (_logsi.IsOn(SILevel.Verbose)):
+            _logsi.LogVerbose("SoundTouchNavigateCache invalidated %d results (source=%s, sourceAccount=%s)" % (len(keys), source, sourceAccount))
+        return len(keys)
+
+
+    def Set(self, key:str, value, size:int, source:str=None, sourceAccount:str=None) -> None:
+        """
+        Stores a result in the cache.
+
+        Args:
+            key (str):
+                The normalized navigate criteria (e.g. `Navigate.ToXmlRequestBody()` value).
+            value (object):
+                The result to store.
+            size (int):
+                Size (in bytes) of the device response that the result was created from.
+            source (str):
+                Source of the result (e.g. "PANDORA", "STORED_MUSIC", etc).
+            sourceAccount (str):
+                Source account of the result.
+
+        Results that are larger than `MaxBytes` are not stored.
+        """
+        if (not self._IsEnabled) or (self._TimeToLive <= 0):
+            return
+        size = max(0, int(size or 0))
+        if size > self._MaxBytes:
+            return
+
+        with self._Lock:
+            previous:_SoundTouchNavigateCacheEntry = self._Entries.pop(key, None)
+            if previous is not None:
+                self._Size -= previous.Size
+            self._Entries[key] = _SoundTouchNavigateCacheEntry(value, size, str(source) if source is not None else None, sourceAccount)
+            self._Size += size
+            self._Evict()
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SoundTouchNavigateCache:'
+        msg = '%s (%d items)' % (msg, len(self._Entries))
+        msg = '%s Size=%d' % (msg, self._Size)
+        msg = '%s Hits=%d' % (msg, self._Hits)
+        msg = '%s Misses=%d' % (msg, self._Misses)
+        msg = '%s TimeToLive=%s' % (msg, self._TimeToLive)
+        return msg
@@ -30,6 +30,11 @@ class SoundTouchNotifyCategorys(Enum):
     Occurs when audio product tone control values (e.g. Bass, Treble, etc) have changed.
     """
 
+    bassUpdated = 'bassUpdated'
+    """ 
+    Occurs when the device bass level has been changed.
+    """
+
     connectionStateUpdated = 'connectionStateUpdated'
     """
     Occurs when a network connection state has changed.  This normally happens when the device
@@ -146,6 +151,13 @@ class SoundTouchNotifyCategorys(Enum):
     `run_forever()` method.
     """
     
+    WebSocketReconnect = 'WebSocketReconnect'
+    """
+    Occurs when a websocket connection was re-established after it was lost (e.g. the SoundTouch
+    device was rebooted), if auto reconnect is enabled.  This event is followed by update events
+    for the configurations that may have changed while disconnected.
+    """
+    
     zoneUpdated = 'zoneUpdated'
     """ 
     Occurs when a zone has been modified (created, member added, member removed, etc) on the device.
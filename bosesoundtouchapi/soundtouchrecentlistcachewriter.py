@@ -0,0 +1,372 @@
+# external package imports.
+import atexit
+import os
+import tempfile
+import threading
+import time
+from xml.etree.ElementTree import Element, ElementTree, fromstring, indent, tostring
+
+# our package imports.
+from .bstutils import export
+from .models.recent import Recent
+from .models.recentlist import RecentList
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+@export
+class SoundTouchRecentListCacheWriter:
+    """
+    Stores a `RecentList` cache to the local file system on a background thread.
+
+    Changes are not written immediately; the file is written once no further changes have
+    been made for `WriteDelay` seconds (or `MaxWriteDelay` seconds after the first unsaved
+    change, if changes keep coming), so that a burst of changes costs a single write.  The
+    file is written to a temporary file first, and then renamed over the existing file, so
+    that the file is never left partially written.
+
+    If the journal is enabled, each changed item is also appended to a journal file (the
+    cache file path with a `.journal` suffix) as soon as possible; the journal is replayed
+    when the cache is loaded, so that changes are not lost if the process ends before the
+    cache file is written.  With the journal enabled, the cache file is only rewritten
+    (and the journal truncated) once the journal contains `CompactThreshold` changes.
+
+    The caller never blocks on disk i/o, except for the `Flush` and `Close` methods.
+
+    Threadsafety:
+        This class is fully thread-safe.
+    """
+
+    def __init__(self, path:str, writeDelay:float=2, maxWriteDelay:float=10, useJournal:bool=False, compactThreshold:int=100) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            path (str):
+                Path of the cache file.
+            writeDelay (float):
+                Amount of time (in seconds) without changes to wait before writing the file.
+                Default is 2 seconds.
+            maxWriteDelay (float):
+                Maximum amount of time (in seconds) to wait before writing the file after
+                the first unsaved change.
+                Default is 10 seconds.
+            useJournal (bool):
+                True to append each change to a journal file; otherwise, False.
+                Default is False.
+            compactThreshold (int):
+                Number of journal entries that causes the cache file to be rewritten and the
+                journal to be truncated.
+                Default is 100.
+        """
+        # validations.
+        if (writeDelay is None) or (writeDelay < 0):
+            writeDelay = 0
+        if (maxWriteDelay is None) or (maxWriteDelay < writeDelay):
+            maxWriteDelay = writeDelay
+        if (compactThreshold is None) or (compactThreshold < 1):
+            compactThreshold = 1
+
+        # initialize instance properties.
+        self._CompactThreshold:int = int(compactThreshold)
+        self._Condition:threading.Condition = threading.Condition()
+        self._FirstChangeAt:float = None
+        self._IsClosed:bool = False
+        self._JournalCount:int = 0
+        self._JournalPath:str = path + '.journal'
+        self._LastChangeAt:float = None
+        self._MaxWriteDelay:float = float(maxWriteDelay)
+        self._Path:str = path
+        self._PendingItems:list = []
+        self._Snapshot:list = None
+        self._Thread:threading.Thread = None
+        self._UseJournal:bool = bool(useJournal)
+        self._WriteCount:int = 0
+        self._WriteDelay:float = float(writeDelay)
+        self._WriteLock:threading.Lock = threading.Lock()
+
+        # journal entries that already exist count towards the compaction threshold;
+        # terminate a partially written last entry, so that new entries start on a new line.
+        if self._UseJournal and os.path.exists(self._JournalPath):
+            try:
+                data:str = None
+                with open(self._JournalPath, 'r', encoding='utf-8') as file:
+                    data = file.read()
+                self._JournalCount = sum(1 for line in data.splitlines() if line.strip())
+                if (len(data) > 0) and (not data.endswith('\n')):
+                    with open(self._JournalPath, 'a', encoding='utf-8') as file:
+                        file.write('\n')
+            except Exception as ex:
+                _logsi.LogException("RecentListCache journal read error (path=%s): %s" % (self._JournalPath, str(ex)), ex)
+
+        atexit.register(self.Flush)
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def JournalPath(self) -> str:
+        """
+        Path of the journal file.
+        """
+        return self._JournalPath
+
+
+    @property
+    def Path(self) -> str:
+        """
+        Path of the cache file.
+        """
+        return self._Path
+
+
+    @property
+    def UseJournal(self) -> bool:
+        """
+        True if changes are appended to a journal file; otherwise, False.
+        """
+        return self._UseJournal
+
+
+    @property
+    def WriteCount(self) -> int:
+        """
+        Number of times that the cache file was written.
+        """
+        return self._WriteCount
+
+
+    def _AppendJournal(self, items:list) -> None:
+        """
+        Appends changed items to the journal file.
+
+        The caller must hold the write lock.
+        """
+        lines:list = []
+        item:Recent
+        for item in items:
+            lines.append(tostring(item.ToElement(), encoding='unicode').replace('\n', ' ').replace('\r', ' ') + '\n')
+        with open(self._JournalPath, 'a', encoding='utf-8') as file:
+            file.writelines(lines)
+            file.flush()
+            os.fsync(file.fileno())
+        self._JournalCount += len(lines)
+
+
+    def _Run(self) -> None:
+        """
+        Background thread that writes the pending changes.
+        """
+        while True:
+            with self._Condition:
+                while True:
+                    if self._IsClosed:
+                        return
+                    now:float = time.monotonic()
+                    timeout:float = None
+                    if len(self._PendingItems) > 0:
+                        timeout = 0
+                    elif (self._Snapshot is not None) and (not self._UseJournal):
+                        dueAt:float = min(self._LastChangeAt + self._WriteDelay, self._FirstChangeAt + self._MaxWriteDelay)
+                        timeout = dueAt - now
+                    if (timeout is not None) and (timeout <= 0):
+                        break
+                    self._Condition.wait(timeout)
+
+            self._WritePending(False)
+
+
+    def _WriteFile(self, snapshot:list) -> None:
+        """
+        Writes the cache file atomically, and truncates the journal.
+
+        The caller must hold the write lock.
+        """
+        root:Element = Element('recents')
+        item:Recent
+        for item in snapshot:
+            root.append(item.ToElement())
+        indent(root)  # pretty print
+        tree:ElementTree = ElementTree(root)
+
+        tempPath:str = None
+        try:
+            fd, tempPath = tempfile.mkstemp(prefix=os.path.basename(self._Path) + '.', suffix='.tmp', dir=os.path.dirname(self._Path) or None)
+            with os.fdopen(fd, 'wb') as file:
+                tree.write(file, encoding='utf-8', xml_declaration=True)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tempPath, self._Path)
+            tempPath = None
+        finally:
+            if tempPath is not None:
+                try:
+                    os.remove(tempPath)
+                except Exception:
+                    pass
+
+        # the journal is no longer needed once the cache file contains all changes.
+        if self._UseJournal and (self._JournalCount > 0):
+            open(self._JournalPath, 'w').close()
+            self._JournalCount = 0
+        self._WriteCount += 1
+
+        # trace.
+        if _logsi.IsOn(SILevel.Verbose):
+            _logsi.LogXmlFile(SILevel.Verbose, "RecentListCache file saved - path: %s" % (self._Path), self._Path)
+
+
+    def _WritePending(self, force:bool) -> None:
+        """
+        Writes the pending journal entries and (if due) the cache file.
+        """
+        with self._WriteLock:
+            with self._Condition:
+                items:list = self._PendingItems
+                self._PendingItems = []
+                snapshot:list = None
+                now:float = time.monotonic()
+                if self._Snapshot is not None:
+                    isDue:bool = force
+                    if self._UseJournal:
+                        # the journal holds the changes; the file is only rewritten to compact it.
+                        isDue = isDue or (self._JournalCount + len(items) >= self._CompactThreshold)
+                    else:
+                        isDue = isDue or (now >= self._LastChangeAt + self._WriteDelay) or (now >= self._FirstChangeAt + self._MaxWriteDelay)
+                    if isDue:
+                        snapshot = self._Snapshot
+                        self._Snapshot = None
+                        self._FirstChangeAt = None
+                        self._LastChangeAt = None
+
+            try:
+                if self._UseJournal and (len(items) > 0) and (snapshot is None):
+                    self._AppendJournal(items)
+                if snapshot is not None:
+                    self._WriteFile(snapshot)
+            except Exception as ex:
+                # trace and ignore exceptions.
+                _logsi.LogException("RecentListCache file save error (path=%s): %s" % (self._Path, str(ex)), ex)
+
+
+    def Close(self) -> None:
+        """
+        Writes all pending changes, and stops the background thread.
+        """
+        with self._Condition:
+            self._IsClosed = True
+            self._Condition.notify_all()
+        if (self._Thread is not None) and (self._Thread is not threading.current_thread()):
+            self._Thread.join()
+        self._Thread = None
+        self.Flush()
+        atexit.unregister(self.Flush)
+
+
+    def Flush(self) -> None:
+        """
+        Writes all pending changes immediately, on the calling thread.
+        """
+        self._WritePending(True)
+
+
+    def Load(self, maxItems:int=None) -> RecentList:
+        """
+        Loads the cache file, and replays the journal (if any).
+
+        Args:
+            maxItems (int):
+                Maximum number of items to keep in the list; older items are dropped.
+                Default is None (no limit).
+
+        Returns:
+            A `RecentList` instance, which is empty if the cache file does not exist.
+
+        Raises:
+            Exception:
+                If the cache file could not be loaded.
+        """
+        recentList:RecentList = RecentList()
+        if os.path.exists(self._Path):
+            tree:ElementTree = ElementTree()
+            recentList = RecentList(root=tree.parse(self._Path))
+
+        # replay journal entries (oldest first); a partially written last entry is ignored.
+        if os.path.exists(self._JournalPath):
+            count:int = 0
+            with open(self._JournalPath, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    try:
+                        recent:Recent = Recent(root=fromstring(line))
+                    except Exception as ex:
+                        _logsi.LogWarning("RecentListCache journal entry ignored (path=%s): %s" % (self._JournalPath, str(ex)))
+                        continue
+                    existing:Recent = recentList.GetItemByName(recent.Source, recent.Name)
+                    if existing is not None:
+                        recentList.Remove(existing)
+                    recentList.AddToFront(recent)
+                    if (recent.CreatedOn is not None) and (recent.CreatedOn > recentList.LastUpdatedOn):
+                        recentList.LastUpdatedOn = recent.CreatedOn
+                    count += 1
+            _logsi.LogVerbose("RecentListCache journal replayed (%d entries) - path: %s" % (count, self._JournalPath))
+
+        if maxItems is not None:
+            recentList.Trim(maxItems)
+        return recentList
+
+
+    def Schedule(self, recentList:RecentList, changed:Recent=None) -> None:
+        """
+        Schedules the cache file to be written.
+
+        Args:
+            recentList (RecentList):
+                The recent list to write.
+            changed (Recent):
+                The item that was added or changed (if any), which is appended to the journal
+                if the journal is enabled.
+
+        This method does not perform any disk i/o.
+        """
+        with self._Condition:
+            if self._IsClosed:
+                return
+            now:float = time.monotonic()
+            self._Snapshot = list(recentList)
+            if self._FirstChangeAt is None:
+                self._FirstChangeAt = now
+            self._LastChangeAt = now
+            if self._UseJournal and (changed is not None):
+                self._PendingItems.append(changed)
+
+            # start the background thread on first use.
+            if self._Thread is None:
+                self._Thread = threading.Thread(target=self._Run, name='SoundTouchRecentListCacheWriter', daemon=True)
+                self._Thread.start()
+            self._Condition.notify_all()
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SoundTouchRecentListCacheWriter:'
+        msg = '%s Path="%s"' % (msg, self._Path)
+        msg = '%s WriteDelay=%s' % (msg, self._WriteDelay)
+        msg = '%s UseJournal=%s' % (msg, self._UseJournal)
+        msg = '%s WriteCount=%d' % (msg, self._WriteCount)
+        return msg
@@ -0,0 +1,420 @@
+# external package imports.
+import threading
+
+# our package imports.
+from .bstutils import export
+from .uri.soundtouchuri import SoundTouchUri
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+class _SoundTouchHistogram:
+    """
+    Latency histogram with fixed bucket upper bounds (in seconds).
+    """
+
+    def __init__(self, buckets:tuple) -> None:
+        self._Buckets:tuple = buckets
+        self._Count:int = 0
+        self._Counts:list = [0] * (len(buckets) + 1)
+        self._Max:float = None
+        self._Min:float = None
+        self._Sum:float = 0
+
+
+    def Record(self, seconds:float) -> None:
+        """
+        Adds a sample to the histogram.
+        """
+        index:int = 0
+        for bound in self._Buckets:
+            if seconds <= bound:
+                break
+            index += 1
+        self._Counts[index] += 1
+        self._Count += 1
+        self._Sum += seconds
+        if (self._Min is None) or (seconds < self._Min):
+            self._Min = seconds
+        if (self._Max is None) or (seconds > self._Max):
+            self._Max = seconds
+
+
+    def ToDictionary(self) -> dict:
+        """
+        Returns a dictionary representation of the class.
+
+        Bucket counts are keyed by the bucket upper bound (in seconds), and are not
+        cumulative; the `inf` bucket contains the samples above the largest bound.
+        """
+        buckets:dict = {}
+        for index, bound in enumerate(self._Buckets):
+            buckets[str(bound)] = self._Counts[index]
+        buckets['inf'] = self._Counts[-1]
+        result:dict = \
+        {
+            'count': self._Count,
+            'sum': self._Sum,
+            'min': self._Min,
+            'max': self._Max,
+            'avg': (self._Sum / self._Count) if self._Count > 0 else None,
+            'buckets': buckets,
+        }
+        return result
+
+
+class _SoundTouchUriStatistics:
+    """
+    Counters and latency histograms of a single uri.
+    """
+
+    def __init__(self, buckets:tuple) -> None:
+        self.BuildTime:_SoundTouchHistogram = _SoundTouchHistogram(buckets)
+        self.BytesReceived:int = 0
+        self.Errors:int = 0
+        self.Hits:int = 0
+        self.HttpTime:_SoundTouchHistogram = _SoundTouchHistogram(buckets)
+        self.Misses:int = 0
+        self.ParseTime:_SoundTouchHistogram = _SoundTouchHistogram(buckets)
+        self.Refreshes:int = 0
+        self.Requests:int = 0
+
+
+    def ToDictionary(self) -> dict:
+        """
+        Returns a dictionary representation of the class.
+        """
+        result:dict = \
+        {
+            'hits': self.Hits,
+            'misses': self.Misses,
+            'refreshes': self.Refreshes,
+            'requests': self.Requests,
+            'errors': self.Errors,
+            'bytes_received': self.BytesReceived,
+            'http_time': self.HttpTime.ToDictionary(),
+            'parse_time': self.ParseTime.ToDictionary(),
+            'build_time': self.BuildTime.ToDictionary(),
+        }
+        return result
+
+
+@export
+class SoundTouchStatistics:
+    """
+    Collects cache and request statistics of a `SoundTouchClient`, per uri.
+
+    The following values are collected for each uri:
+    - hits: number of `GetProperty` calls that were answered from the configuration cache.
+    - misses: number of `GetProperty` calls that had to query the device.
+    - refreshes: number of `RefreshConfiguration` calls (including misses).
+    - requests: number of http requests sent to the device.
+    - errors: number of http requests that failed to get a response from the device.
+    - bytes_received: number of response body bytes received from the device.
+    - http_time: latency histogram (in seconds) of the http requests.
+    - parse_time: latency histogram (in seconds) of parsing the xml responses (and checking
+      them for device errors).
+    - build_time: latency histogram (in seconds) of building configuration models (e.g.
+      `Volume`, `PresetList`) from the parsed responses; responses that are unchanged re-use
+      the cached model, and are not recorded.
+
+    Use the `GetSnapshot` method to get a copy of the statistics, and the `Callback`
+    property to be notified of each value as it is recorded (e.g. to forward it to a
+    metrics system).
+
+    Threadsafety:
+        This class is fully thread-safe.
+
+    <details>
+      <summary>Sample Code</summary>
+    ```python
+    .. include:: ../docs/include/samplecode/SoundTouchClient/Statistics.py
+    ```
+    </details>
+    """
+
+    DEFAULT_LATENCY_BUCKETS:tuple = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    """
+    Default latency histogram bucket upper bounds (in seconds).
+    """
+
+    def __init__(self, isEnabled:bool=True, callback=None, buckets:tuple=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            isEnabled (bool):
+                True if statistics are collected; otherwise, False.
+                Default is True.
+            callback (Callable[[str, str, float], None]):
+                A method that is called with the uri path, value name (e.g. 'hits',
+                'http_time', etc) and value each time that a value is recorded.
+                Default is None.
+            buckets (tuple[float]):
+                Latency histogram bucket upper bounds (in seconds), in ascending order.
+                Default is None, which uses the `DEFAULT_LATENCY_BUCKETS` values.
+        """
+        if buckets is None:
+            buckets = SoundTouchStatistics.DEFAULT_LATENCY_BUCKETS
+
+        # initialize instance properties.
+        self._Buckets:tuple = tuple(sorted(buckets))
+        self._Callback = callback
+        self._IsEnabled:bool = bool(isEnabled)
+        self._Lock:threading.Lock = threading.Lock()
+        self._Uris:dict = {}
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def Callback(self):
+        """
+        A method that is called with the uri path, value name (e.g. 'hits', 'http_time',
+        etc) and value each time that a value is recorded, or None.
+
+        The method is called on the thread that recorded the value, so it should return
+        quickly; exceptions raised by the method are logged and ignored.
+        """
+        return self._Callback
+
+    @Callback.setter
+    def Callback(self, value):
+        """
+        Sets the Callback property value.
+        """
+        if (value is None) or callable(value):
+            self._Callback = value
+
+
+    @property
+    def IsEnabled(self) -> bool:
+        """
+        True if statistics are collected; otherwise, False.
+        """
+        return self._IsEnabled
+
+    @IsEnabled.setter
+    def IsEnabled(self, value:bool):
+        """
+        Sets the IsEnabled property value.
+        """
+        if isinstance(value, bool):
+            self._IsEnabled = value
+
+
+    def _GetUriStatistics(self, uri:SoundTouchUri) -> _SoundTouchUriStatistics:
+        """
+        Returns the statistics of the given uri, creating them if necessary.
+
+        The caller must hold the lock.
+        """
+        key:str = str(uri)
+        stats:_SoundTouchUriStatistics = self._Uris.get(key, None)
+        if stats is None:
+            stats = _SoundTouchUriStatistics(self._Buckets)
+            self._Uris[key] = stats
+        return stats
+
+
+    def _NotifyCallback(self, uri:SoundTouchUri, name:str, value:float) -> None:
+        """
+        Calls the callback method (if any) with a recorded value.
+        """
+        callback = self._Callback
+        if callback is None:
+            return
+        try:
+            callback(str(uri), name, value)
+        except Exception as ex:
+            _logsi.LogException("SoundTouchStatistics callback exception: %s" % (str(ex)), ex)
+
+
+    def GetSnapshot(self) -> dict:
+        """
+        Returns a copy of the collected statistics.
+
+        Returns:
+            A dictionary of statistics dictionaries keyed by uri path.  The `totals` key
+            contains the sum of the counters of all uri's.
+        """
+        totals:dict = \
+        {
+            'hits': 0,
+            'misses': 0,
+            'refreshes': 0,
+            'requests': 0,
+            'errors': 0,
+            'bytes_received': 0,
+        }
+        uris:dict = {}
+        with self._Lock:
+            for key in sorted(self._Uris):
+                stats:dict = self._Uris[key].ToDictionary()
+                for name in totals:
+                    totals[name] += stats[name]
+                uris[key] = stats
+
+        result:dict = \
+        {
+            'totals': totals,
+            'uris': uris,
+        }
+        return result
+
+
+    def RecordBuild(self, uri:SoundTouchUri, buildTime:float) -> None:
+        """
+        Records the build of a configuration model from a parsed response.
+
+        Args:
+            uri (SoundTouchUri | str):
+                The uri (or uri path) of the configuration.
+            buildTime (float):
+                Amount of time (in seconds) that building the configuration model took.
+        """
+        if not self._IsEnabled:
+            return
+        with self._Lock:
+            self._GetUriStatistics(uri).BuildTime.Record(buildTime)
+        if self._Callback is not None:
+            self._NotifyCallback(uri, 'build_time', buildTime)
+
+
+    def RecordError(self, uri:SoundTouchUri, httpTime:float=None) -> None:
+        """
+        Records an http request that failed to get a response from the device.
+
+        Args:
+            uri (SoundTouchUri | str):
+                The uri (or uri path) that was requested.
+            httpTime (float):
+                Amount of time (in seconds) that the request took, if known.
+        """
+        if not self._IsEnabled:
+            return
+        with self._Lock:
+            stats:_SoundTouchUriStatistics = self._GetUriStatistics(uri)
+            stats.Requests += 1
+            stats.Errors += 1
+            if httpTime is not None:
+                stats.HttpTime.Record(httpTime)
+        if self._Callback is not None:
+            self._NotifyCallback(uri, 'errors', 1)
+            if httpTime is not None:
+                self._NotifyCallback(uri, 'http_time', httpTime)
+
+
+    def RecordHit(self, uri:SoundTouchUri) -> None:
+        """
+        Records a `GetProperty` call that was answered from the configuration cache.
+
+        Args:
+            uri (SoundTouchUri | str):
+                The uri (or uri path) of the property.
+        """
+        if not self._IsEnabled:
+            return
+        with self._Lock:
+            self._GetUriStatistics(uri).Hits += 1
+        if self._Callback is not None:
+            self._NotifyCallback(uri, 'hits', 1)
+
+
+    def RecordMiss(self, uri:SoundTouchUri) -> None:
+        """
+        Records a `GetProperty` call that had to query the device.
+
+        Args:
+            uri (SoundTouchUri | str):
+                The uri (or uri path) of the property.
+        """
+        if not self._IsEnabled:
+            return
+        with self._Lock:
+            self._GetUriStatistics(uri).Misses += 1
+        if self._Callback is not None:
+            self._NotifyCallback(uri, 'misses', 1)
+
+
+    def RecordRefresh(self, uri:SoundTouchUri) -> None:
+        """
+        Records a `RefreshConfiguration` call.
+
+        Args:
+            uri (SoundTouchUri | str):
+                The uri (or uri path) of the configuration.
+        """
+        if not self._IsEnabled:
+            return
+        with self._Lock:
+            self._GetUriStatistics(uri).Refreshes += 1
+        if self._Callback is not None:
+            self._NotifyCallback(uri, 'refreshes', 1)
+
+
+    def RecordRequest(self, uri:SoundTouchUri, httpTime:float, parseTime:float, bytesReceived:int) -> None:
+        """
+        Records an http request that received a response from the device.
+
+        Args:
+            uri (SoundTouchUri | str):
+                The uri (or uri path) that was requested.
+            httpTime (float):
+                Amount of time (in seconds) that the http request took.
+            parseTime (float):
+                Amount of time (in seconds) that parsing the xml response took.
+            bytesReceived (int):
+                Number of response body bytes received.
+        """
+        if not self._IsEnabled:
+            return
+        with self._Lock:
+            stats:_SoundTouchUriStatistics = self._GetUriStatistics(uri)
+            stats.Requests += 1
+            stats.BytesReceived += bytesReceived
+            stats.HttpTime.Record(httpTime)
+            stats.ParseTime.Record(parseTime)
+        if self._Callback is not None:
+            self._NotifyCallback(uri, 'requests', 1)
+            self._NotifyCallback(uri, 'bytes_received', bytesReceived)
+            self._NotifyCallback(uri, 'http_time', httpTime)
+            self._NotifyCallback(uri, 'parse_time', parseTime)
+
+
+    def Reset(self) -> None:
+        """
+        Clears all collected statistics.
+        """
+        with self._Lock:
+            self._Uris.clear()
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        with self._Lock:
+            hits:int = sum([ stats.Hits for stats in self._Uris.values() ])
+            misses:int = sum([ stats.Misses for stats in self._Uris.values() ])
+            requests:int = sum([ stats.Requests for stats in self._Uris.values() ])
+            count:int = len(self._Uris)
+        msg:str = 'SoundTouchStatistics:'
+        msg = '%s IsEnabled=%s' % (msg, self._IsEnabled)
+        msg = '%s Hits=%d' % (msg, hits)
+        msg = '%s Misses=%d' % (msg, misses)
+        msg = '%s Requests=%d' % (msg, requests)
+        msg = '%s (%d uris)' % (msg, count)
+        return msg
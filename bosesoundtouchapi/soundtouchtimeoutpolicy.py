@@ -0,0 +1,366 @@
+# external package imports.
+from contextvars import ContextVar
+import time
+from urllib3 import Timeout
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util import Retry
+
+# our package imports.
+from .bstappmessages import BSTAppMessages
+from .bstutils import export
+from .soundtoucherror import SoundTouchError
+from .uri.soundtouchuri import SoundTouchUri
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+_CurrentDeadline:ContextVar = ContextVar('SoundTouchDeadline', default=None)
+"""
+Monotonic clock time at which the current deadline expires, or None if there is no deadline.
+"""
+
+
+class _SoundTouchRetry(Retry):
+    """
+    Retry configuration that does not retry requests that timed out waiting for a response.
+
+    Errors on a reused keep-alive connection (e.g. a connection that was closed by the device)
+    are retried as usual; a read timeout is raised immediately, so that the request does not
+    take a multiple of its read timeout.  Requests that fail to connect are not retried (see 
+    `SoundTouchTimeoutPolicy.Retries`).
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if isinstance(error, ReadTimeoutError):
+            raise error
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+@export
+class SoundTouchDeadline:
+    """
+    Context manager that sets an overall deadline for all device requests made within it.
+
+    The deadline applies to the current thread (or asyncio task), and spans multiple device
+    requests; each request is given the smaller of its own timeout and the time remaining
+    until the deadline, and requests that start after the deadline has expired fail
+    immediately with a `SoundTouchError`.  Deadlines can be nested, in which case the earliest
+    deadline applies.
+
+    Use the `SoundTouchClient.Deadline` method to create an instance of this class.
+
+    <details>
+      <summary>Sample Code</summary>
+    ```python
+    .. include:: ../docs/include/samplecode/SoundTouchClient/Deadline.py
+    ```
+    </details>
+    """
+
+    def __init__(self, seconds:float) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            seconds (float):
+                Amount of time (in seconds) that requests made within the context are
+                allowed to take in total.
+        """
+        self._Seconds:float = float(seconds)
+        self._Token = None
+
+
+    def __enter__(self) -> 'SoundTouchDeadline':
+        expiresAt:float = time.monotonic() + self._Seconds
+        current:float = _CurrentDeadline.get()
+        if (current is not None) and (current < expiresAt):
+            expiresAt = current
+        self._Token = _CurrentDeadline.set(expiresAt)
+        return self
+
+
+    def __exit__(self, etype, value, traceback) -> None:
+        _CurrentDeadline.reset(self._Token)
+        self._Token = None
+
+
+    async def __aenter__(self) -> 'SoundTouchDeadline':
+        return self.__enter__()
+
+
+    async def __aexit__(self, etype, value, traceback) -> None:
+        self.__exit__(etype, value, traceback)
+
+
+    @staticmethod
+    def GetRemaining() -> float:
+        """
+        Returns the amount of time (in seconds) remaining until the current deadline expires,
+        or None if there is no current deadline.
+        """
+        expiresAt:float = _CurrentDeadline.get()
+        if expiresAt is None:
+            return None
+        return expiresAt - time.monotonic()
+
+
+@export
+class SoundTouchTimeoutPolicy:
+    """
+    Determines the connect and read timeouts to use for device requests, based upon the
+    uri being requested.
+
+    Most requests are answered by the device quickly, and are given a short read timeout
+    so that a device that accepts a connection but stops responding cannot hang the caller.
+    Requests that are known to take a long time (e.g. `navigate`, `search`,
+    `performWirelessSiteSurvey`, etc) are given a longer read timeout.  The read timeout
+    for any uri can be changed with the `SetReadTimeout` method.
+
+    If a `SoundTouchDeadline` is active, request timeouts are reduced so that the request
+    cannot run past the deadline.
+    """
+
+    DEFAULT_READ_TIMEOUTS:dict = \
+    {
+        'key': 5,
+        'volume': 5,
+        'bass': 5,
+        'balance': 5,
+        'nowPlaying': 10,
+        'userPlayControl': 5,
+        'userTrackControl': 5,
+        'userRating': 5,
+        'addStation': 30,
+        'genreStations': 30,
+        'introspect': 30,
+        'listMediaServers': 30,
+        'navigate': 60,
+        'performWirelessSiteSurvey': 120,
+        'search': 60,
+        'searchStation': 60,
+        'setMusicServiceAccount': 30,
+        'setMusicServiceOAuthAccount': 30,
+        'stationInfo': 30,
+    }
+    """
+    Default read timeouts (in seconds) for specific uri paths; uri paths that are not listed
+    use the `DefaultReadTimeout` value.
+    """
+
+    def __init__(self, connectTimeout:float=30, defaultReadTimeout:float=15, readTimeouts:dict=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            connectTimeout (float):
+                Amount of time (in seconds) a connection request is allowed to run before
+                being aborted.
+                Default is 30 seconds.
+            defaultReadTimeout (float):
+                Amount of time (in seconds) to wait for the device to respond to a request,
+                for uri's that do not have a specific read timeout.
+                Default is 15 seconds.
+            readTimeouts (dict):
+                Read timeouts (in seconds) keyed by uri path, that override the
+                `DEFAULT_READ_TIMEOUTS` values.
+                Default is None.
+        """
+        self._ConnectTimeout:float = float(connectTimeout)
+        self._DefaultReadTimeout:float = float(defaultReadTimeout)
+        self._Retries:Retry = _SoundTouchRetry(total=3, connect=0, redirect=3)
+        self._ReadTimeouts:dict = dict(SoundTouchTimeoutPolicy.DEFAULT_READ_TIMEOUTS)
+        if readTimeouts is not None:
+            for path, seconds in readTimeouts.items():
+                self.SetReadTimeout(path, seconds)
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def ConnectTimeout(self) -> float:
+        """
+        Amount of time (in seconds) a connection request is allowed to run before being aborted.
+        """
+        return self._ConnectTimeout
+
+    @ConnectTimeout.setter
+    def ConnectTimeout(self, value:float):
+        """
+        Sets the ConnectTimeout property value.
+        """
+        if isinstance(value, (int, float)) and value > 0:
+            self._ConnectTimeout = float(value)
+
+
+    @property
+    def DefaultReadTimeout(self) -> float:
+        """
+        Amount of time (in seconds) to wait for the device to respond to a request, for
+        uri's that do not have a specific read timeout.
+        """
+        return self._DefaultReadTimeout
+
+    @DefaultReadTimeout.setter
+    def DefaultReadTimeout(self, value:float):
+        """
+        Sets the DefaultReadTimeout property value.
+        """
+        if isinstance(value, (int, float)) and value > 0:
+            self._DefaultReadTimeout = float(value)
+
+
+    @property
+    def Retries(self) -> Retry:
+        """
+        The urllib3 retry configuration to use for requests that are not bound by a deadline.
+
+        Requests that fail on a reused keep-alive connection are retried, but requests that 
+        fail to connect or time out waiting for a response are not; an offline device fails 
+        after a single connect timeout, and is then handled by the device circuit breaker.
+        """
+        return self._Retries
+
+
+    def GetReadTimeout(self, uri:SoundTouchUri) -> float:
+        """
+        Returns the read timeout (in seconds) for the given uri.
+
+        Args:
+            uri (SoundTouchUri | str):
+                The uri (or uri path) to get the read timeout for.
+        """
+        return self._ReadTimeouts.get(str(uri), self._DefaultReadTimeout)
+
+
+    def GetTimeouts(self, uri:SoundTouchUri, deviceName:str=None) -> tuple:
+        """
+        Returns the connect and read timeouts to use for a request of the given uri,
+        reduced to the time remaining until the current deadline (if any).
+
+        Args:
+            uri (SoundTouchUri | str):
+                The uri (or uri path) being requested.
+            deviceName (str):
+                Device name to include in the exception message if the deadline has expired.
+
+        Returns:
+            A tuple of (connectTimeout, readTimeout, isDeadlineBound), where isDeadlineBound
+            is True if the timeouts were reduced due to the current deadline.
+
+        Raises:
+            SoundTouchError:
+                If the current deadline has expired.
+        """
+        connectTimeout:float = self._ConnectTimeout
+        readTimeout:float = self.GetReadTimeout(uri)
+        isDeadlineBound:bool = False
+
+        remaining:float = SoundTouchDeadline.GetRemaining()
+        if remaining is not None:
+            if remaining <= 0:
+                raise SoundTouchError(BSTAppMessages.BST_DEVICE_DEADLINE_EXCEEDED % (deviceName, str(uri)), logsi=_logsi)
+            if remaining < connectTimeout:
+                connectTimeout = remaining
+                isDeadlineBound = True
+            if remaining < readTimeout:
+                readTimeout = remaining
+                isDeadlineBound = True
+
+        return connectTimeout, readTimeout, isDeadlineBound
+
+
+    def GetRetries(self, isDeadlineBound:bool) -> Retry:
+        """
+        Returns the urllib3 retry configuration to use for a request.
+
+        Args:
+            isDeadlineBound (bool):
+                True if the request timeouts were reduced due to the current deadline, as
+                returned by the `GetTimeout` method.
+
+        Returns:
+            The `Retries` configuration, or False (no retries) if the request is bound by a
+            deadline; urllib3 restarts the timeout for each attempt, so a retried request
+            could otherwise run past the deadline.
+        """
+        if isDeadlineBound:
+            return False
+        return self._Retries
+
+
+    def GetTimeout(self, uri:SoundTouchUri, deviceName:str=None) -> tuple:
+        """
+        Returns the urllib3 timeout to use for a request of the given uri, reduced to the
+        time remaining until the current deadline (if any).
+
+        Args:
+            uri (SoundTouchUri | str):
+                The uri (or uri path) being requested.
+            deviceName (str):
+                Device name to include in the exception message if the deadline has expired.
+
+        Returns:
+            A tuple of (timeout, isDeadlineBound), where timeout is an `urllib3.Timeout`
+            instance and isDeadlineBound is True if the timeout was reduced due to the
+            current deadline.
+
+        Raises:
+            SoundTouchError:
+                If the current deadline has expired.
+        """
+        connectTimeout, readTimeout, isDeadlineBound = self.GetTimeouts(uri, deviceName)
+        if isDeadlineBound:
+            return Timeout(total=max(connectTimeout, readTimeout), connect=connectTimeout, read=readTimeout), True
+        return Timeout(connect=connectTimeout, read=readTimeout), False
+
+
+    def SetReadTimeout(self, uri:SoundTouchUri, seconds:float) -> None:
+        """
+        Sets the read timeout (in seconds) for the given uri.
+
+        Args:
+            uri (SoundTouchUri | str):
+                The uri (or uri path) to set the read timeout for.
+            seconds (float):
+                The read timeout (in seconds), or None to use the `DefaultReadTimeout` value.
+        """
+        if seconds is None:
+            self._ReadTimeouts.pop(str(uri), None)
+        elif isinstance(seconds, (int, float)) and seconds > 0:
+            self._ReadTimeouts[str(uri)] = float(seconds)
+
+
+    def ToDictionary(self) -> dict:
+        """
+        Returns a dictionary representation of the class.
+        """
+        result:dict = \
+        {
+            'connect_timeout': self._ConnectTimeout,
+            'default_read_timeout': self._DefaultReadTimeout,
+            'read_timeouts': dict(self._ReadTimeouts),
+        }
+        return result
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SoundTouchTimeoutPolicy:'
+        msg = '%s ConnectTimeout=%s' % (msg, self._ConnectTimeout)
+        msg = '%s DefaultReadTimeout=%s' % (msg, self._DefaultReadTimeout)
+        msg = '%s (%d uri read timeouts)' % (msg, len(self._ReadTimeouts))
+        return msg
@@ -0,0 +1,397 @@
+# external package imports.
+from collections import OrderedDict
+import threading
+import time
+from urllib3 import PoolManager, HTTPResponse, Timeout
+from urllib3.util import parse_url
+
+# our package imports.
+from .bstappmessages import BSTAppMessages
+from .bstutils import export
+from .soundtoucherror import SoundTouchError
+from .soundtouchtimeoutpolicy import SoundTouchDeadline
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+class _HostStatistics:
+    """
+    Connection usage and wait time statistics for a single host.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+        """
+        self.Errors:int = 0
+        self.InUse:int = 0
+        self.PeakInUse:int = 0
+        self.Pending:int = 0
+        self.Requests:int = 0
+        self.WaitCount:int = 0
+        self.WaitTimeMax:float = 0
+        self.WaitTimeTotal:float = 0
+
+
+    def ToDictionary(self) -> dict:
+        """
+        Returns a dictionary representation of the class.
+        """
+        result:dict = \
+        {
+            'errors': self.Errors,
+            'in_use': self.InUse,
+            'peak_in_use': self.PeakInUse,
+            'requests': self.Requests,
+            'wait_count': self.WaitCount,
+            'wait_time_avg': (self.WaitTimeTotal / self.Requests) if self.Requests > 0 else 0,
+            'wait_time_max': self.WaitTimeMax,
+            'wait_time_total': self.WaitTimeTotal,
+        }
+        return result
+
+
+@export
+class SoundTouchTransport:
+    """
+    A shared http transport that owns the keep-alive connection pools used to communicate
+    with SoundTouch devices.
+
+    A single transport can be shared by any number of `SoundTouchDevice` and `SoundTouchClient`
+    instances.  It maintains one keep-alive connection pool per host, and enforces a global
+    connection cap as well as a per-host connection cap; requests that exceed a cap will wait
+    for a connection to become available (up to the request connect timeout, or the time
+    remaining until the current `SoundTouchDeadline`).  Connection usage and wait times are tracked per
+    host, and can be retrieved with the `GetStatistics` method.
+
+    A process-wide default transport is returned by the `GetDefault` method; it is used by
+    devices and clients that are not supplied with a transport or custom pool manager.
+    """
+
+    _Default:'SoundTouchTransport' = None
+    """
+    Process-wide default transport instance.
+    """
+
+    _DefaultLock:threading.Lock = threading.Lock()
+    """
+    Lock used to serialize access to the default transport instance.
+    """
+
+    def __init__(self, maxConnections:int=100, maxConnectionsPerHost:int=10, maxHosts:int=100, manager:PoolManager=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            maxConnections (int):
+                Maximum number of concurrent connections allowed across all hosts, or None
+                for no limit.
+                Default is 100.
+            maxConnectionsPerHost (int):
+                Maximum number of concurrent connections allowed to a single host, or None
+                for no limit.  This is also the number of keep-alive connections that are
+                kept in each host pool.
+                Default is 10.
+            maxHosts (int):
+                Maximum number of host connection pools (and host statistics) to keep; least
+                recently used idle hosts are discarded once this value is reached.
+                Default is 100.
+            manager (urllib3.PoolManager):
+                A custom pool manager (or proxy manager) to delegate requests to; otherwise,
+                None to create a default pool manager using the specified limits.
+        """
+        # validations.
+        if (maxConnections is not None) and (maxConnections < 1):
+            maxConnections = 1
+        if (maxConnectionsPerHost is not None) and (maxConnectionsPerHost < 1):
+            maxConnectionsPerHost = 1
+        if (maxHosts is None) or (maxHosts < 1):
+            maxHosts = 100
+
+        # initialize internal storage.
+        self._HostSemaphores:dict = {}
+        self._HostStatistics:OrderedDict = OrderedDict()
+        self._Lock:threading.Lock = threading.Lock()
+        self._MaxConnections:int = maxConnections
+        self._MaxConnectionsPerHost:int = maxConnectionsPerHost
+        self._MaxHosts:int = maxHosts
+        self._Semaphore:threading.BoundedSemaphore = None
+        self._Statistics:_HostStatistics = _HostStatistics()
+
+        if maxConnections is not None:
+            self._Semaphore = threading.BoundedSemaphore(maxConnections)
+
+        # if pool manager instance is none, then create one.
+        if (manager is None) or (not isinstance(manager, PoolManager)):
+            manager = PoolManager(headers={'User-Agent': 'BoseSoundTouchApi/1.0.0'},
+                                  num_pools=maxHosts,                    # number of connection pools to allocate.
+                                  maxsize=maxConnectionsPerHost or 10,   # maximum number of connections to keep in each pool.
+                                  block=(maxConnectionsPerHost is not None)  # limit number of connections to each device.
+                                  )
+        self._Manager:PoolManager = manager
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def Manager(self) -> PoolManager:
+        """
+        The urllib3 pool manager that requests are delegated to.
+
+        This property is read-only, and is set when the class is instantiated.
+        """
+        return self._Manager
+
+
+    @property
+    def MaxConnections(self) -> int:
+        """
+        Maximum number of concurrent connections allowed across all hosts, or None if
+        there is no limit.
+        """
+        return self._MaxConnections
+
+
+    @property
+    def MaxConnectionsPerHost(self) -> int:
+        """
+        Maximum number of concurrent connections allowed to a single host, or None if
+        there is no limit.
+        """
+        return self._MaxConnectionsPerHost
+
+
+    @staticmethod
+    def GetDefault() -> 'SoundTouchTransport':
+        """
+        Returns the process-wide default transport instance, creating it if needed.
+        """
+        with SoundTouchTransport._DefaultLock:
+            if SoundTouchTransport._Default is None:
+                SoundTouchTransport._Default = SoundTouchTransport()
+            return SoundTouchTransport._Default
+
+
+    @staticmethod
+    def SetDefault(transport:'SoundTouchTransport') -> None:
+        """
+        Replaces the process-wide default transport instance.
+
+        Args:
+            transport (SoundTouchTransport):
+                Transport to use as the default, or None to create a new default transport
+                the next time one is requested.
+
+        Devices and clients that were created prior to calling this method will continue
+        to use the transport they were created with.
+        """
+        with SoundTouchTransport._DefaultLock:
+            SoundTouchTransport._Default = transport
+
+
+    def _AcquireHost(self, hostKey:str) -> threading.BoundedSemaphore:
+        """
+        Marks the given host as used by a pending request (creating its entry if needed), and
+        returns its per-host semaphore (or None if there is no per-host cap).
+
+        Least recently used hosts without pending requests are discarded once there are more
+        than `maxHosts` hosts.  The caller must call `_ReleaseHost` once the request is done.
+        """
+        with self._Lock:
+            stats:_HostStatistics = self._HostStatistics.get(hostKey, None)
+            if stats is None:
+                stats = _HostStatistics()
+                self._HostStatistics[hostKey] = stats
+                if self._MaxConnectionsPerHost is not None:
+                    self._HostSemaphores[hostKey] = threading.BoundedSemaphore(self._MaxConnectionsPerHost)
+            else:
+                self._HostStatistics.move_to_end(hostKey)
+            stats.Pending += 1
+
+            # discard least recently used idle hosts.
+            if len(self._HostStatistics) > self._MaxHosts:
+                for key in [key for key, value in self._HostStatistics.items() if value.Pending == 0]:
+                    if len(self._HostStatistics) <= self._MaxHosts:
+                        break
+                    del self._HostStatistics[key]
+                    self._HostSemaphores.pop(key, None)
+
+            return self._HostSemaphores.get(hostKey, None)
+
+
+    def _ReleaseHost(self, hostKey:str) -> None:
+        """
+        Marks the given host as no longer used by a pending request.
+        """
+        with self._Lock:
+            self._HostStatistics[hostKey].Pending -= 1
+
+
+    def Clear(self) -> None:
+        """
+        Closes all pooled connections, and resets connection statistics.
+        """
+        self._Manager.clear()
+        with self._Lock:
+            self._Statistics = _HostStatistics()
+            for hostKey in self._HostStatistics.keys():
+                stats:_HostStatistics = _HostStatistics()
+                stats.InUse = self._HostStatistics[hostKey].InUse
+                stats.Pending = self._HostStatistics[hostKey].Pending
+                self._HostStatistics[hostKey] = stats
+
+
+    def GetStatistics(self) -> dict:
+        """
+        Returns a snapshot of connection usage and wait time statistics.
+
+        Returns:
+            A dictionary that contains global connection statistics, as well as a `hosts`
+            dictionary of per-host connection statistics keyed by "host:port".
+
+        Wait times are expressed in seconds, and measure how long requests waited for a
+        connection slot to become available due to the global or per-host connection caps.
+        """
+        with self._Lock:
+            result:dict = self._Statistics.ToDictionary()
+            result['max_connections'] = self._MaxConnections
+            result['max_connections_per_host'] = self._MaxConnectionsPerHost
+            result['hosts'] = { hostKey: stats.ToDictionary() for hostKey, stats in self._HostStatistics.items() }
+        return result
+
+
+    def Request(self, method:str, url:str, body:bytes=None, headers:dict=None, timeout=None, retries=None) -> HTTPResponse:
+        """
+        Makes an http request, borrowing a connection from the pool of the target host.
+
+        Args:
+            method (str):
+                The http method (e.g. "GET", "POST", etc).
+            url (str):
+                The request url.
+            body (bytes):
+                The request body, or None if there is no body.
+            headers (dict):
+                Additional headers to send with the request.
+            timeout (urllib3.Timeout):
+                Request timeout, or None to use the pool manager default.
+            retries (urllib3.Retry | bool):
+                Request retry configuration, or None to use the pool manager default.
+
+        Returns:
+            An `urllib3.HTTPResponse` object with the response content preloaded.
+
+        Raises:
+            SoundTouchError:
+                If no connection slot became available within the wait timeout.
+
+        The calling thread will wait for a connection slot to become available if the global
+        or per-host connection cap has been reached; it waits no longer than the connect timeout
+        of the request, or the time remaining until the current `SoundTouchDeadline` (if sooner).
+        """
+        parsedUrl = parse_url(url)
+        hostKey:str = '%s:%s' % (parsedUrl.host, parsedUrl.port or 80)
+
+        # determine how long we may wait for a connection slot.
+        waitTimeout:float = None
+        if isinstance(timeout, Timeout):
+            if isinstance(timeout.connect_timeout, (int, float)):
+                waitTimeout = timeout.connect_timeout
+        elif isinstance(timeout, (int, float)):
+            waitTimeout = timeout
+        remaining:float = SoundTouchDeadline.GetRemaining()
+        if (remaining is not None) and ((waitTimeout is None) or (remaining < waitTimeout)):
+            waitTimeout = max(remaining, 0)
+
+        # acquire a connection slot for the host and globally, tracking how long we had to wait.
+        hostSemaphore:threading.BoundedSemaphore = self._AcquireHost(hostKey)
+        try:
+            waitStart:float = time.monotonic()
+            if (hostSemaphore is not None) and (not hostSemaphore.acquire(timeout=waitTimeout)):
+                raise SoundTouchError(BSTAppMessages.BST_DEVICE_CONNECTION_WAIT_TIMEOUT % (hostKey, waitTimeout), logsi=_logsi)
+            try:
+                if self._Semaphore is not None:
+                    globalTimeout:float = None
+                    if waitTimeout is not None:
+                        globalTimeout = max(waitTimeout - (time.monotonic() - waitStart), 0)
+                    if not self._Semaphore.acquire(timeout=globalTimeout):
+                        raise SoundTouchError(BSTAppMessages.BST_DEVICE_CONNECTION_WAIT_TIMEOUT % (hostKey, waitTimeout), logsi=_logsi)
+            except BaseException:
+                if hostSemaphore is not None:
+                    hostSemaphore.release()
+                raise
+        except BaseException:
+            self._ReleaseHost(hostKey)
+            raise
+        waitTime:float = time.monotonic() - waitStart
+
+        # update statistics.
+        with self._Lock:
+            for stats in [self._Statistics, self._HostStatistics[hostKey]]:
+                stats.Requests += 1
+                stats.InUse += 1
+                stats.PeakInUse = max(stats.PeakInUse, stats.InUse)
+                stats.WaitTimeTotal += waitTime
+                stats.WaitTimeMax = max(stats.WaitTimeMax, waitTime)
+                if waitTime >= 0.001:
+                    stats.WaitCount += 1
+
+        if (waitTime >= 0.001) and _logsi.IsOn(SILevel.Debug):
+            _logsi.LogDebug("SoundTouchTransport waited %.3f seconds for a connection to '%s'" % (waitTime, hostKey))
+
+        try:
+
+            kwargs:dict = {}
+            if body is not None:
+                kwargs['body'] = body
+            if headers is not None:
+                kwargs['headers'] = headers
+            if timeout is not None:
+                kwargs['timeout'] = timeout
+            if retries is not None:
+                kwargs['retries'] = retries
+
+            # response content is preloaded, so the connection is returned to the pool
+            # before we release the connection slot.
+            return self._Manager.request(method, url, **kwargs)
+
+        except BaseException:
+
+            with self._Lock:
+                self._Statistics.Errors += 1
+                self._HostStatistics[hostKey].Errors += 1
+            raise
+
+        finally:
+
+            with self._Lock:
+                self._Statistics.InUse -= 1
+                self._HostStatistics[hostKey].InUse -= 1
+                self._HostStatistics[hostKey].Pending -= 1
+            if self._Semaphore is not None:
+                self._Semaphore.release()
+            if hostSemaphore is not None:
+                hostSemaphore.release()
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SoundTouchTransport:'
+        msg = '%s MaxConnections=%s' % (msg, str(self._MaxConnections))
+        msg = '%s MaxConnectionsPerHost=%s' % (msg, str(self._MaxConnectionsPerHost))
+        msg = '%s HostCount=%d' % (msg, len(self._HostStatistics))
+        return msg
@@ -1,8 +1,18 @@
 # import all classes from the namespace.
+from bosesoundtouchapi.ws.soundtouchdispatchoverflowpolicys import SoundTouchDispatchOverflowPolicys
+from bosesoundtouchapi.ws.soundtouchevent import SoundTouchEvent
+from bosesoundtouchapi.ws.soundtoucheventcoalescer import SoundTouchEventCoalescer
+from bosesoundtouchapi.ws.soundtoucheventdispatcher import SoundTouchEventDispatcher
+from bosesoundtouchapi.ws.soundtouchnotificationhub import SoundTouchNotificationHub
 from bosesoundtouchapi.ws.soundtouchwebsocket import SoundTouchWebSocket
 
 
 # all classes to import when "import *" is specified.
 __all__ = [
+    'SoundTouchDispatchOverflowPolicys',
+    'SoundTouchEvent',
+    'SoundTouchEventCoalescer',
+    'SoundTouchEventDispatcher',
+    'SoundTouchNotificationHub',
     'SoundTouchWebSocket'
 ]
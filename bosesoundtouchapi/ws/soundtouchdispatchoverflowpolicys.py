@@ -0,0 +1,30 @@
+# external package imports.
+from enum import Enum
+
+# our package imports.
+from bosesoundtouchapi.bstutils import export
+
+@export
+class SoundTouchDispatchOverflowPolicys(Enum):
+    """
+    Event Dispatcher Overflow Policys enumeration.
+
+    Controls what a `SoundTouchEventDispatcher` does with a new event when its queue is full.
+    """
+
+    Block = "BLOCK"
+    """
+    Wait (on the thread that received the event) until a queued event was dispatched.
+    """
+
+    DropOldest = "DROP_OLDEST"
+    """
+    Discard the oldest queued event (of any category) to make room for the new event.
+    """
+
+    MergeLatest = "MERGE_LATEST"
+    """
+    Replace the queued events of the same device and category with the new event, since the
+    new event supersedes them (e.g. "volumeUpdated"); if no events of the same device and
+    category are queued, then the oldest queued event is discarded instead.
+    """
@@ -0,0 +1,256 @@
+# external package imports.
+import threading
+from xml.etree import ElementTree as xmltree
+
+# our package imports.
+from bosesoundtouchapi.bstutils import export
+from bosesoundtouchapi.soundtouchnotifycategorys import SoundTouchNotifyCategorys
+from bosesoundtouchapi.models.audiodspcontrols import AudioDspControls
+from bosesoundtouchapi.models.audioproductlevelcontrols import AudioProductLevelControls
+from bosesoundtouchapi.models.audioproducttonecontrols import AudioProductToneControls
+from bosesoundtouchapi.models.bass import Bass
+from bosesoundtouchapi.models.group import Group
+from bosesoundtouchapi.models.nowplayingstatus import NowPlayingStatus
+from bosesoundtouchapi.models.presetlist import PresetList
+from bosesoundtouchapi.models.productcechdmicontrol import ProductCecHdmiControl
+from bosesoundtouchapi.models.recentlist import RecentList
+from bosesoundtouchapi.models.simpleconfig import SimpleConfig
+from bosesoundtouchapi.models.sourcelist import SourceList
+from bosesoundtouchapi.models.volume import Volume
+from bosesoundtouchapi.models.zone import Zone
+from bosesoundtouchapi.uri.soundtouchnodes import SoundTouchNodes
+from bosesoundtouchapi.uri.soundtouchuri import SoundTouchUri
+
+# get smartinspect logger reference; create a new session for this module name.
+import logging
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+# notification events that contain a configuration model.
+# key = event category; value = tuple of (configuration uri, configuration class type).
+_EVENT_MODELS:dict = \
+{
+    'audiodspcontrols': (SoundTouchNodes.audiodspcontrols, AudioDspControls),
+    'audioproductlevelcontrols': (SoundTouchNodes.audioproductlevelcontrols, AudioProductLevelControls),
+    'audioproducttonecontrols': (SoundTouchNodes.audioproducttonecontrols, AudioProductToneControls),
+    'bassUpdated': (SoundTouchNodes.bass, Bass),
+    'groupUpdated': (SoundTouchNodes.getGroup, Group),
+    'languageUpdated': (SoundTouchNodes.language, SimpleConfig),
+    'nameUpdated': (SoundTouchNodes.name, SimpleConfig),
+    'nowPlayingUpdated': (SoundTouchNodes.nowPlaying, NowPlayingStatus),
+    'presetsUpdated': (SoundTouchNodes.presets, PresetList),
+    'productcechdmicontrol': (SoundTouchNodes.productcechdmicontrol, ProductCecHdmiControl),
+    'recentsUpdated': (SoundTouchNodes.recents, RecentList),
+    'sourcesUpdated': (SoundTouchNodes.sources, SourceList),
+    'volumeUpdated': (SoundTouchNodes.volume, Volume),
+    'zoneUpdated': (SoundTouchNodes.getZone, Zone),
+}
+
+
+@export
+class SoundTouchEvent:
+    """
+    A notification event received by a `SoundTouchWebSocket`.
+
+    One instance is created per received event, and is shared by the client recent list
+    cache and every typed listener of the event (see the `typed` argument of
+    `SoundTouchWebSocket.AddListener`).
+
+    The `Model` property returns the configuration model of the event (e.g. a `Volume`
+    instance for a "volumeUpdated" event); the model is parsed from the event XML when it is
+    first accessed, and at most once per event, regardless of the number of listeners.  All
+    listeners receive the same model instance, so listeners must not modify it; the library
+    never modifies it, and stores a copy of it in the client configuration cache if
+    `SoundTouchWebSocket.UpdateConfigurationCache` is enabled.
+
+    Threadsafety:
+        This class is fully thread-safe.
+
+    <details>
+        <summary>Sample Code</summary>
+    ```python
+    .. include:: ../../docs/include/samplecode/SoundTouchEvent/_ClassInit.py
+    ```
+    </details>
+    """
+
+    def __init__(self, client, category:str, argument:object) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            client (SoundTouchClient):
+                The client of the device that raised the event.
+            category (str):
+                The event category (e.g. "volumeUpdated").
+            argument (object):
+                The event argument; an XML-Element with tag == category for device events,
+                an Exception for `SoundTouchNotifyCategorys.WebSocketError` events, etc.
+        """
+        # initialize internal storage.
+        self._Argument:object = argument
+        self._Category:str = str(category)
+        self._Client = client
+        self._IsParsed:bool = False
+        self._Lock:threading.Lock = threading.Lock()
+        self._Model:object = None
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def Argument(self) -> object:
+        """
+        The event argument, as it is passed to untyped listeners; an XML-Element with
+        tag == category for device events, an Exception for `SoundTouchNotifyCategorys.WebSocketError`
+        events, etc.
+        """
+        return self._Argument
+
+
+    @property
+    def Category(self) -> str:
+        """
+        The event category (e.g. "volumeUpdated").
+        """
+        return self._Category
+
+
+    @property
+    def Client(self):
+        """
+        The client of the device that raised the event.
+        """
+        return self._Client
+
+
+    @property
+    def DeviceId(self) -> str:
+        """
+        Device identifier of the device that raised the event (e.g. "9070658C9D4A"), if the
+        event contains one; otherwise, None.
+        """
+        if isinstance(self._Argument, xmltree.Element):
+            return self._Argument.get('deviceID', None)
+        return None
+
+
+    @property
+    def IsResync(self) -> bool:
+        """
+        True if the event was not sent by the device, but raised from a configuration that was
+        queried after a reconnect; otherwise, False.
+        """
+        if isinstance(self._Argument, xmltree.Element):
+            return self._Argument.get('resync', None) == 'true'
+        return False
+
+
+    @property
+    def Model(self) -> object:
+        """
+        The configuration model of the event (e.g. a `Volume` instance for a "volumeUpdated"
+        event), or None if the event category does not contain a configuration (or it could
+        not be parsed).
+
+        The model is parsed on first access; the same instance is returned to all callers,
+        and must not be modified.
+        """
+        if not self._IsParsed:
+            with self._Lock:
+                if not self._IsParsed:
+                    self._Model = self._ParseModel()
+                    self._IsParsed = True
+        return self._Model
+
+
+    @property
+    def ModelType(self) -> type:
+        """
+        The configuration model class type of the event category (e.g. `Volume` for a
+        "volumeUpdated" event), or None if the event category does not contain a configuration.
+        """
+        return SoundTouchEvent.GetModelType(self._Category)
+
+
+    @property
+    def Uri(self) -> SoundTouchUri:
+        """
+        The configuration uri of the event category (e.g. `SoundTouchNodes.volume` for a
+        "volumeUpdated" event), or None if the event category does not contain a configuration.
+        """
+        entry:tuple = _EVENT_MODELS.get(self._Category, None)
+        if entry is None:
+            return None
+        return entry[0]
+
+
+    def _ParseModel(self) -> object:
+        """
+        Parses the configuration model of the event.
+        """
+        entry:tuple = _EVENT_MODELS.get(self._Category, None)
+        if (entry is None) or (not isinstance(self._Argument, xmltree.Element)):
+            return None
+        uri, classType = entry
+
+        try:
+
+            # the configuration is either the event itself (e.g. "<audiodspcontrols ... />"),
+            # or the child node of the event (e.g. "<volumeUpdated><volume>...</volume></volumeUpdated>").
+            root:xmltree.Element = None
+            if self._Argument.tag == uri.Path:
+                root = self._Argument
+            elif len(self._Argument) > 0:
+                root = self._Argument[0]
+            if root is None:
+                return None
+
+            return classType(root=root)
+
+        except Exception as ex:
+
+            # trace and ignore exceptions; the event is parsed only once.
+            _logsi.LogException("SoundTouch event '%s' model could not be parsed: %s" % (self._Category, str(ex)), ex, logToSystemLogger=False)
+            return None
+
+
+    @staticmethod
+    def GetModelType(category:SoundTouchNotifyCategorys) -> type:
+        """
+        Returns the configuration model class type of an event category.
+
+        Args:
+            category (SoundTouchNotifyCategorys | str):
+                The event category (e.g. `SoundTouchNotifyCategorys.volumeUpdated`).
+
+        Returns:
+            The configuration model class type (e.g. `Volume`), or None if events of the
+            category do not contain a configuration.
+        """
+        entry:tuple = _EVENT_MODELS.get(SoundTouchNotifyCategorys.toString(category), None)
+        if entry is None:
+            return None
+        return entry[1]
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SoundTouchEvent:'
+        msg = '%s Category="%s"' % (msg, self._Category)
+        if self.DeviceId is not None: msg = '%s DeviceId="%s"' % (msg, self.DeviceId)
+        msg = '%s IsResync=%s' % (msg, self.IsResync)
+        msg = '%s IsParsed=%s' % (msg, self._IsParsed)
+        return msg
@@ -0,0 +1,257 @@
+# external package imports.
+import heapq
+import threading
+import time
+
+# our package imports.
+from bosesoundtouchapi.bstutils import export
+from bosesoundtouchapi.soundtoucherror import SoundTouchError
+from bosesoundtouchapi.soundtouchnotifycategorys import SoundTouchNotifyCategorys
+
+# get smartinspect logger reference; create a new session for this module name.
+import logging
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+class _SoundTouchCoalesceWindow:
+    """
+    An open coalescing window of a web socket and category.
+    """
+
+    __slots__ = ('Category', 'Event', 'HasEvent', 'Socket')
+
+    def __init__(self, socket, category:str) -> None:
+        self.Category:str = category
+        self.Event:object = None
+        self.HasEvent:bool = False
+        self.Socket = socket
+
+
+@export
+class SoundTouchEventCoalescer:
+    """
+    Coalesces bursts of `SoundTouchWebSocket` events of the same category, so that listeners
+    are notified once per window instead of once per event.
+
+    SoundTouch devices send bursts of events for a single logical change; e.g. several
+    "nowPlayingUpdated" events per track change (buffering, playing, position updates), or a
+    flood of "volumeUpdated" events while the volume knob is turned.  For each category that
+    has a window configured (see `SetWindow`), the first event of a burst opens a window of
+    the configured duration; events received while the window is open replace each other
+    (latest wins), and listeners are notified:
+    - on the leading edge (if enabled): with the first event, when the window opens.
+    - on the trailing edge (if enabled): with the latest event received while the window was
+      open, when the window closes.
+
+    Events of categories without a window are not coalesced.  The client configuration cache
+    and recent list cache are updated from every event, regardless of coalescing.
+
+    Trailing edge events are delivered on the coalescer thread (or handed to the web socket
+    `SoundTouchEventDispatcher`, if one is used).  A coalescer can be shared by many web
+    sockets; windows are kept per web socket and category.
+
+    Threadsafety:
+        This class is fully thread-safe.
+
+    <details>
+        <summary>Sample Code</summary>
+    ```python
+    .. include:: ../../docs/include/samplecode/SoundTouchEventCoalescer/_ClassInit.py
+    ```
+    </details>
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+        """
+        # initialize internal storage.
+        self._Coalesced:int = 0
+        self._Condition:threading.Condition = threading.Condition()
+        self._Deadlines:list = []
+        self._Delivered:int = 0
+        self._Sequence:int = 0
+        self._Settings:dict = {}
+        self._Thread:threading.Thread = None
+        self._Windows:dict = {}
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def Coalesced(self) -> int:
+        """
+        Number of events that were replaced by a later event of the same window (and were not
+        delivered to listeners).
+        """
+        return self._Coalesced
+
+
+    @property
+    def Delivered(self) -> int:
+        """
+        Number of events that were delivered to listeners on a leading or trailing edge.
+        """
+        return self._Delivered
+
+
+    def _Run(self) -> None:
+        """
+        Coalescer thread that closes windows when they expire.
+        """
+        while True:
+            expired:list = []
+            with self._Condition:
+                while len(self._Deadlines) == 0:
+                    self._Condition.wait()
+                timeout:float = self._Deadlines[0][0] - time.monotonic()
+                if timeout > 0:
+                    self._Condition.wait(timeout)
+                    continue
+                while (len(self._Deadlines) > 0) and (self._Deadlines[0][0] <= time.monotonic()):
+                    deadline, sequence, key = heapq.heappop(self._Deadlines)
+                    window:_SoundTouchCoalesceWindow = self._Windows.pop(key, None)
+                    if (window is not None) and (window.HasEvent):
+                        trailing:bool = self._Settings.get(window.Category, (0, False, True))[2]
+                        if trailing:
+                            self._Delivered += 1
+                            expired.append(window)
+                        else:
+                            self._Coalesced += 1
+
+            # deliver trailing edge events outside of the lock.
+            for window in expired:
+                try:
+                    window.Socket._DeliverListeners(window.Category, window.Event)
+                except Exception as ex:
+                    _logsi.LogException("SoundTouchEventCoalescer '%s' delivery error: %s" % (window.Category, str(ex)), ex, logToSystemLogger=False)
+
+
+    def Coalesce(self, socket, category:str, event:object) -> bool:
+        """
+        Adds an event to the coalescing window of its web socket and category.
+
+        Args:
+            socket (SoundTouchWebSocket):
+                The web socket that received the event.
+            category (str):
+                The event category.
+            event (object):
+                The event argument.
+
+        Returns:
+            True if the caller should notify listeners of the event now (the category is not
+            coalesced, or the event is a leading edge event); otherwise, False if the event
+            was taken over by the coalescer.
+        """
+        settings:tuple = self._Settings.get(category, None)
+        if settings is None:
+            return True
+        windowSize, leading, trailing = settings
+
+        key:tuple = (id(socket), category)
+        with self._Condition:
+            window:_SoundTouchCoalesceWindow = self._Windows.get(key, None)
+
+            # is a window open?  if so, then the event replaces the previous one.
+            if window is not None:
+                if window.HasEvent:
+                    self._Coalesced += 1
+                window.Event = event
+                window.HasEvent = True
+                return False
+
+            # open a new window.
+            window = _SoundTouchCoalesceWindow(socket, category)
+            self._Windows[key] = window
+            self._Sequence += 1
+            heapq.heappush(self._Deadlines, (time.monotonic() + windowSize, self._Sequence, key))
+            if self._Thread is None:
+                self._Thread = threading.Thread(target=self._Run, name='SoundTouchEventCoalescer', daemon=True)
+                self._Thread.start()
+            self._Condition.notify()
+
+            if leading:
+                self._Delivered += 1
+                return True
+            window.Event = event
+            window.HasEvent = True
+            return False
+
+
+    def GetWindow(self, category:SoundTouchNotifyCategorys) -> tuple:
+        """
+        Returns the coalescing window settings of a category.
+
+        Args:
+            category (SoundTouchNotifyCategorys | str):
+                The event category.
+
+        Returns:
+            A tuple of (window, leading, trailing), or None if the category is not coalesced.
+        """
+        return self._Settings.get(SoundTouchNotifyCategorys.toString(category), None)
+
+
+    def RemoveWindow(self, category:SoundTouchNotifyCategorys) -> None:
+        """
+        Stops coalescing events of a category.
+
+        Args:
+            category (SoundTouchNotifyCategorys | str):
+                The event category.
+
+        Windows that are already open are closed as configured when they expire.
+        """
+        self._Settings.pop(SoundTouchNotifyCategorys.toString(category), None)
+
+
+    def SetWindow(self, category:SoundTouchNotifyCategorys, window:float, leading:bool=False, trailing:bool=True) -> None:
+        """
+        Coalesces events of a category.
+
+        Args:
+            category (SoundTouchNotifyCategorys | str):
+                The event category (e.g. `SoundTouchNotifyCategorys.volumeUpdated`).
+            window (float):
+                Duration (in seconds) of the coalescing window, which opens with the first
+                event of a burst.
+            leading (bool):
+                True to notify listeners of the first event of a burst immediately; otherwise,
+                False.
+                Default is False.
+            trailing (bool):
+                True to notify listeners of the latest event when the window closes (unless
+                it was already delivered on the leading edge); otherwise, False.
+                Default is True.
+
+        Raises:
+            SoundTouchError:
+                If `window` is not greater than zero, or both `leading` and `trailing` are False.
+        """
+        if (window is None) or (window <= 0):
+            raise SoundTouchError("The 'window' argument must be greater than zero.", logsi=_logsi)
+        if (not leading) and (not trailing):
+            raise SoundTouchError("The 'leading' and/or 'trailing' argument must be True.", logsi=_logsi)
+        self._Settings[SoundTouchNotifyCategorys.toString(category)] = (float(window), bool(leading), bool(trailing))
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SoundTouchEventCoalescer:'
+        msg = '%s Categories=%s' % (msg, str(sorted(self._Settings.keys())))
+        msg = '%s Delivered=%d' % (msg, self._Delivered)
+        msg = '%s Coalesced=%d' % (msg, self._Coalesced)
+        return msg
@@ -0,0 +1,412 @@
+# external package imports.
+from collections import deque
+import threading
+import time
+
+# our package imports.
+from bosesoundtouchapi.bstutils import export
+from bosesoundtouchapi.ws.soundtouchdispatchoverflowpolicys import SoundTouchDispatchOverflowPolicys
+
+# get smartinspect logger reference; create a new session for this module name.
+import logging
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+class _SoundTouchDispatchItem:
+    """
+    A queued event.
+    """
+
+    __slots__ = ('Category', 'EnqueuedAt', 'Event', 'Sequence', 'Socket')
+
+    def __init__(self, socket, category:str, event:object, sequence:int) -> None:
+        self.Category:str = category
+        self.EnqueuedAt:float = time.monotonic()
+        self.Event:object = event
+        self.Sequence:int = sequence
+        self.Socket = socket
+
+
+@export
+class SoundTouchEventDispatcher:
+    """
+    Notifies `SoundTouchWebSocket` listeners on a pool of worker threads, instead of the thread
+    that received the event.
+
+    Events are queued by the receiving thread and dispatched by `Workers` worker threads, so
+    that a slow listener does not delay the receipt of events (or cause ping timeouts).  Events
+    of the same web socket and category are dispatched one at a time, in the order they were
+    received; events of different categories (or web sockets) can be dispatched concurrently.
+
+    The queue holds at most `MaxQueueSize` events; the `OverflowPolicy` controls what happens
+    to a new event when the queue is full (see `SoundTouchDispatchOverflowPolicys`).
+
+    The queue depth and dispatch lag (the time between queueing an event and notifying its
+    listeners) can be monitored with the `GetSnapshot` method.
+
+    A dispatcher can be shared by many web sockets (e.g. all web sockets of a
+    `SoundTouchNotificationHub`).
+
+    Threadsafety:
+        This class is fully thread-safe.
+
+    <details>
+        <summary>Sample Code</summary>
+    ```python
+    .. include:: ../../docs/include/samplecode/SoundTouchEventDispatcher/_ClassInit.py
+    ```
+    </details>
+    """
+
+    def __init__(self, workers:int=4, maxQueueSize:int=1000,
+                 overflowPolicy:SoundTouchDispatchOverflowPolicys=SoundTouchDispatchOverflowPolicys.Block,
+                 blockTimeout:float=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            workers (int):
+                Number of worker threads that notify listeners.
+                Default is 4.
+            maxQueueSize (int):
+                Maximum number of events to queue.
+                Default is 1000.
+            overflowPolicy (SoundTouchDispatchOverflowPolicys):
+                What to do with a new event when the queue is full.
+                Default is `SoundTouchDispatchOverflowPolicys.Block`.
+            blockTimeout (float):
+                Maximum amount of time (in seconds) to wait for room in the queue if the
+                `Block` overflow policy is used; the new event is discarded if the time expires.
+                Default is None (wait indefinitely).
+        """
+        # validations.
+        if (workers is None) or (workers < 1):
+            workers = 1
+        if (maxQueueSize is None) or (maxQueueSize < 1):
+            maxQueueSize = 1
+        if not isinstance(overflowPolicy, SoundTouchDispatchOverflowPolicys):
+            overflowPolicy = SoundTouchDispatchOverflowPolicys.Block
+
+        # initialize internal storage.
+        self._Active:set = set()
+        self._BlockTimeout:float = blockTimeout
+        self._Condition:threading.Condition = threading.Condition()
+        self._Count:int = 0
+        self._Dispatched:int = 0
+        self._Dropped:int = 0
+        self._IsStopping:bool = False
+        self._LagMax:float = 0
+        self._LagLast:float = 0
+        self._LagSum:float = 0
+        self._Lanes:dict = {}
+        self._MaxQueueDepth:int = 0
+        self._MaxQueueSize:int = int(maxQueueSize)
+        self._Merged:int = 0
+        self._OverflowPolicy:SoundTouchDispatchOverflowPolicys = overflowPolicy
+        self._Ready:deque = deque()
+        self._Sequence:int = 0
+        self._Threads:list = []
+        self._Workers:int = int(workers)
+
+
+    def __enter__(self) -> 'SoundTouchEventDispatcher':
+        # if called via a context manager (e.g. "with" statement).
+        self.Start()
+        return self
+
+
+    def __exit__(self, etype, value, traceback) -> None:
+        # if called via a context manager (e.g. "with" statement).
+        self.Stop()
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def IsRunning(self) -> bool:
+        """
+        True if the worker threads are running; otherwise, False.
+        """
+        return len(self._Threads) > 0
+
+
+    @property
+    def MaxQueueSize(self) -> int:
+        """
+        Maximum number of events to queue.
+        """
+        return self._MaxQueueSize
+
+
+    @property
+    def OverflowPolicy(self) -> SoundTouchDispatchOverflowPolicys:
+        """
+        What to do with a new event when the queue is full.
+        """
+        return self._OverflowPolicy
+
+    @OverflowPolicy.setter
+    def OverflowPolicy(self, value:SoundTouchDispatchOverflowPolicys):
+        """
+        Sets the OverflowPolicy property value.
+        """
+        if isinstance(value, SoundTouchDispatchOverflowPolicys):
+            with self._Condition:
+                self._OverflowPolicy = value
+                self._Condition.notify_all()
+
+
+    @property
+    def QueueDepth(self) -> int:
+        """
+        Number of events that are queued (not including events being dispatched).
+        """
+        return self._Count
+
+
+    @property
+    def Workers(self) -> int:
+        """
+        Number of worker threads that notify listeners.
+        """
+        return self._Workers
+
+
+    def _DropOldest(self) -> bool:
+        """
+        Discards the oldest queued event.
+
+        The caller must hold the lock.
+
+        Returns:
+            True if an event was discarded; otherwise, False.
+        """
+        oldestKey:tuple = None
+        oldest:_SoundTouchDispatchItem = None
+        for key, lane in self._Lanes.items():
+            if (len(lane) > 0) and ((oldest is None) or (lane[0].Sequence < oldest.Sequence)):
+                oldestKey = key
+                oldest = lane[0]
+        if oldest is None:
+            return False
+        self._RemoveItems(oldestKey, 1)
+        self._Dropped += 1
+        if _logsi.IsOn(SILevel.Verbose):
+            _logsi.LogVerbose("SoundTouchEventDispatcher queue is full; discarded oldest '%s' event" % (oldest.Category))
+        return True
+
+
+    def _RemoveItems(self, key:tuple, count:int) -> None:
+        """
+        Removes queued events from the front of a lane.
+
+        The caller must hold the lock.
+        """
+        lane:deque = self._Lanes[key]
+        for _ in range(min(count, len(lane))):
+            lane.popleft()
+            self._Count -= 1
+        if len(lane) == 0:
+            if key not in self._Active:
+                self._Ready.remove(key)
+                del self._Lanes[key]
+        self._Condition.notify_all()
+
+
+    def _Run(self) -> None:
+        """
+        Worker thread that dispatches queued events.
+        """
+        workerThread:threading.Thread = threading.current_thread()
+        while True:
+            with self._Condition:
+                while (len(self._Ready) == 0) and (not self._IsStopping):
+                    self._Condition.wait()
+                if len(self._Ready) == 0:
+                    return
+                key:tuple = self._Ready.popleft()
+                item:_SoundTouchDispatchItem = self._Lanes[key].popleft()
+                self._Count -= 1
+                self._Active.add(key)
+                lag:float = time.monotonic() - item.EnqueuedAt
+                self._LagLast = lag
+                self._LagSum += lag
+                if lag > self._LagMax:
+                    self._LagMax = lag
+                self._Condition.notify_all()
+
+            try:
+                item.Socket._InvokeListeners(item.Category, item.Event)
+            except Exception as ex:
+                _logsi.LogException("SoundTouchEventDispatcher '%s' dispatch error: %s" % (item.Category, str(ex)), ex, logToSystemLogger=False)
+
+            with self._Condition:
+                self._Dispatched += 1
+                self._Active.discard(key)
+                if len(self._Lanes[key]) > 0:
+                    self._Ready.append(key)
+                    self._Condition.notify()
+                else:
+                    del self._Lanes[key]
+
+
+    def Dispatch(self, socket, category:str, event:object) -> bool:
+        """
+        Queues an event, to notify the listeners of the given web socket.
+
+        Args:
+            socket (SoundTouchWebSocket):
+                The web socket whose listeners are notified.
+            category (str):
+                The event category.
+            event (object):
+                The event argument.
+
+        Returns:
+            True if the event was queued; otherwise, False if it was discarded (e.g. the
+            `Block` overflow policy timed out).
+
+        The worker threads are started if they are not already running.
+        """
+        if not self.IsRunning:
+            self.Start()
+
+        key:tuple = (id(socket), category)
+        with self._Condition:
+
+            # handle a full queue.
+            if self._Count >= self._MaxQueueSize:
+                policy:SoundTouchDispatchOverflowPolicys = self._OverflowPolicy
+
+                if policy == SoundTouchDispatchOverflowPolicys.MergeLatest:
+                    lane:deque = self._Lanes.get(key, None)
+                    if (lane is not None) and (len(lane) > 0):
+                        self._Merged += len(lane)
+                        self._RemoveItems(key, len(lane))
+                    else:
+                        self._DropOldest()
+
+                elif policy == SoundTouchDispatchOverflowPolicys.DropOldest:
+                    self._DropOldest()
+
+                elif threading.current_thread() not in self._Threads:
+                    # block until there is room in the queue (a listener that raises an event
+                    # is never blocked, as it would wait for itself).
+                    deadline:float = None
+                    if self._BlockTimeout is not None:
+                        deadline = time.monotonic() + self._BlockTimeout
+                    while (self._Count >= self._MaxQueueSize) and (not self._IsStopping) and (self._OverflowPolicy == policy):
+                        timeout:float = None
+                        if deadline is not None:
+                            timeout = deadline - time.monotonic()
+                            if timeout <= 0:
+                                self._Dropped += 1
+                                _logsi.LogWarning("SoundTouchEventDispatcher queue is full; discarded new '%s' event" % (category))
+                                return False
+                        self._Condition.wait(timeout)
+
+            # queue the event.
+            self._Sequence += 1
+            item:_SoundTouchDispatchItem = _SoundTouchDispatchItem(socket, category, event, self._Sequence)
+            lane:deque = self._Lanes.get(key, None)
+            if lane is None:
+                lane = deque()
+                self._Lanes[key] = lane
+            lane.append(item)
+            self._Count += 1
+            if self._Count > self._MaxQueueDepth:
+                self._MaxQueueDepth = self._Count
+            if (len(lane) == 1) and (key not in self._Active):
+                self._Ready.append(key)
+                self._Condition.notify()
+            return True
+
+
+    def GetSnapshot(self) -> dict:
+        """
+        Returns a copy of the dispatcher metrics.
+
+        Returns:
+            A dictionary with the following keys:
+            - queue_depth: number of events that are queued.
+            - max_queue_depth: largest number of events that were queued at once.
+            - dispatched: number of events whose listeners were notified.
+            - dropped: number of events that were discarded because the queue was full.
+            - merged: number of events that were replaced by a newer event of the same category.
+            - lag_last: dispatch lag (in seconds) of the last dispatched event.
+            - lag_max: largest dispatch lag (in seconds).
+            - lag_avg: average dispatch lag (in seconds), or None if no events were dispatched.
+        """
+        with self._Condition:
+            started:int = self._Dispatched + len(self._Active)
+            result:dict = \
+            {
+                'queue_depth': self._Count,
+                'max_queue_depth': self._MaxQueueDepth,
+                'dispatched': self._Dispatched,
+                'dropped': self._Dropped,
+                'merged': self._Merged,
+                'lag_last': self._LagLast,
+                'lag_max': self._LagMax,
+                'lag_avg': (self._LagSum / started) if started > 0 else None,
+            }
+        return result
+
+
+    def Start(self) -> None:
+        """
+        Starts the worker threads.
+
+        This method does nothing if the worker threads are already running.
+        """
+        with self._Condition:
+            if len(self._Threads) > 0:
+                return
+            self._IsStopping = False
+            for index in range(self._Workers):
+                thread:threading.Thread = threading.Thread(target=self._Run, name='SoundTouchEventDispatcher-%d' % (index), daemon=True)
+                self._Threads.append(thread)
+                thread.start()
+
+
+    def Stop(self, timeout:float=None) -> None:
+        """
+        Dispatches the queued events, and stops the worker threads.
+
+        Args:
+            timeout (float):
+                Maximum amount of time (in seconds) to wait for each worker thread to stop.
+                Default is None (wait indefinitely).
+        """
+        with self._Condition:
+            threads:list = self._Threads
+            self._Threads = []
+            self._IsStopping = True
+            self._Condition.notify_all()
+        for thread in threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        msg:str = 'SoundTouchEventDispatcher:'
+        msg = '%s Workers=%d' % (msg, self._Workers)
+        msg = '%s QueueDepth=%d' % (msg, self._Count)
+        msg = '%s MaxQueueSize=%d' % (msg, self._MaxQueueSize)
+        msg = '%s OverflowPolicy=%s' % (msg, self._OverflowPolicy.value)
+        msg = '%s Dispatched=%d' % (msg, self._Dispatched)
+        msg = '%s Dropped=%d' % (msg, self._Dropped)
+        return msg
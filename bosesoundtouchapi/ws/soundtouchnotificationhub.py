@@ -0,0 +1,572 @@
+# external package imports.
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+import threading
+from websocket import STATUS_NORMAL
+
+# our package imports.
+from bosesoundtouchapi.bstutils import export
+
+# get smartinspect logger reference; create a new session for this module name.
+import logging
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+# websocket frame opcodes (RFC 6455).
+_OPCODE_CONTINUATION:int = 0x0
+_OPCODE_TEXT:int = 0x1
+_OPCODE_BINARY:int = 0x2
+_OPCODE_CLOSE:int = 0x8
+_OPCODE_PING:int = 0x9
+_OPCODE_PONG:int = 0xA
+
+# guid used to compute the Sec-WebSocket-Accept handshake response header (RFC 6455).
+_WEBSOCKET_GUID:bytes = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+def _MaskPayload(key:bytes, data:bytes) -> bytes:
+    """
+    Masks (or unmasks) a websocket frame payload with the given 4-byte key.
+    """
+    length:int = len(data)
+    if length == 0:
+        return data
+    keyStream:bytes = (key * (length // 4 + 1))[:length]
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(keyStream, 'big')).to_bytes(length, 'big')
+
+
+class _SoundTouchHubConnection:
+    """
+    A minimal websocket client connection to a single SoundTouch device, built on top of
+    asyncio streams.
+
+    The SoundTouch websocket server only sends small unfragmented xml text messages, so
+    there is no need for a full-blown websocket client package here.
+    """
+
+    def __init__(self, hub:'SoundTouchNotificationHub', socket) -> None:
+        """
+        Args:
+            hub (SoundTouchNotificationHub):
+                The hub that owns the connection.
+            socket (SoundTouchWebSocket):
+                The web socket whose events are raised by the connection.
+        """
+        self._Hub:SoundTouchNotificationHub = hub
+        self._IsActive:bool = False
+        self._LastPongAt:float = None
+        self._Reader:asyncio.StreamReader = None
+        self._Socket = socket
+        self._Task:asyncio.Task = None
+        self._Writer:asyncio.StreamWriter = None
+
+
+    @property
+    def IsActive(self) -> bool:
+        """
+        True if the connection is open; otherwise, False.
+        """
+        return self._IsActive
+
+
+    async def _Handshake(self, host:str, port:int) -> None:
+        """
+        Opens the connection, and performs the websocket opening handshake.
+        """
+        self._Reader, self._Writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=self._Hub.ConnectTimeout)
+
+        key:str = base64.b64encode(os.urandom(16)).decode('ascii')
+        lines:list[str] = []
+        lines.append('GET / HTTP/1.1')
+        lines.append('Host: %s:%d' % (host, port))
+        lines.append('Upgrade: websocket')
+        lines.append('Connection: Upgrade')
+        lines.append('Sec-WebSocket-Key: %s' % key)
+        lines.append('Sec-WebSocket-Version: 13')
+        lines.append('Sec-WebSocket-Protocol: gabbo')
+        self._Writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        await self._Writer.drain()
+
+        # read the handshake response status line and headers.
+        statusLine:bytes = await asyncio.wait_for(self._Reader.readline(), timeout=self._Hub.ConnectTimeout)
+        parts:list[str] = statusLine.decode('latin-1').split(None, 2)
+        if (len(parts) < 2) or (parts[1] != '101'):
+            raise ConnectionError("Handshake status %s" % (statusLine.decode('latin-1').strip() or 'not received'))
+        headers:dict = {}
+        while True:
+            line:bytes = await asyncio.wait_for(self._Reader.readline(), timeout=self._Hub.ConnectTimeout)
+            if line in [b'\r\n', b'\n', b'']:
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        accept:str = base64.b64encode(hashlib.sha1(key.encode('ascii') + _WEBSOCKET_GUID).digest()).decode('ascii')
+        if headers.get('sec-websocket-accept', None) != accept:
+            raise ConnectionError("Invalid Sec-WebSocket-Accept header value in handshake response")
+
+
+    async def _PingLoop(self, pingInterval:int, pingTimeout:int) -> None:
+        """
+        Sends 'KeepAlive' ping requests, and closes the connection if the device does not
+        respond in time.
+        """
+        loop:asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(pingInterval)
+            sentAt:float = loop.time()
+            await self._SendFrame(_OPCODE_PING, b'KeepAlive')
+            await asyncio.sleep(pingTimeout)
+            if (self._LastPongAt is None) or (self._LastPongAt < sentAt):
+                raise TimeoutError("ping/pong timed out")
+
+
+    async def _ReadFrame(self) -> tuple:
+        """
+        Reads a websocket frame.
+
+        Returns:
+            A tuple of (fin, opcode, payload).
+        """
+        header:bytes = await self._Reader.readexactly(2)
+        fin:bool = (header[0] & 0x80) != 0
+        opcode:int = header[0] & 0x0F
+        masked:bool = (header[1] & 0x80) != 0
+        length:int = header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack('!H', await self._Reader.readexactly(2))[0]
+        elif length == 127:
+            length = struct.unpack('!Q', await self._Reader.readexactly(8))[0]
+        if length > self._Hub.MaxMessageSize:
+            raise ConnectionError("Frame size of %d bytes exceeds the maximum message size" % length)
+        key:bytes = None
+        if masked:
+            key = await self._Reader.readexactly(4)
+        payload:bytes = await self._Reader.readexactly(length)
+        if masked:
+            payload = _MaskPayload(key, payload)
+        return fin, opcode, payload
+
+
+    async def _ReceiveLoop(self) -> tuple:
+        """
+        Receives frames until the device closes the connection, raising the web socket
+        events for each message.
+
+        Returns:
+            A tuple of (closeCode, closeMessage) sent by the device.
+        """
+        loop:asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        fragments:list[bytes] = []
+        fragmentOpcode:int = None
+
+        while True:
+            fin, opcode, payload = await self._ReadFrame()
+
+            if opcode == _OPCODE_CLOSE:
+                closeCode:int = None
+                closeMessage:str = None
+                if len(payload) >= 2:
+                    closeCode = struct.unpack('!H', payload[:2])[0]
+                    closeMessage = payload[2:].decode('utf-8', errors='replace')
+                try:
+                    await self._SendFrame(_OPCODE_CLOSE, payload[:2])
+                except Exception:
+                    pass
+                return closeCode, closeMessage
+
+            elif opcode == _OPCODE_PING:
+                await self._SendFrame(_OPCODE_PONG, payload)
+                self._Hub._RaiseEvent(self._Socket._OnWebSocketPing, None, payload)
+
+            elif opcode == _OPCODE_PONG:
+                self._LastPongAt = loop.time()
+                self._Hub._RaiseEvent(self._Socket._OnWebSocketPong, None, payload)
+
+            elif opcode in [_OPCODE_TEXT, _OPCODE_BINARY, _OPCODE_CONTINUATION]:
+                if opcode != _OPCODE_CONTINUATION:
+                    fragments = []
+                    fragmentOpcode = opcode
+                fragments.append(payload)
+                if fin:
+                    message:bytes = b''.join(fragments)
+                    fragments = []
+                    if fragmentOpcode == _OPCODE_TEXT:
+                        message = message.decode('utf-8')
+                    self._Hub._RaiseEvent(self._Socket._OnWebSocketMessage, None, message)
+
+
+    async def _SendFrame(self, opcode:int, payload:bytes) -> None:
+        """
+        Sends a (masked) websocket frame.
+        """
+        length:int = len(payload)
+        header:bytes = None
+        if length < 126:
+            header = struct.pack('!BB', 0x80 | opcode, 0x80 | length)
+        elif length < 65536:
+            header = struct.pack('!BBH', 0x80 | opcode, 0x80 | 126, length)
+        else:
+            header = struct.pack('!BBQ', 0x80 | opcode, 0x80 | 127, length)
+        key:bytes = os.urandom(4)
+        self._Writer.write(header + key + _MaskPayload(key, payload))
+        await self._Writer.drain()
+
+
+    async def Run(self, host:str, port:int, pingInterval:int, pingTimeout:int) -> None:
+        """
+        Connects to the device and receives notifications until the connection is closed
+        (or the task is cancelled).
+        """
+        closeCode:int = None
+        closeMessage:bytes = None
+        pingTask:asyncio.Task = None
+        try:
+
+            await self._Handshake(host, port)
+            self._IsActive = True
+            self._Hub._RaiseEvent(self._Socket._OnWebSocketOpen, None, False)
+
+            # if this is a reconnect, then query the configurations that may have changed while
+            # disconnected on an executor thread (so that other connections are not blocked), and
+            # raise their update events before any notifications that the device sent since then.
+            if self._Socket.IsReconnect:
+                events:list = []
+                try:
+                    events = await asyncio.get_running_loop().run_in_executor(None, self._Socket._GetResyncEvents)
+                except Exception as ex:
+                    _logsi.LogException("SoundTouchNotificationHub resync error: %s" % (str(ex)), ex, logToSystemLogger=False)
+                self._Hub._RaiseEvent(self._Socket._NotifyResyncEvents, events)
+
+            # the receive loop ends when the device closes the connection, or when the
+            # ping loop detects a timeout.
+            receiveTask:asyncio.Task = asyncio.ensure_future(self._ReceiveLoop())
+            waitFor:list = [receiveTask]
+            if pingInterval > 0:
+                pingTask = asyncio.ensure_future(self._PingLoop(pingInterval, pingTimeout))
+                waitFor.append(pingTask)
+            try:
+                done, pending = await asyncio.wait(waitFor, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                receiveTask.cancel()
+                raise
+            if receiveTask in done:
+                closeCode, closeMessage = receiveTask.result()
+            else:
+                receiveTask.cancel()
+                pingTask.result()
+
+        except asyncio.CancelledError:
+
+            # connection was stopped by the hub; send a normal close to the device.
+            closeCode = STATUS_NORMAL
+            closeMessage = b'goodbye'
+            if self._IsActive:
+                try:
+                    await asyncio.wait_for(self._SendFrame(_OPCODE_CLOSE, struct.pack('!H', STATUS_NORMAL) + closeMessage), timeout=1)
+                except BaseException:
+                    pass
+            raise
+
+        except Exception as ex:
+
+            self._Hub._RaiseEvent(self._Socket._OnWebSocketError, None, ex)
+
+        finally:
+
+            if pingTask is not None:
+                pingTask.cancel()
+            self._IsActive = False
+            if self._Writer is not None:
+                try:
+                    self._Writer.close()
+                except Exception:
+                    pass
+            self._Hub._RaiseEvent(self._Socket._OnWebSocketClose, None, closeCode, closeMessage)
+
+
+    async def Supervise(self, host:str, port:int, pingInterval:int, pingTimeout:int) -> None:
+        """
+        Runs the connection, and re-establishes it (after a backoff delay) if it was lost and
+        the web socket `AutoReconnect` property is enabled.
+        """
+        while True:
+            await self.Run(host, port, pingInterval, pingTimeout)
+            if not self._Socket.AutoReconnect:
+                return
+            delay:float = self._Socket._GetReconnectDelay()
+            _logsi.LogVerbose("SoundTouchNotificationHub connection to '%s' lost; reconnecting in %.1f seconds" % (host, delay))
+            await asyncio.sleep(delay)
+
+
+@export
+class SoundTouchNotificationHub:
+    """
+    Receives notifications for many SoundTouch devices on a single event loop thread.
+
+    Each `SoundTouchWebSocket` started with its own `StartNotification` method uses a
+    dedicated thread for its connection.  A hub instead multiplexes the connections of all
+    web sockets that were created with the `hub` argument on one asyncio event loop, running
+    on one thread; the number of threads used does not depend on the number of devices.
+
+    Events are raised on the hub thread, through the same `SoundTouchWebSocket` listener
+    API (e.g. `AddListener`), so existing listeners do not need to change.  Since the hub
+    thread is shared by all devices, listeners should return quickly.
+
+    Lost connections are re-established if the web socket `AutoReconnect` property is enabled;
+    the configurations queried after a reconnect (see `SoundTouchWebSocket.Resync`) are queried
+    on an executor thread, so that other connections are not blocked.
+
+    Threadsafety:
+        This class is fully thread-safe.
+
+    <details>
+        <summary>Sample Code</summary>
+    ```python
+    .. include:: ../../docs/include/samplecode/SoundTouchNotificationHub/_ClassInit.py
+    ```
+    </details>
+    """
+
+    def __init__(self, connectTimeout:float=10, maxMessageSize:int=1048576) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            connectTimeout (float):
+                Amount of time (in seconds) to wait for a connection to a device to be
+                established.
+                Default is 10 seconds.
+            maxMessageSize (int):
+                Maximum size (in bytes) of a message received from a device; the connection
+                is closed if a larger message is received.
+                Default is 1048576 (1 MB).
+        """
+        # validations.
+        if (connectTimeout is None) or (connectTimeout <= 0):
+            connectTimeout = 10
+        if (maxMessageSize is None) or (maxMessageSize < 1):
+            maxMessageSize = 1048576
+
+        # initialize internal storage.
+        self._ConnectTimeout:float = float(connectTimeout)
+        self._Connections:dict = {}
+        self._Lock:threading.RLock = threading.RLock()
+        self._Loop:asyncio.AbstractEventLoop = None
+        self._MaxMessageSize:int = int(maxMessageSize)
+        self._Thread:threading.Thread = None
+
+
+    def __enter__(self) -> 'SoundTouchNotificationHub':
+        # if called via a context manager (e.g. "with" statement).
+        self.Start()
+        return self
+
+
+    def __exit__(self, etype, value, traceback) -> None:
+        # if called via a context manager (e.g. "with" statement).
+        self.Stop()
+
+
+    def __len__(self) -> int:
+        return len(self._Connections)
+
+
+    def __repr__(self) -> str:
+        return self.ToString()
+
+
+    def __str__(self) -> str:
+        return self.ToString()
+
+
+    @property
+    def ConnectTimeout(self) -> float:
+        """
+        Amount of time (in seconds) to wait for a connection to a device to be established.
+        """
+        return self._ConnectTimeout
+
+
+    @property
+    def IsRunning(self) -> bool:
+        """
+        True if the hub event loop thread is running; otherwise, False.
+        """
+        return (self._Thread is not None) and (self._Thread.is_alive())
+
+
+    @property
+    def MaxMessageSize(self) -> int:
+        """
+        Maximum size (in bytes) of a message received from a device.
+        """
+        return self._MaxMessageSize
+
+
+    @property
+    def Sockets(self) -> list:
+        """
+        List of `SoundTouchWebSocket` instances whose notifications are received by the hub.
+        """
+        with self._Lock:
+            return list(self._Connections.keys())
+
+
+    def _IsConnectionActive(self, socket) -> bool:
+        """
+        Returns True if the connection of the given web socket is open; otherwise, False.
+        """
+        connection:_SoundTouchHubConnection = self._Connections.get(socket, None)
+        return (connection is not None) and (connection.IsActive)
+
+
+    def _RaiseEvent(self, method, *args) -> None:
+        """
+        Calls a web socket event method, logging (and ignoring) any exceptions.
+
+        Exceptions raised while processing a message are reported to the web socket error
+        event, the same as a dedicated web socket thread does.
+        """
+        try:
+            method(*args)
+        except Exception as ex:
+            _logsi.LogException("SoundTouchNotificationHub event exception: %s" % (str(ex)), ex, logToSystemLogger=False)
+            if method.__name__ == '_OnWebSocketMessage':
+                try:
+                    method.__self__._OnWebSocketError(None, ex)
+                except Exception:
+                    pass
+
+
+    def _Run(self, loopReady:threading.Event) -> None:
+        """
+        Runs the hub event loop until the hub is stopped.
+        """
+        loop:asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._Loop = loop
+        loopReady.set()
+        try:
+            loop.run_forever()
+
+            # cancel connections that are still running, and let them send their close frames.
+            tasks:list = [ task for task in asyncio.all_tasks(loop) if not task.done() ]
+            for task in tasks:
+                task.cancel()
+            if len(tasks) > 0:
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        finally:
+            loop.close()
+
+
+    def _StartConnection(self, socket, connection:_SoundTouchHubConnection) -> None:
+        """
+        Starts the connection task of a web socket; must be called on the hub thread.
+        """
+        connection._Task = asyncio.ensure_future(connection.Supervise(socket.Client.Device.Host, socket.Port, socket.PingInterval, socket._PING_TIMEOUT))
+
+
+    def Add(self, socket) -> None:
+        """
+        Starts receiving notifications for the given web socket.
+
+        Args:
+            socket (SoundTouchWebSocket):
+                The web socket whose notifications are received by the hub.
+
+        The hub is started if it is not already running.  This method does nothing if the
+        web socket was already added.
+        """
+        with self._Lock:
+            if socket in self._Connections:
+                return
+            if not self.IsRunning:
+                self.Start()
+            connection:_SoundTouchHubConnection = _SoundTouchHubConnection(self, socket)
+            self._Connections[socket] = connection
+            _logsi.LogVerbose("SoundTouchNotificationHub is connecting to device '%s' (ws://%s:%d/)" % (socket.Client.Device.DeviceName, socket.Client.Device.Host, socket.Port))
+            self._Loop.call_soon_threadsafe(self._StartConnection, socket, connection)
+
+
+    def Remove(self, socket) -> None:
+        """
+        Stops receiving notifications for the given web socket, and closes its connection.
+
+        Args:
+            socket (SoundTouchWebSocket):
+                The web socket to remove.
+
+        This method does nothing if the web socket was not added.
+        """
+        with self._Lock:
+            connection:_SoundTouchHubConnection = self._Connections.pop(socket, None)
+            if (connection is None) or (not self.IsRunning):
+                return
+
+            # cancel the connection task on the hub thread, and wait for it to close.
+            async def _Cancel() -> None:
+                if connection._Task is not None:
+                    connection._Task.cancel()
+                    await asyncio.gather(connection._Task, return_exceptions=True)
+
+            if threading.current_thread() is self._Thread:
+                self._Loop.create_task(_Cancel())
+            else:
+                try:
+                    asyncio.run_coroutine_threadsafe(_Cancel(), self._Loop).result(timeout=self._ConnectTimeout)
+                except Exception as ex:
+                    _logsi.LogException("SoundTouchNotificationHub connection close error: %s" % (str(ex)), ex, logToSystemLogger=False)
+
+
+    def Start(self) -> None:
+        """
+        Starts the hub event loop thread.
+
+        This method does nothing if the hub is already running.
+        """
+        with self._Lock:
+            if self.IsRunning:
+                return
+            loopReady:threading.Event = threading.Event()
+            self._Thread = threading.Thread(target=self._Run, args=(loopReady,), name='SoundTouchNotificationHubDaemon', daemon=True)
+            self._Thread.start()
+            loopReady.wait()
+            _logsi.LogVerbose("SoundTouchNotificationHub event loop thread started")
+
+
+    def Stop(self) -> None:
+        """
+        Closes all connections, and stops the hub event loop thread.
+
+        This method does nothing if the hub is not running.
+        """
+        with self._Lock:
+            thread:threading.Thread = self._Thread
+            if (thread is None):
+                return
+            self._Connections.clear()
+            if (self._Loop is not None) and (not self._Loop.is_closed()):
+                self._Loop.call_soon_threadsafe(self._Loop.stop)
+            if thread is not threading.current_thread():
+                thread.join()
+            self._Thread = None
+            self._Loop = None
+            _logsi.LogVerbose("SoundTouchNotificationHub event loop thread stopped")
+
+
+    def ToString(self) -> str:
+        """
+        Returns a displayable string representation of the class.
+        """
+        active:int = len([ connection for connection in list(self._Connections.values()) if connection.IsActive ])
+        msg:str = 'SoundTouchNotificationHub:'
+        msg = '%s IsRunning=%s' % (msg, self.IsRunning)
+        msg = '%s (%d sockets, %d connected)' % (msg, len(self._Connections), active)
+        return msg
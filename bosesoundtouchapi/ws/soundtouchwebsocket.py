@@ -1,4 +1,6 @@
 # external package imports.
+from concurrent.futures import ThreadPoolExecutor
+import copy
 import time
 from threading import Thread
 import threading
@@ -7,13 +9,19 @@ from xml.etree import ElementTree as xmltree
 
 # our package imports.
 from bosesoundtouchapi.bstappmessages import BSTAppMessages
-from bosesoundtouchapi.bstutils import export
+from bosesoundtouchapi.bstutils import export, _ExponentialBackoff
 from bosesoundtouchapi.soundtouchclient import SoundTouchClient
 from bosesoundtouchapi.soundtouchnotifycategorys import SoundTouchNotifyCategorys
+from bosesoundtouchapi.models.contentitem import ContentItem
 from bosesoundtouchapi.models.nowplayingstatus import NowPlayingStatus
 from bosesoundtouchapi.models.recent import Recent
+from bosesoundtouchapi.models.recentlist import RecentList
 from bosesoundtouchapi.models.sourcelist import SourceList
 from bosesoundtouchapi.uri.soundtouchnodes import SoundTouchNodes
+from bosesoundtouchapi.ws.soundtouchevent import SoundTouchEvent, _EVENT_MODELS
+from bosesoundtouchapi.ws.soundtoucheventcoalescer import SoundTouchEventCoalescer
+from bosesoundtouchapi.ws.soundtoucheventdispatcher import SoundTouchEventDispatcher
+from bosesoundtouchapi.ws.soundtouchnotificationhub import SoundTouchNotificationHub
 
 # get smartinspect logger reference; create a new session for this module name.
 import logging
@@ -24,13 +32,47 @@ if (_logsi == None):
 _logsi.SystemLogger = logging.getLogger(__name__)
 
 
+# notification events that are always consumed, regardless of listeners.
+# the navigate cache is cleared by "sourcesUpdated" events.
+_PREFILTER_CATEGORYS:tuple = ('sourcesUpdated',)
+
+# configurations that are queried from the device after a reconnect, and raised as update events.
+# value = tuple of (event category, configuration uri).
+_RESYNC_EVENTS:tuple = \
+(
+    ('nowPlayingUpdated', SoundTouchNodes.nowPlaying),
+    ('volumeUpdated', SoundTouchNodes.volume),
+    ('zoneUpdated', SoundTouchNodes.getZone),
+    ('presetsUpdated', SoundTouchNodes.presets),
+)
+
+
+class _SoundTouchTypedListener:
+    """
+    A listener that receives `SoundTouchEvent` instances instead of event arguments.
+    """
+
+    def __init__(self, listener) -> None:
+        self.Listener = listener
+
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _SoundTouchTypedListener):
+            return self.Listener == other.Listener
+        return self.Listener == other
+
+
+    def __hash__(self) -> int:
+        return hash(self.Listener)
+
+
 class _SoundTouchWebSocketThread(Thread):
     """
     A small utility class wrapping the WebSocketApp::run_forever() method in an
     extra Thread.
     """
 
-    def __init__(self, ws:WebSocketApp, pingInterval:int, pingTimeout:int) -> None:
+    def __init__(self, ws:WebSocketApp, pingInterval:int, pingTimeout:int, socket:'SoundTouchWebSocket'=None) -> None:
         """
         Args:
             ws (WebSocketApp):
@@ -42,11 +84,16 @@ class _SoundTouchWebSocketThread(Thread):
             pingTimeout (int):
                 Interval (in seconds) to wait for the ping response from the SoundTouch 
                 WebSocket, if websocket support is enabled for the SoundTouch device.
+            socket (SoundTouchWebSocket):
+                The web socket that owns the thread; its `AutoReconnect` property controls
+                whether the connection is re-established after it was lost.
         """
         super().__init__()
         self._IsRunForeverActive:bool = False
         self._PingInterval:int = pingInterval
         self._PingTimeout:int = pingTimeout
+        self._Socket:SoundTouchWebSocket = socket
+        self._StopEvent:threading.Event = threading.Event()
         self._wsocket = ws
 
 
@@ -65,13 +112,32 @@ class _SoundTouchWebSocketThread(Thread):
         """
         Starts the event loop for WebSocket framework.  
         """
-        self._IsRunForeverActive = True
+        while True:
+
+            self._IsRunForeverActive = True
         
-        self._wsocket.run_forever(ping_interval=self._PingInterval, 
-                                  ping_timeout=self._PingTimeout, 
-                                  ping_payload='KeepAlive')
+            self._wsocket.run_forever(ping_interval=self._PingInterval, 
+                                      ping_timeout=self._PingTimeout, 
+                                      ping_payload='KeepAlive')
         
-        self._IsRunForeverActive = False
+            self._IsRunForeverActive = False
+
+            # reconnect (after a backoff delay) if the connection was lost, unless we were stopped.
+            if (self._Socket is None) or (not self._Socket.AutoReconnect) or (self._StopEvent.is_set()):
+                break
+            delay:float = self._Socket._GetReconnectDelay()
+            _logsi.LogVerbose("SoundTouch web socket connection lost; reconnecting in %.1f seconds" % (delay))
+            if self._StopEvent.wait(delay):
+                break
+
+
+    def Stop(self) -> None:
+        """
+        Stops the event loop, and any pending reconnect.
+        """
+        self._StopEvent.set()
+        if self._wsocket is not None:
+            self._wsocket.keep_running = False
         
 #ws.run_forever(sslopt={"cert_reqs": ssl.CERT_NONE}, ping_interval=10, ping_timeout=5)
 
@@ -97,6 +163,31 @@ class SoundTouchWebSocket:
     For more information and code samples refer to `bosesoundtouchapi.soundtouchclient.GetCapabilities`
     method.
 
+    By default, each instance uses a dedicated thread to receive notifications.  When monitoring
+    many devices, specify a `SoundTouchNotificationHub` instance with the `hub` argument instead;
+    the notifications of all web sockets that share the hub are received on a single thread.
+
+    If `autoReconnect` is enabled, a lost connection (e.g. the device rebooted, or the network
+    dropped) is re-established with a jittered exponential backoff delay.  Once reconnected, the
+    configurations that may have changed while disconnected (now playing, volume, zone and 
+    presets) are queried from the device and raised as update events, so listeners do not have
+    to poll the device to catch up.  See the `Resync` method for more information.
+
+    Listeners are notified on the thread that received the event, unless a `SoundTouchEventDispatcher`
+    is specified with the `dispatcher` argument; the listeners are then notified on the dispatcher
+    worker threads, so that a slow listener does not delay the receipt of events.
+
+    Bursts of events of the same category (e.g. "volumeUpdated" events while the volume knob is
+    turned) can be coalesced into one listener notification per burst by specifying a
+    `SoundTouchEventCoalescer` with the `coalescer` argument.
+
+    Listeners that are added as typed listeners (see `AddListener`) receive a `SoundTouchEvent`
+    instance, whose configuration model (e.g. `Volume`) is parsed at most once per event and
+    shared by all listeners of the event.
+
+    Messages that contain no events that would be consumed (e.g. "userActivityUpdate" messages,
+    if nobody listens for them) are discarded without being parsed; see the `Prefilter` property.
+
     <details>
         <summary>Sample Code</summary>
     ```python
@@ -111,7 +202,9 @@ class SoundTouchWebSocket:
     websocket server.
     """
 
-    def __init__(self, client:SoundTouchClient, port:int=8080, pingInterval:int=0) -> None:
+    def __init__(self, client:SoundTouchClient, port:int=8080, pingInterval:int=0, updateConfigurationCache:bool=False, hub:SoundTouchNotificationHub=None,
+                 autoReconnect:bool=False, reconnectDelay:float=1, maxReconnectDelay:float=60,
+                 dispatcher:SoundTouchEventDispatcher=None, coalescer:SoundTouchEventCoalescer=None, prefilter:bool=True) -> None:
         """
         Initializes a new instance of the class.
         
@@ -126,6 +219,38 @@ class SoundTouchWebSocket:
                 WebSocket, if websocket support is enabled for the SoundTouch device.  Set
                 this value to zero to disable keepalive ping requests.  
                 Default is 0 (disabled).
+            updateConfigurationCache (bool):
+                True to update the client `ConfigurationCache` from the notifications that are
+                received; otherwise, False.  
+                Default is False.  
+                See the `UpdateConfigurationCache` property for more information.
+            hub (SoundTouchNotificationHub):
+                A hub that receives the notifications on its shared event loop thread, or None
+                to use a dedicated thread for this instance.  
+                Default is None.
+            autoReconnect (bool):
+                True to re-establish the connection if it was lost; otherwise, False.  
+                Default is False.
+            reconnectDelay (float):
+                Delay (in seconds) before the first reconnect attempt; the delay is doubled
+                for each failed attempt (up to `maxReconnectDelay`), with random jitter.  
+                Default is 1 second.
+            maxReconnectDelay (float):
+                Maximum delay (in seconds) between reconnect attempts.  
+                Default is 60 seconds.
+            dispatcher (SoundTouchEventDispatcher):
+                A dispatcher that notifies listeners on its worker threads, or None to notify
+                listeners on the thread that received the event.  
+                Default is None.
+            coalescer (SoundTouchEventCoalescer):
+                A coalescer that notifies listeners once per burst of events of the same 
+                category, or None to notify listeners of every event.  
+                Default is None.
+            prefilter (bool):
+                True to skip parsing of messages that contain no events that would be consumed
+                by a listener (or the client caches); otherwise, False.  
+                Default is True.  
+                See the `Prefilter` property for more information.
         """
         # validations.
         if (port is None) or (not isinstance(port, int)):
@@ -135,13 +260,30 @@ class SoundTouchWebSocket:
             pingInterval = 60
         if (pingInterval > 0) and (pingInterval <= SoundTouchWebSocket._PING_TIMEOUT):
             pingInterval = 60
+        if (reconnectDelay is None) or (reconnectDelay <= 0):
+            reconnectDelay = 1
+        if (maxReconnectDelay is None) or (maxReconnectDelay < reconnectDelay):
+            maxReconnectDelay = reconnectDelay
 
         # initialize internal storage.
+        self._AutoReconnect:bool = bool(autoReconnect)
         self._CachedListeners:dict = {}
         self._Client:SoundTouchClient = client
+        self._Coalescer:SoundTouchEventCoalescer = coalescer
+        self._Dispatcher:SoundTouchEventDispatcher = dispatcher
+        self._Hub:SoundTouchNotificationHub = hub
+        self._MaxReconnectDelay:float = float(maxReconnectDelay)
+        self._OpenCount:int = 0
         self._PingInterval:int = int(pingInterval)
         self._Port:int = int(port)
+        self._Prefilter:bool = bool(prefilter)
+        self._PrefilterIsStale:bool = True
+        self._PrefilterPatterns:tuple = None
+        self._PrefilterPatternsBytes:tuple = None
+        self._ReconnectAttempt:int = 0
+        self._ReconnectDelay:float = float(reconnectDelay)
         self._Thread = None
+        self._UpdateConfigurationCache:bool = bool(updateConfigurationCache)
         self._WebsocketClient:WebSocketApp = None
         self._Lock = threading.RLock()        
 
@@ -165,6 +307,25 @@ class SoundTouchWebSocket:
         return self.ToString()
 
 
+    @property
+    def AutoReconnect(self) -> bool:
+        """ 
+        True to re-establish the connection (with a jittered exponential backoff delay) if it
+        was lost; otherwise, False.  
+
+        Default is False.
+        """
+        return self._AutoReconnect
+
+    @AutoReconnect.setter
+    def AutoReconnect(self, value:bool):
+        """ 
+        Sets the AutoReconnect property value.
+        """
+        if isinstance(value, bool):
+            self._AutoReconnect = value
+
+
     @property
     def Client(self) -> SoundTouchClient:
         """ 
@@ -173,6 +334,42 @@ class SoundTouchWebSocket:
         return self._Client
 
 
+    @property
+    def Coalescer(self) -> SoundTouchEventCoalescer:
+        """ 
+        The `SoundTouchEventCoalescer` instance that coalesces bursts of events, or None if
+        listeners are notified of every event.
+        """
+        return self._Coalescer
+
+
+    @property
+    def Dispatcher(self) -> SoundTouchEventDispatcher:
+        """ 
+        The `SoundTouchEventDispatcher` instance that notifies listeners, or None if listeners
+        are notified on the thread that received the event.
+        """
+        return self._Dispatcher
+
+
+    @property
+    def Hub(self) -> SoundTouchNotificationHub:
+        """ 
+        The `SoundTouchNotificationHub` instance that receives the notifications, or None if
+        a dedicated thread is used.
+        """
+        return self._Hub
+
+
+    @property
+    def IsReconnect(self) -> bool:
+        """ 
+        True if the current connection was re-established after a previous connection (since
+        `StartNotification` was called) was lost; otherwise, False.
+        """
+        return self._OpenCount > 1
+
+
     @property
     def IsThreadRunForeverActive(self) -> bool:
         """ 
@@ -182,11 +379,21 @@ class SoundTouchWebSocket:
         loop to exit.
         """
         result:bool = False
-        if self._Thread is not None:
+        if self._Hub is not None:
+            result = self._Hub._IsConnectionActive(self)
+        elif self._Thread is not None:
             result = self._Thread.IsRunForeverActive
         return result
 
 
+    @property
+    def MaxReconnectDelay(self) -> float:
+        """ 
+        Maximum delay (in seconds) between reconnect attempts.
+        """
+        return self._MaxReconnectDelay
+
+
     @property
     def PingInterval(self) -> int:
         """ 
@@ -209,6 +416,211 @@ class SoundTouchWebSocket:
         return self._Port
 
 
+    @property
+    def Prefilter(self) -> bool:
+        """ 
+        True if messages are pre-scanned for the events that would be consumed before they 
+        are parsed; otherwise, False.
+
+        When enabled, a message is only parsed if it contains an event of a category that has
+        listeners (or that updates the client caches); other messages (e.g. "userActivityUpdate"
+        and "SoundTouchSdkInfo" messages, if nobody listens for them) are discarded without
+        parsing them.  The pre-scan never discards a message that would be consumed, but it
+        may parse a message that is not.
+
+        Default is True.
+        """
+        return self._Prefilter
+
+    @Prefilter.setter
+    def Prefilter(self, value:bool):
+        """ 
+        Sets the Prefilter property value.
+        """
+        if isinstance(value, bool):
+            self._Prefilter = value
+
+
+    @property
+    def ReconnectDelay(self) -> float:
+        """ 
+        Delay (in seconds) before the first reconnect attempt.
+        """
+        return self._ReconnectDelay
+
+
+    @property
+    def UpdateConfigurationCache(self) -> bool:
+        """ 
+        True to update the client `ConfigurationCache` from the notifications that are
+        received; otherwise, False.  
+
+        When enabled, configuration updates sent by the device (e.g. `volumeUpdated`, 
+        `nowPlayingUpdated`, `presetsUpdated`, `zoneUpdated`, etc) are parsed into their 
+        configuration classes and pushed into the client `ConfigurationCache` before listeners 
+        are notified; updates that do not contain the new configuration (e.g. `sourcesUpdated`,
+        `bassUpdated`, etc) remove the configuration from the cache, so that it is queried from
+        the device on the next request.  While the notification connection is open, pushed 
+        configurations are kept current by the device, and `Get...()` methods called with
+        `refresh=False` (or `refresh=None`) can use them without querying the device.
+        
+        Default is False.
+        """
+        return self._UpdateConfigurationCache
+
+    @UpdateConfigurationCache.setter
+    def UpdateConfigurationCache(self, value:bool):
+        """ 
+        Sets the UpdateConfigurationCache property value.
+        """
+        if isinstance(value, bool):
+            self._UpdateConfigurationCache = value
+            self._PrefilterIsStale = True
+            if not value:
+                self._Client.ConfigurationCache.ClearPushed()
+
+
+    def _DeliverListeners(self, category:str, event:SoundTouchEvent) -> None:
+        """
+        Notifies listeners of an event, on the dispatcher worker threads (if a dispatcher is
+        used) or on the calling thread.
+        """
+        if self._Dispatcher is not None:
+            self._Dispatcher.Dispatch(self, category, event)
+            return
+        self._InvokeListeners(category, event)
+
+
+    def _GetReconnectDelay(self) -> float:
+        """
+        Returns the delay (in seconds) before the next reconnect attempt.
+        """
+        delay:float = _ExponentialBackoff(self._ReconnectAttempt, self._ReconnectDelay, self._MaxReconnectDelay, 0.5)
+        self._ReconnectAttempt += 1
+        return delay
+
+
+    def _GetResyncEvents(self) -> list:
+        """
+        Queries the configurations that may have changed while disconnected from the device
+        (concurrently), and returns them as update events.
+
+        Returns:
+            A list of (category, event) tuples.
+        """
+        futures:list = []
+        with ThreadPoolExecutor(max_workers=len(_RESYNC_EVENTS), thread_name_prefix='SoundTouchWebSocket') as executor:
+            for category, uri in _RESYNC_EVENTS:
+                futures.append((category, uri, executor.submit(self._Client.Get, uri)))
+
+        events:list = []
+        for category, uri, future in futures:
+            try:
+                msg = future.result()
+                if msg.Response is None:
+                    continue
+            except Exception as ex:
+                _logsi.LogException("SoundTouch web socket resync error for '%s' configuration: %s" % (uri.Path, str(ex)), ex, logToSystemLogger=False)
+                continue
+
+            # wrap the configuration the same way the device does (e.g. "<volumeUpdated><volume>...</volume></volumeUpdated>").
+            event:xmltree.Element = xmltree.Element(category, {'deviceID': str(self._Client.Device.DeviceId), 'resync': 'true'})
+            event.append(msg.Response)
+            events.append((category, event))
+        return events
+
+
+    def _InvokeListenerGroup(self, category:str, listeners:list, event:SoundTouchEvent) -> None:
+        """
+        Calls the given listeners; typed listeners receive the event, and all other listeners
+        receive the event argument.
+        """
+        for listener in listeners:
+            try:
+                if isinstance(listener, _SoundTouchTypedListener):
+                    listener.Listener(self._Client, event)
+                else:
+                    listener(self._Client, event.Argument)
+            except Exception as ex: 
+                _logsi.LogException(BSTAppMessages.BST_WEBSOCKET_EVENTHANDLER_ERROR % (category, str(ex)), ex, logToSystemLogger=False)
+        
+
+    def _InvokeListeners(self, category:str, event:SoundTouchEvent) -> None:
+        """
+        Calls the listeners of the given category (or the listeners of ALL categories).
+
+        Args:
+            category (str):
+                The category of which listeners should be notified from.
+            event (SoundTouchEvent):
+                The event; typed listeners receive the event itself, and all other listeners
+                receive its `Argument` value.
+        """
+        # are listeners defined for ANY category?  if so, then notify them.
+        if ('*' in self._CachedListeners):
+            # only serialize the event for tracing if it will be logged; the event is
+            # logged once, regardless of the number of listeners.
+            if (_logsi.IsOn(SILevel.Verbose)) and (isinstance(event.Argument, xmltree.Element)):
+                eventEncoded = xmltree.tostring(event.Argument, encoding="unicode")
+                _logsi.LogXml(SILevel.Verbose, "SoundTouch device status update NOTIFY (*): '%s'" % (category), eventEncoded, prettyPrint=True)
+            self._InvokeListenerGroup(category, self.GetListenerGroup('*'), event)
+            return
+            
+        # are listeners defined for the specified category?  if so, then notify them.
+        if (category in self._CachedListeners):
+            if (_logsi.IsOn(SILevel.Verbose)) and (isinstance(event.Argument, xmltree.Element)):
+                eventEncoded = xmltree.tostring(event.Argument, encoding="unicode")
+                _logsi.LogXml(SILevel.Verbose, "SoundTouch device status update NOTIFY: '%s'" % (category), eventEncoded, prettyPrint=True)
+            self._InvokeListenerGroup(category, self.GetListenerGroup(category), event)
+            return
+
+
+    def _IsMessageConsumed(self, message:object) -> bool:
+        """
+        Pre-scans a raw message for the start tags of the event categories that would be
+        consumed (by listeners or the client caches).
+
+        Returns:
+            True if the message may contain a consumed event, and must be parsed; otherwise,
+            False if it can be discarded without parsing it.
+
+        The scan may report a false positive (e.g. "<volume" also matches "<volumeUpdated"),
+        which only costs a parse; it never reports a false negative.
+        """
+        if not self._Prefilter:
+            return True
+
+        if self._PrefilterIsStale:
+            self._UpdatePrefilter()
+
+        # are listeners defined for ANY category?  if so, then every message is consumed.
+        patterns:tuple = self._PrefilterPatterns
+        if patterns is None:
+            return True
+
+        isBytes:bool = isinstance(message, (bytes, bytearray))
+        if isBytes:
+            patterns = self._PrefilterPatternsBytes
+
+        # the recent list cache consumes now playing updates, and can be enabled at any time.
+        if self._Client.RecentListCacheEnabled:
+            if (b'<nowPlayingUpdated' if isBytes else '<nowPlayingUpdated') in message:
+                return True
+
+        for pattern in patterns:
+            if pattern in message:
+                return True
+        return False
+
+
+    def _NotifyResyncEvents(self, events:list) -> None:
+        """
+        Notifies listeners of the update events returned by the `_GetResyncEvents` method.
+        """
+        for category, event in events:
+            self.NotifyListeners(category, event)
+
+
     def _OnWebSocketClose(self, wsApp:WebSocketApp, closeCode=None, closeMessage:bytes=None) -> None:
         """
         Event raised by the web socket event listener when a socket has been closed.
@@ -267,6 +679,12 @@ class SoundTouchWebSocket:
             message (bytes):
                 Event argument, in the form of an xml-formatted message.
         """
+        # don't bother parsing the message if nobody would consume its events.
+        if not self._IsMessageConsumed(message):
+            if _logsi.IsOn(SILevel.Verbose):
+                _logsi.LogVerbose("SoundTouch web socket event listener OnMessage event skipped (not consumed): %s" % (message))
+            return
+
         root = xmltree.fromstring(message)
         
         if _logsi.IsOn(SILevel.Verbose):
@@ -299,22 +717,34 @@ class SoundTouchWebSocket:
             self.NotifyListeners(root.tag, root)
 
 
-    def _OnWebSocketOpen(self, wsApp:WebSocketApp) -> None:
+    def _OnWebSocketOpen(self, wsApp:WebSocketApp, resync:bool=True) -> None:
         """
         Event raised by the web socket event listener when a socket has been opened.
         
         Args:
             wsApp (WebSocketApp):
                 Event sender.
+            resync (bool):
+                True to resynchronize the configurations (see `Resync`) if this is a reconnect;
+                otherwise, False if the caller resynchronizes them.
                 
         Note that there is no message argument with this call.
         """
         if _logsi.IsOn(SILevel.Verbose):
             _logsi.LogVerbose("SoundTouch web socket event listener OnOpen event: '%s'" % (SoundTouchNotifyCategorys.WebSocketOpen.value))
+
+        self._OpenCount += 1
+        self._ReconnectAttempt = 0
             
         # notify listeners.
         self.NotifyListeners(SoundTouchNotifyCategorys.WebSocketOpen.value, SoundTouchNotifyCategorys.WebSocketOpen.value)
 
+        # if this is a reconnect, then catch up on the updates that were missed while disconnected.
+        if self.IsReconnect:
+            self.NotifyListeners(SoundTouchNotifyCategorys.WebSocketReconnect.value, SoundTouchNotifyCategorys.WebSocketReconnect.value)
+            if resync:
+                self.Resync()
+
 
     def _OnWebSocketPing(self, wsApp:WebSocketApp, args:object) -> None:
         """
@@ -346,7 +776,44 @@ class SoundTouchWebSocket:
         self.NotifyListeners(SoundTouchNotifyCategorys.WebSocketPong.value, SoundTouchNotifyCategorys.WebSocketPong.value)
 
 
-    def _ProcessEvent_NowPlayingUpdated(self, category:str, event:xmltree.Element) -> None:
+    def _ProcessEvent_ConfigurationUpdated(self, category:str, event:SoundTouchEvent) -> None:
+        """
+        Processes a configuration update event, updating the client ConfigurationCache
+        with the updated configuration.
+
+        Args:
+            category (str):
+                The category of which listeners should be notified from.
+            event (SoundTouchEvent):
+                The event, whose argument is an XML-Element with tag == category.
+        """
+        uri = event.Uri
+        try:
+
+            # if the event does not contain the updated configuration (or it could not be
+            # parsed), then remove it from the cache so that it is queried from the device
+            # on the next request.
+            config = event.Model
+            if config is None:
+                self._Client.ConfigurationCache.pop(uri, None)
+                if _logsi.IsOn(SILevel.Verbose):
+                    _logsi.LogVerbose("SoundTouch device configuration '%s' removed from cache by '%s' event" % (uri.Path, category))
+                return
+
+            # the cache gets its own copy of the model, so that the instance that typed
+            # listeners receive is never modified by the library (or by cache users).
+            self._Client._UpdateConfiguration(uri, copy.deepcopy(config), isPushed=True)
+            if _logsi.IsOn(SILevel.Verbose):
+                _logsi.LogVerbose("SoundTouch device configuration '%s' updated in cache by '%s' event" % (uri.Path, category))
+
+        except Exception as ex:
+
+            # if the update could not be parsed, then remove the (stale) configuration from the cache.
+            self._Client.ConfigurationCache.pop(uri, None)
+            _logsi.LogException(BSTAppMessages.BST_WEBSOCKET_EVENTHANDLER_ERROR % (category, str(ex)), ex, logToSystemLogger=False)
+
+
+    def _ProcessEvent_NowPlayingUpdated(self, category:str, event:SoundTouchEvent) -> None:
         """
         Processes a 'nowPlayingUpdated' event.
 
@@ -356,9 +823,8 @@ class SoundTouchWebSocket:
         Args:
             category (str):
                 The category of which listeners should be notified from.
-            event (xmltree.Element):
-                The event represents either an XML-Element with event.tag == category,
-                or an Exception type if category = `SoundTouchNotifyCategorys.WebSocketError`.
+            event (SoundTouchEvent):
+                The event, whose argument is an XML-Element with tag == category.
         """
         try:
                 
@@ -370,11 +836,14 @@ class SoundTouchWebSocket:
             # otherwise we wind up with multiple entries for the same track!
             with self._Lock:
             
-                # parse the NowPlayingStatus details, and ensure the content is fully playing
+                # get the (shared) NowPlayingStatus details, and ensure the content is fully playing
                 # and within the first 10 seconds of play position.  we do this, as the device 
                 # generates a few nowPlayingUpdated events in various play states (buffering, playing, etc).
-                nowPlaying:NowPlayingStatus = NowPlayingStatus(root=event[0])
-                if (nowPlaying.IsPlaying) and (nowPlaying.Position < 10):
+                nowPlaying:NowPlayingStatus = event.Model
+                if (nowPlaying is not None) and (nowPlaying.IsPlaying) and (nowPlaying.Position < 10):
+
+                    # the event model is shared with listeners, so work on a copy of its content item.
+                    contentItem:ContentItem = copy.copy(nowPlaying.ContentItem)
                          
                     # if SPOTIFY source, convert tracklisturl reference to uri reference.
                     # if the playing content is a context (e.g. artist, playlist, album, etc), then the
@@ -382,39 +851,40 @@ class SoundTouchWebSocket:
                     # individual fields.  Failure to do this results in duplicate items in the cache
                     # with just the contentItem Name field different.
                     if nowPlaying.Source == 'SPOTIFY':
-                        nowPlaying.ContentItem.Name = nowPlaying.Track
-                        nowPlaying.ContentItem.ContainerArt = nowPlaying.ContainerArtUrl
-                        nowPlaying.ContentItem.Location = nowPlaying.TrackId
-                        nowPlaying.ContentItem.TypeValue = 'uri'
+                        contentItem.Name = nowPlaying.Track
+                        contentItem.ContainerArt = nowPlaying.ContainerArtUrl
+                        contentItem.Location = nowPlaying.TrackId
+                        contentItem.TypeValue = 'uri'
 
                     # use current epoch time for created on value.
                     epoch_time:int = int(time.time())
 
                     # does the item already exist in the cache?
-                    idx:int = self._Client.RecentListCache.IndexOfName(nowPlaying.ContentItem.Source, nowPlaying.ContentItem.Name)
-                    recent:Recent = None
-                    if idx == -1:
-                    
-                        # insert new recently played item at top of the list.
+                    recentList:RecentList = self._Client.RecentListCache
+                    recent:Recent = recentList.GetItemByName(contentItem.Source, contentItem.Name)
+                    isNew:bool = (recent is None)
+                    if isNew:
                         recent = Recent()
-                        self._Client.RecentListCache.Recents.insert(0, recent)
-                    
-                    else:
-
-                        # remove the found item from the list, and re-add it at the top.
-                        # this keeps the list in reverse sorted order by CreatedOn date.
-                        recent = self._Client.RecentListCache.Recents.pop(idx)
-                        self._Client.RecentListCache.Recents.insert(0, recent)
 
                     # set recently played item properties from NowPlayingStatus.
-                    recent.ContentItem = nowPlaying.ContentItem
+                    recent.ContentItem = contentItem
                     recent.CreatedOn = epoch_time
                     recent.DeviceId = self._Client.Device.DeviceId
                     recent.RecentId = recent.CreatedOn
+
+                    # insert new recently played item at top of the list, or move the found item 
+                    # to the top; this keeps the list in reverse sorted order by CreatedOn date.
+                    if isNew:
+                        recentList.AddToFront(recent)
+                    else:
+                        recentList.MoveToFront(recent)
                 
                     # add the source title to the results from the cached source list.
-                    sourceList:SourceList = self._Client.GetProperty(SoundTouchNodes.sources, SourceList, False)
-                    if sourceList is not None:
+                    # we only use a source list that is already in the cache, as querying the
+                    # device would block the event thread; items without a title are resolved
+                    # by `GetRecentList(resolveSourceTitles=True)`.
+                    sourceList:SourceList = self._Client[SoundTouchNodes.sources]
+                    if isinstance(sourceList, SourceList):
                         recent.SourceTitle = sourceList.GetTitleBySource(recent.Source, recent.SourceAccount)
 
                     # trace.
@@ -422,27 +892,52 @@ class SoundTouchWebSocket:
 
                     # have we exceeded max items?  if so, then remove the oldest entry(s).
                     # we put it in a loop in case the max items configuration was changed to a lower value.
-                    while (len(self._Client.RecentListCache.Recents) > self._Client.RecentListCacheMaxItems):
-                        recentRemoved:Recent = self._Client.RecentListCache.Recents.pop()
+                    recentRemoved:Recent
+                    for recentRemoved in recentList.Trim(self._Client.RecentListCacheMaxItems):
                         _logsi.LogObject(SILevel.Verbose, "RecentListCache item was removed for device '%s': '%s'" % (self._Client.Device.DeviceName, recentRemoved.Name), recentRemoved, excludeNonPublic=True)
 
-                    # save changes to the file system.
-                    self._Client.RecentListCache.LastUpdatedOn = epoch_time
-                    self._Client._RecentListCacheStore()
+                    # schedule changes to be saved to the file system.
+                    recentList.LastUpdatedOn = epoch_time
+                    self._Client._RecentListCacheStore(recent)
                             
         except Exception as ex:
             
             _logsi.LogException(BSTAppMessages.BST_WEBSOCKET_EVENTHANDLER_ERROR % (category, str(ex)), ex, logToSystemLogger=False)
 
 
-    def AddListener(self, category:SoundTouchNotifyCategorys, listener) -> bool:
+    def _UpdatePrefilter(self) -> None:
+        """
+        Rebuilds the start tag patterns of the event categories that would be consumed,
+        after the listeners (or the configuration cache setting) changed.
+        """
+        # reset the stale flag first, so that a change made while rebuilding is not lost.
+        self._PrefilterIsStale = False
+
+        categorys:set = set(_PREFILTER_CATEGORYS)
+        for category, listeners in list(self._CachedListeners.items()):
+            if len(listeners) > 0:
+                categorys.add(category)
+        if self._UpdateConfigurationCache:
+            categorys.update(_EVENT_MODELS.keys())
+
+        if '*' in categorys:
+            self._PrefilterPatterns = None
+            self._PrefilterPatternsBytes = None
+            return
+
+        self._PrefilterPatterns = tuple('<' + category for category in sorted(categorys))
+        self._PrefilterPatternsBytes = tuple(pattern.encode('utf-8') for pattern in self._PrefilterPatterns)
+
+
+    def AddListener(self, category:SoundTouchNotifyCategorys, listener, typed:bool=False) -> bool:
         """
         Adds a listener provided here to the given category.
 
         Since there are different types of events, the category-string can be used
         to add a listener to a specific notification category. The listener must take
         only two arguments: the `SoundTouchClient` instance, and an xml.etree.ElementTree.Element
-        that contains the status update itself.
+        that contains the status update itself (or a `SoundTouchEvent` instance, if `typed`
+        is True).
 
         Args:
             category (SoundTouchNotifyCategorys):
@@ -453,6 +948,11 @@ class SoundTouchWebSocket:
                 Use `SoundTouchNotifyCategorys.ALL` to receive notifications for any type of update event.
             listener (object):
                 A simple listener method which takes the XML-Element as a passed argument.
+            typed (bool):
+                True to pass a `SoundTouchEvent` instance to the listener instead of the
+                XML-Element; the event `Model` property returns the parsed configuration
+                model (e.g. `Volume`), which is parsed once and shared by all listeners.  
+                Default is False.
         
         Returns:
             True if the listener was added successfully; otherwise, False.
@@ -466,11 +966,16 @@ class SoundTouchWebSocket:
         # convert category argument to string.
         category = SoundTouchNotifyCategorys.toString(category)
 
+        # typed listeners are wrapped, so that they can be told apart when notified.
+        if typed:
+            listener = _SoundTouchTypedListener(listener)
+
         # add the listener to the category list of listeners.
         if category in self._CachedListeners:
             self._CachedListeners[category].append(listener)
         else:
             self._CachedListeners[category] = [listener]
+        self._PrefilterIsStale = True
         return True
 
 
@@ -481,6 +986,7 @@ class SoundTouchWebSocket:
         # remove all listeners.
         if self._CachedListeners is not None:
             self._CachedListeners.clear()
+        self._PrefilterIsStale = True
 
 
     def GetListenerGroup(self, category:str) -> list: # list[function]
@@ -517,35 +1023,33 @@ class SoundTouchWebSocket:
                 or an Exception type if category = `SoundTouchNotifyCategorys.WebSocketError`.
         """
         category = str(category)
+
+        # the event is shared by the recent list cache and all listeners, so that its model is
+        # parsed once; the configuration cache stores a copy of the model.
+        stEvent:SoundTouchEvent = SoundTouchEvent(self._Client, category, event)
+
+        # update the client configuration cache, if requested.
+        if self._UpdateConfigurationCache:
+            if (category in _EVENT_MODELS) and (isinstance(event, xmltree.Element)):
+                self._ProcessEvent_ConfigurationUpdated(category, stEvent)
+            elif (category == SoundTouchNotifyCategorys.WebSocketClose.value) or (category == SoundTouchNotifyCategorys.WebSocketError.value):
+                # pushed configurations are no longer kept current once the connection is lost.
+                self._Client.ConfigurationCache.ClearPushed()
         
+        # cached navigation results may no longer be valid once the device sources change.
+        if category == SoundTouchNotifyCategorys.sourcesUpdated.value:
+            self._Client.NavigateCache.Clear()
+
         # is this a nowPlayingUpdated event?
         if (category == 'nowPlayingUpdated') and (event != None) and (isinstance(event, xmltree.Element)):
-            self._ProcessEvent_NowPlayingUpdated(category, event)
+            self._ProcessEvent_NowPlayingUpdated(category, stEvent)
 
-        # are listeners defined for ANY category?  if so, then notify them.
-        if ('*' in self._CachedListeners):
-            for listener in self.GetListenerGroup('*'):
-                if (event != None) and (isinstance(event, xmltree.Element)):
-                    eventEncoded = xmltree.tostring(event, encoding="unicode")
-                    _logsi.LogXml(SILevel.Verbose, "SoundTouch device status update NOTIFY (*): '%s'" % (category), eventEncoded, prettyPrint=True)
-                try:
-                    listener(self._Client, event)
-                except Exception as ex: 
-                    _logsi.LogException(BSTAppMessages.BST_WEBSOCKET_EVENTHANDLER_ERROR % (category, str(ex)), ex, logToSystemLogger=False)
-            return
-            
-        # are listeners defined for the specified category?  if so, then notify them.
-        if (category in self._CachedListeners):
-            for listener in self.GetListenerGroup(category):
-                if (event != None) and (isinstance(event, xmltree.Element)):
-                    eventEncoded = xmltree.tostring(event, encoding="unicode")
-                    _logsi.LogXml(SILevel.Verbose, "SoundTouch device status update NOTIFY: '%s'" % (category), eventEncoded, prettyPrint=True)
-                try:
-                    listener(self._Client, event)
-                except Exception as ex: 
-                    _logsi.LogException(BSTAppMessages.BST_WEBSOCKET_EVENTHANDLER_ERROR % (category, str(ex)), ex, logToSystemLogger=False)
+        # coalesce bursts of events of the same category, if requested.
+        if (self._Coalescer is not None) and (not self._Coalescer.Coalesce(self, category, stEvent)):
             return
-        
+
+        self._DeliverListeners(category, stEvent)
+
 
     def RemoveListener(self, category:SoundTouchNotifyCategorys, listener) -> bool:
         """
@@ -568,23 +1072,52 @@ class SoundTouchWebSocket:
         # convert category argument to string.
         category = SoundTouchNotifyCategorys.toString(category)
 
-        # remove the listener from the category list of listeners.
-        if category not in self._CachedListeners: 
+        # remove the listener (typed or not) from the category list of listeners.
+        if category in self._CachedListeners: 
             listeners: list = self._CachedListeners[category]
             for ls in listeners:
                 if ls == listener:
                     listeners.remove(ls)
+                    self._PrefilterIsStale = True
                     return True
         return False
 
 
+    def Resync(self) -> int:
+        """
+        Queries the configurations that may have changed while disconnected from the device
+        (now playing, volume, zone and presets), and notifies listeners of them as update 
+        events (e.g. "nowPlayingUpdated", "volumeUpdated", etc).
+
+        Returns:
+            The number of update events that were raised.
+
+        This method is called automatically after a lost connection was re-established.  The
+        configurations are queried concurrently; configurations that could not be queried are
+        logged and skipped.  Resync update events contain a `resync="true"` attribute, so that
+        listeners can tell them apart from updates sent by the device.
+        """
+        events:list = self._GetResyncEvents()
+        _logsi.LogVerbose("SoundTouch web socket resync raised %d update events for device '%s'" % (len(events), self._Client.Device.DeviceName))
+        self._NotifyResyncEvents(events)
+        return len(events)
+
+
     def StartNotification(self) -> None:
         """
         Creates and starts a web socket event loop thread that listens for notifications 
         from the SoundTouch device.
         
-        Only one web socket event loop thread will be started for the device.
+        Only one web socket event loop thread will be started for the device.  If a `hub` was
+        specified, then the connection is added to the hub instead.
         """
+        self._OpenCount = 0
+        self._ReconnectAttempt = 0
+
+        if self._Hub is not None:
+            self._Hub.Add(self)
+            return
+
         if self._WebsocketClient is None:
 
             wsUrl = 'ws://%s:%d/' % (self._Client.Device.Host, self._Port)
@@ -603,7 +1136,7 @@ class SoundTouchWebSocket:
             
             # start the run_forever loop to receive notifications.
             _logsi.LogVerbose("Starting SoundTouch web socket event listener thread")
-            self._Thread = _SoundTouchWebSocketThread(self._WebsocketClient, self._PingInterval, SoundTouchWebSocket._PING_TIMEOUT)
+            self._Thread = _SoundTouchWebSocketThread(self._WebsocketClient, self._PingInterval, SoundTouchWebSocket._PING_TIMEOUT, self)
             self._Thread.name = 'SoundTouchWSNotifyThreadDaemon'
             self._Thread.daemon = True
             self._Thread.start()
@@ -616,6 +1149,12 @@ class SoundTouchWebSocket:
         
         This method does nothing if the event loop thread was not started.
         """
+        if self._Hub is not None:
+            if self in self._Hub.Sockets:
+                self._Hub.Remove(self)
+                self._Client.ConfigurationCache.ClearPushed()
+            return
+
         if self._WebsocketClient != None:
             
             try:
@@ -623,8 +1162,7 @@ class SoundTouchWebSocket:
                 # stop the run_forever loop thread if it is still running.
                 _logsi.LogVerbose("Stopping SoundTouch web socket notification thread")
                 if self._Thread is not None:
-                    if self._Thread._wsocket is not None:
-                        self._Thread._wsocket.keep_running = False
+                    self._Thread.Stop()
                 self._Thread = None
             
                 # close socket (only kwargs accepted: status:int, reason:bytes=b"xxx" 123 chars max).
@@ -643,6 +1181,9 @@ class SoundTouchWebSocket:
                 self._WebsocketClient = None
                 self._Thread = None
 
+                # pushed configurations are no longer kept current by the device.
+                self._Client.ConfigurationCache.ClearPushed()
+
 
     def ToString(self) -> str:
         """
@@ -22,6 +22,26 @@ try:
     if SoundTouchNodes.sources.Path in client.ConfigurationCache:
         sourceList:SourceList = client.ConfigurationCache[SoundTouchNodes.sources.Path]
         print("\nCached configuration, direct:\n%s" % sourceList.ToString(True))
+        print("Cached configuration age: %.3f seconds" % client.ConfigurationCache.GetAge(SoundTouchNodes.sources))
+
+    # get volume, only querying the device if the cached volume is older than 5 seconds.
+    volume:Volume = client.GetVolume(5)
+    print("\nVolume (max-age=5):\n%s" % volume.ToString())
+
+    # change the maximum age of cached volume information to 10 seconds; it will then
+    # be used when a refresh value of None is specified.
+    client.ConfigurationCache.SetMaxAge(SoundTouchNodes.volume, 10)
+    volume:Volume = client.GetVolume(None)
+    print("\nVolume (max-age=%s):\n%s" % (client.ConfigurationCache.GetMaxAge(SoundTouchNodes.volume), volume.ToString()))
+
+    # get a consistent snapshot of several cached configurations at once.
+    snapshot:dict = client.ConfigurationCache.GetSnapshot([SoundTouchNodes.sources, SoundTouchNodes.volume])
+    print("\nSnapshot keys: %s" % list(snapshot.keys()))
+
+    # update a cached configuration only if no other thread changed it in the meantime.
+    volume, version = client.ConfigurationCache.GetEntry(SoundTouchNodes.volume)
+    if client.ConfigurationCache.CompareAndSet(SoundTouchNodes.volume, volume, version):
+        print("Cached volume updated (version %s -> %s)" % (version, client.ConfigurationCache.GetVersion(SoundTouchNodes.volume)))
         
 except Exception as ex:
 
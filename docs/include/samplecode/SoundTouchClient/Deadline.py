@@ -0,0 +1,25 @@
+from bosesoundtouchapi import *
+from bosesoundtouchapi.models import *
+from bosesoundtouchapi.uri import *
+
+try:
+
+    # create SoundTouch device instance.
+    device:SoundTouchDevice = SoundTouchDevice("192.168.1.81") # Bose SoundTouch 10
+
+    # create SoundTouch client instance from device.
+    client:SoundTouchClient = SoundTouchClient(device)
+
+    # use a shorter read timeout for volume requests.
+    client.TimeoutPolicy.SetReadTimeout(SoundTouchNodes.volume, 2)
+
+    # store current settings of the device.
+    client.StoreSnapshot()
+
+    # restore the settings, allowing no more than 10 seconds for all requests.
+    with client.Deadline(10):
+        client.RestoreSnapshot()
+
+except Exception as ex:
+
+    print("** Exception: %s" % str(ex))
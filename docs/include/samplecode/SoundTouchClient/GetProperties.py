@@ -0,0 +1,25 @@
+from bosesoundtouchapi import *
+from bosesoundtouchapi.models import *
+from bosesoundtouchapi.uri import *
+
+try:
+
+    # create SoundTouch device instance.
+    device:SoundTouchDevice = SoundTouchDevice("192.168.1.81") # Bose SoundTouch 10
+
+    # create SoundTouch client instance from device.
+    client:SoundTouchClient = SoundTouchClient(device)
+
+    # get real-time configuration from the device for multiple nodes concurrently.
+    nowPlaying, volume, zone = client.GetProperties([
+        (SoundTouchNodes.nowPlaying, NowPlayingStatus),
+        (SoundTouchNodes.volume, Volume),
+        (SoundTouchNodes.getZone, Zone),
+        ])
+    print(nowPlaying.ToString())
+    print(volume.ToString())
+    print(zone.ToString())
+
+except Exception as ex:
+
+    print("** Exception: %s" % str(ex))
@@ -0,0 +1,29 @@
+from bosesoundtouchapi import *
+from bosesoundtouchapi.models import *
+from bosesoundtouchapi.uri import *
+import time
+
+try:
+
+    # create SoundTouch device instance.
+    device:SoundTouchDevice = SoundTouchDevice("192.168.1.81") # Bose SoundTouch 10
+
+    # create SoundTouch client instance from device.
+    client:SoundTouchClient = SoundTouchClient(device)
+
+    # poll the device for now playing changes.
+    for i in range(10):
+
+        nowPlaying:NowPlayingStatus = client.GetNowPlayingStatus(True)
+
+        # only process the status if it changed since the last poll.
+        if client.HasConfigurationChanged(SoundTouchNodes.nowPlaying):
+            print("Now playing changed: %s" % nowPlaying.ToString())
+        else:
+            print("Now playing not changed")
+
+        time.sleep(2)
+
+except Exception as ex:
+
+    print("** Exception: %s" % str(ex))
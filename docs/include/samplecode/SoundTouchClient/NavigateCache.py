@@ -0,0 +1,40 @@
+from bosesoundtouchapi import *
+from bosesoundtouchapi.models import *
+from bosesoundtouchapi.uri import *
+
+try:
+    
+    # create SoundTouch device instance.
+    device:SoundTouchDevice = SoundTouchDevice("192.168.1.81") # Bose SoundTouch 10
+            
+    # create SoundTouch client instance from device.
+    client:SoundTouchClient = SoundTouchClient(device)
+
+    # keep navigation results for 10 minutes, up to 4 MB of device responses.
+    client.NavigateCache.TimeToLive = 600
+    client.NavigateCache.MaxBytes = 4194304
+
+    # set NAS library source to access.
+    nasSource:str = SoundTouchSources.STORED_MUSIC.value
+    nasSourceAccount:str = "d09708a1-5953-44bc-a413-7d516e04b819/0"
+
+    # get NAS library content - Root container; the device is queried the first time.
+    criteria:Navigate = Navigate(nasSource, nasSourceAccount)
+    rootContainer:NavigateResponse = client.GetMusicLibraryItems(criteria, refresh=False)
+
+    # get NAS library content - Root \ Music container.
+    criteria:Navigate = Navigate(nasSource, nasSourceAccount, rootContainer.GetItemByName("Music"))
+    musicContainer:NavigateResponse = client.GetMusicLibraryItems(criteria, refresh=False)
+
+    # navigate back to the Root container; the result is returned from the cache.
+    criteria:Navigate = Navigate(nasSource, nasSourceAccount)
+    rootContainer:NavigateResponse = client.GetMusicLibraryItems(criteria, refresh=False)
+    print(client.NavigateCache.ToString())
+
+    # discard cached results of the NAS library.
+    count:int = client.NavigateCache.Invalidate(nasSource, nasSourceAccount)
+    print("Discarded %d cached results" % count)
+
+except Exception as ex:
+
+    print("** Exception: %s" % str(ex))
@@ -0,0 +1,38 @@
+from bosesoundtouchapi import *
+from bosesoundtouchapi.models import *
+from bosesoundtouchapi.uri import *
+
+def OnStatisticsValue(uri:str, name:str, value:float) -> None:
+    if name == 'http_time':
+        print("'%s' http request took %.1f ms" % (uri, value * 1000))
+
+try:
+
+    # create SoundTouch device instance.
+    device:SoundTouchDevice = SoundTouchDevice("192.168.1.81") # Bose SoundTouch 10
+
+    # create SoundTouch client instance from device.
+    client:SoundTouchClient = SoundTouchClient(device)
+
+    # be notified of each value as it is recorded (optional).
+    client.Statistics.Callback = OnStatisticsValue
+
+    # get some configurations, using the cache where possible.
+    for i in range(5):
+        client.GetVolume(refresh=None)
+        client.GetCapabilities(refresh=None)
+        client.GetNowPlayingStatus(refresh=True)
+
+    # get a copy of the collected statistics.
+    snapshot:dict = client.Statistics.GetSnapshot()
+    print("Totals: %s" % snapshot['totals'])
+    for uri, stats in snapshot['uris'].items():
+        print("%-16s hits=%d misses=%d requests=%d bytes=%d avg http=%s" % (uri, stats['hits'], stats['misses'], stats['requests'], stats['bytes_received'], stats['http_time']['avg']))
+
+    # clear the collected statistics.
+    client.Statistics.Reset()
+    print(client.Statistics.ToString())
+
+except Exception as ex:
+
+    print("** Exception: %s" % str(ex))
@@ -0,0 +1,34 @@
+from bosesoundtouchapi import *
+from bosesoundtouchapi.models import *
+from bosesoundtouchapi.uri import *
+
+try:
+
+    # create SoundTouch device instance.
+    device:SoundTouchDevice = SoundTouchDevice("192.168.1.81") # Bose SoundTouch 10
+
+    # create SoundTouch client instance from device.
+    client:SoundTouchClient = SoundTouchClient(device)
+
+    # persist slow-changing configurations to the local file system; on the next run
+    # they are restored from the cache file instead of being requested from the device.
+    client.UpdateConfigurationCacheStatus(True)
+    print("Cache file: %s" % client.ConfigurationCache.PersistentPath)
+
+    # get capabilities, using the persisted configuration if there is one.
+    capabilities:Capabilities = client.GetCapabilities(refresh=None)
+    print(capabilities.ToString())
+
+    # get source list, using the persisted configuration if there is one.
+    sources:SourceList = client.GetSourceList(refresh=None)
+    print(sources.ToString())
+
+    # persist presets and sources only.
+    client.UpdateConfigurationCacheStatus(True, uris=[SoundTouchNodes.presets, SoundTouchNodes.sources])
+
+    # stop persisting configurations.
+    client.UpdateConfigurationCacheStatus(False)
+
+except Exception as ex:
+
+    print("** Exception: %s" % str(ex))
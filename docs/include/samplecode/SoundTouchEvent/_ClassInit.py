@@ -0,0 +1,60 @@
+# external package imports.
+import time
+
+# our package imports.
+from bosesoundtouchapi import *
+from bosesoundtouchapi.models import NowPlayingStatus, Volume
+from bosesoundtouchapi.ws import *
+
+
+class EventHandlerClass:
+    
+    def OnSoundTouchUpdateEvent(client:SoundTouchClient, event:SoundTouchEvent) -> None:
+        # the model is parsed once, and shared by all typed listeners; do not modify it.
+        print("\n'%s' %s update: %s" % (client.Device.DeviceName, event.Category, str(event.Model)))
+
+    def OnSoundTouchUpdateEvent_NowPlaying(client:SoundTouchClient, event:SoundTouchEvent) -> None:
+        config:NowPlayingStatus = event.Model
+        if (config != None):
+            print("\n'%s' now playing: '%s' (resync=%s)" % (client.Device.DeviceName, config.Track, event.IsResync))
+
+    def OnSoundTouchUpdateEvent_Volume(client:SoundTouchClient, event:SoundTouchEvent) -> None:
+        config:Volume = event.Model
+        if (config != None):
+            print("\n'%s' volume: %s" % (client.Device.DeviceName, str(config.Actual)))
+
+
+try:
+
+    socket:SoundTouchWebSocket = None
+
+    # create SoundTouch device instance.
+    device:SoundTouchDevice = SoundTouchDevice("192.168.1.81") # Bose SoundTouch 10
+            
+    # create SoundTouch client instance from device.
+    client:SoundTouchClient = SoundTouchClient(device)
+
+    # create a websocket, and add typed listeners; typed listeners receive a SoundTouchEvent
+    # instance whose configuration model is parsed once per event.
+    socket = SoundTouchWebSocket(client, updateConfigurationCache=True)
+    socket.AddListener(SoundTouchNotifyCategorys.nowPlayingUpdated, EventHandlerClass.OnSoundTouchUpdateEvent, typed=True)
+    socket.AddListener(SoundTouchNotifyCategorys.nowPlayingUpdated, EventHandlerClass.OnSoundTouchUpdateEvent_NowPlaying, typed=True)
+    socket.AddListener(SoundTouchNotifyCategorys.volumeUpdated, EventHandlerClass.OnSoundTouchUpdateEvent_Volume, typed=True)
+
+    # start receiving updates.
+    socket.StartNotification()
+    print("** Try changing the volume, or skipping tracks ...")
+
+    time.sleep(120)
+        
+except Exception as ex:
+
+    print(str(ex))
+    raise
+        
+finally:
+            
+    # stop listening for Bose SoundTouch status updates.
+    if (socket != None):
+        socket.StopNotification()
+        socket.ClearListeners()
@@ -0,0 +1,64 @@
+# external package imports.
+import time
+from xml.etree.ElementTree import Element
+
+# our package imports.
+from bosesoundtouchapi import *
+from bosesoundtouchapi.models import NowPlayingStatus, Volume
+from bosesoundtouchapi.ws import *
+
+
+class EventHandlerClass:
+    
+    def OnSoundTouchUpdateEvent_NowPlaying(client:SoundTouchClient, args:Element) -> None:
+        if (args != None):
+            config:NowPlayingStatus = NowPlayingStatus(root=args[0])
+            print("\n'%s' now playing update: %s" % (client.Device.DeviceName, str(config)))
+
+    def OnSoundTouchUpdateEvent_Volume(client:SoundTouchClient, args:Element) -> None:
+        if (args != None):
+            config:Volume = Volume(root=args[0])
+            print("\n'%s' volume update: %s" % (client.Device.DeviceName, str(config)))
+
+
+try:
+
+    socket:SoundTouchWebSocket = None
+
+    # create a coalescer:
+    # - volume updates: notify listeners of the first update immediately, and of the 
+    #   latest update once the volume knob has not been turned for half a second.
+    # - now playing updates: notify listeners of the latest update of each 1 second burst.
+    coalescer:SoundTouchEventCoalescer = SoundTouchEventCoalescer()
+    coalescer.SetWindow(SoundTouchNotifyCategorys.volumeUpdated, 0.5, leading=True, trailing=True)
+    coalescer.SetWindow(SoundTouchNotifyCategorys.nowPlayingUpdated, 1.0)
+
+    # create SoundTouch device instance.
+    device:SoundTouchDevice = SoundTouchDevice("192.168.1.81") # Bose SoundTouch 10
+            
+    # create SoundTouch client instance from device.
+    client:SoundTouchClient = SoundTouchClient(device)
+
+    # create a websocket that uses the coalescer.
+    socket = SoundTouchWebSocket(client, coalescer=coalescer)
+    socket.AddListener(SoundTouchNotifyCategorys.nowPlayingUpdated, EventHandlerClass.OnSoundTouchUpdateEvent_NowPlaying)
+    socket.AddListener(SoundTouchNotifyCategorys.volumeUpdated, EventHandlerClass.OnSoundTouchUpdateEvent_Volume)
+
+    # start receiving updates.
+    socket.StartNotification()
+    print("** Try turning the volume knob, or skipping tracks ...")
+
+    time.sleep(120)
+    print("\n%s" % str(coalescer))
+        
+except Exception as ex:
+
+    print(str(ex))
+    raise
+        
+finally:
+            
+    # stop listening for Bose SoundTouch status updates.
+    if (socket != None):
+        socket.StopNotification()
+        socket.ClearListeners()
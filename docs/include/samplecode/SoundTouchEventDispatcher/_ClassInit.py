@@ -0,0 +1,61 @@
+# external package imports.
+import time
+from xml.etree.ElementTree import Element
+
+# our package imports.
+from bosesoundtouchapi import *
+from bosesoundtouchapi.models import Volume
+from bosesoundtouchapi.ws import *
+
+
+class EventHandlerClass:
+    
+    def OnSoundTouchUpdateEvent_Volume(client:SoundTouchClient, args:Element) -> None:
+        if (args != None):
+            # listeners are called on a dispatcher worker thread, so slow processing here does
+            # not delay the receipt of notifications from the device.
+            config:Volume = Volume(root=args[0])
+            print("\n'%s' volume update: %s" % (client.Device.DeviceName, str(config)))
+            time.sleep(2)
+
+
+try:
+
+    socket:SoundTouchWebSocket = None
+
+    # create a dispatcher that notifies listeners on 4 worker threads; when more than 100 
+    # events are queued, queued events of the same category are replaced by the new event.
+    dispatcher:SoundTouchEventDispatcher = SoundTouchEventDispatcher(workers=4, maxQueueSize=100, 
+                                                                     overflowPolicy=SoundTouchDispatchOverflowPolicys.MergeLatest)
+
+    # create SoundTouch device instance.
+    device:SoundTouchDevice = SoundTouchDevice("192.168.1.81") # Bose SoundTouch 10
+            
+    # create SoundTouch client instance from device.
+    client:SoundTouchClient = SoundTouchClient(device)
+
+    # create a websocket that uses the dispatcher to notify listeners.
+    socket = SoundTouchWebSocket(client, dispatcher=dispatcher)
+    socket.AddListener(SoundTouchNotifyCategorys.volumeUpdated, EventHandlerClass.OnSoundTouchUpdateEvent_Volume)
+
+    # start receiving updates.
+    socket.StartNotification()
+    print("** Try changing the volume of the device ...")
+
+    # show the dispatcher metrics (queue depth, dispatch lag, etc) every 10 seconds.
+    for i in range(30):
+        time.sleep(10)
+        print("\n%s" % str(dispatcher.GetSnapshot()))
+        
+except Exception as ex:
+
+    print(str(ex))
+    raise
+        
+finally:
+            
+    # stop listening for Bose SoundTouch status updates.
+    if (socket != None):
+        socket.StopNotification()
+        socket.ClearListeners()
+    dispatcher.Stop()
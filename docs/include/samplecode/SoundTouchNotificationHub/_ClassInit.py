@@ -0,0 +1,66 @@
+# external package imports.
+import time
+from xml.etree.ElementTree import Element
+from xml.etree import ElementTree
+
+# our package imports.
+from bosesoundtouchapi import *
+from bosesoundtouchapi.ws import *
+
+
+class EventHandlerClass:
+    
+    def OnSoundTouchUpdateEvent(client:SoundTouchClient, args:Element) -> None:
+        if (args != None):
+            argsEncoded = ElementTree.tostring(args, encoding="unicode")
+            print("\n'%s' status update:\n%s" % (client.Device.DeviceName, argsEncoded))
+
+
+    def OnSoundTouchWebSocketCloseEvent(client:SoundTouchClient, ex:Exception) -> None:
+        if (ex != None):
+            print("\n'%s' websocket close event:\n%s" % (client.Device.DeviceName, str(ex)))
+
+
+try:
+
+    hub:SoundTouchNotificationHub = None
+    sockets:list[SoundTouchWebSocket] = []
+
+    # create a hub that receives notifications for all devices on a single thread.
+    hub = SoundTouchNotificationHub()
+
+    # create SoundTouch clients for all devices.
+    fleet:SoundTouchFleet = SoundTouchFleet()
+    fleet.Initialize(["192.168.1.80", "192.168.1.81", "192.168.1.82"])
+
+    for client in fleet:
+
+        # create a websocket that uses the hub to receive notifications from the device.
+        socket:SoundTouchWebSocket = SoundTouchWebSocket(client, hub=hub)
+        socket.AddListener(SoundTouchNotifyCategorys.nowPlayingUpdated, EventHandlerClass.OnSoundTouchUpdateEvent)
+        socket.AddListener(SoundTouchNotifyCategorys.volumeUpdated, EventHandlerClass.OnSoundTouchUpdateEvent)
+        socket.AddListener(SoundTouchNotifyCategorys.WebSocketClose, EventHandlerClass.OnSoundTouchWebSocketCloseEvent)
+        sockets.append(socket)
+
+        # start receiving updates (on the hub thread).
+        socket.StartNotification()
+
+    print("** Notification hub has started: %s" % hub)
+    print("** Try pressing some buttons on your SoundTouch remotes or devices ...")
+
+    # for testing status notifications.
+    time.sleep(300)
+        
+except Exception as ex:
+
+    print(str(ex))
+    raise
+        
+finally:
+            
+    # stop listening for Bose SoundTouch status updates.
+    for socket in sockets:
+        socket.StopNotification()
+        socket.ClearListeners()
+    if hub is not None:
+        hub.Stop()
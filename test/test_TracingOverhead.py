@@ -0,0 +1,127 @@
+# external package imports.
+from smartinspectpython.siauto import *
+import time
+import tracemalloc
+from xml.etree import ElementTree
+
+# our package imports.
+from bosesoundtouchapi import *
+from bosesoundtouchapi.models import *
+from bosesoundtouchapi.uri import *
+from bosesoundtouchapi.ws import *
+
+# this benchmark measures the cost of the request / notification hot paths with
+# SmartInspect tracing disabled and enabled; it does not require a SoundTouch device,
+# as the device is created from a descriptor and responses / events are simulated.
+
+DEVICE_INFO:str = \
+    '<info deviceID="9070658C9D4A"><name>Bose-ST10-1</name><type>SoundTouch 10</type>' \
+    '<margeAccountUUID>3230304</margeAccountUUID><components><component><componentCategory>SCM</componentCategory>' \
+    '<softwareVersion>27.0.6.46330.5043500 epdbuild.trunk.hepdswbld04.2022-08-04T11:20:29</softwareVersion>' \
+    '<serialNumber>I6332527703739342000020</serialNumber></component></components>' \
+    '<margeURL>https://streaming.bose.com</margeURL><networkInfo type="SCM"><macAddress>9070658C9D4A</macAddress>' \
+    '<ipAddress>192.168.1.81</ipAddress></networkInfo><moduleType>sm2</moduleType><variant>rhino</variant>' \
+    '<variantMode>normal</variantMode><countryCode>US</countryCode><regionCode>US</regionCode></info>'
+
+DEVICE_SUPPORTED_URLS:str = \
+    '<supportedURLs deviceID="9070658C9D4A"><URL location="/nowPlaying" /><URL location="/volume" /></supportedURLs>'
+
+RESPONSE_NOWPLAYING:bytes = \
+    b'<nowPlaying deviceID="9070658C9D4A" source="TUNEIN" sourceAccount="">' \
+    b'<ContentItem source="TUNEIN" type="stationurl" location="/v1/playback/station/s309605" sourceAccount="" isPresetable="true">' \
+    b'<itemName>K-LOVE 90s</itemName><containerArt>http://cdn-profiles.tunein.com/s309605/images/logog.png?t=637986891960000000</containerArt>' \
+    b'</ContentItem><track>Sweet Dreams (Are Made of This)</track><artist>Eurythmics</artist><album></album>' \
+    b'<stationName>K-LOVE 90s</stationName><art artImageStatus="IMAGE_PRESENT">http://cdn-profiles.tunein.com/s309605/images/logog.png</art>' \
+    b'<favoriteEnabled /><playStatus>PLAY_STATE</playStatus><streamType>RADIO_STREAMING</streamType></nowPlaying>'
+
+EVENT_VOLUME:bytes = \
+    b'<updates deviceID="9070658C9D4A"><volumeUpdated><volume><targetvolume>20</targetvolume>' \
+    b'<actualvolume>20</actualvolume><muteenabled>false</muteenabled></volume></volumeUpdated></updates>'
+
+
+def OnSoundTouchUpdateEvent(client:SoundTouchClient, args) -> None:
+    pass
+
+
+def Measure(title:str, iterations:int, method) -> None:
+    """
+    Executes the method the specified number of times, and prints the elapsed time
+    and number of bytes allocated per call.
+    """
+    method()  # warm up.
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    startSize, _ = tracemalloc.get_traced_memory()
+    startTime:float = time.perf_counter()
+    allocated:int = 0
+    for _ in range(iterations):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        method()
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += max(0, peak - before)
+    elapsed:float = time.perf_counter() - startTime
+    tracemalloc.stop()
+    print("%-50s %8.1f usec/call %8d bytes/call (peak)" % (title, elapsed * 1000000 / iterations, allocated / iterations))
+
+
+try:
+
+    print("Test Starting")
+    iterations:int = 2000
+
+    # create SoundTouch device and client instances without any network i/o.
+    descriptor:dict = \
+    {
+        'version': 1,
+        'host': '192.168.1.81',
+        'port': 8090,
+        'connect_timeout': 30,
+        'information': DEVICE_INFO,
+        'supported_urls': DEVICE_SUPPORTED_URLS,
+        'supported_uris': [ 'nowPlaying', 'volume' ],
+        'unknown_url_names': [],
+        'unsupported_url_names': [],
+    }
+    device:SoundTouchDevice = SoundTouchDevice.FromDescriptor(descriptor)
+    client:SoundTouchClient = SoundTouchClient(device)
+
+    # create a websocket with 3 listeners; the websocket is not started, as events
+    # are passed directly to the NotifyListeners method.
+    socket:SoundTouchWebSocket = SoundTouchWebSocket(client)
+    for _ in range(3):
+        socket.AddListener(SoundTouchNotifyCategorys.volumeUpdated, lambda c, a: OnSoundTouchUpdateEvent(c, a))
+    event:ElementTree.Element = ElementTree.fromstring(EVENT_VOLUME)[0]
+
+    def ProcessResponse() -> None:
+        msg:SoundTouchMessage = SoundTouchMessage(SoundTouchNodes.nowPlaying)
+        client._ProcessResponse(msg, 'http://192.168.1.81:8090/nowPlaying', 200, RESPONSE_NOWPLAYING, None)
+
+    def NotifyListeners() -> None:
+        socket.NotifyListeners(SoundTouchNotifyCategorys.volumeUpdated.value, event)
+
+    # measure with tracing disabled.
+    SIAuto.Si.Enabled = False
+    print("\n** SmartInspect tracing disabled")
+    Measure("SoundTouchClient._ProcessResponse (nowPlaying)", iterations, ProcessResponse)
+    Measure("SoundTouchWebSocket.NotifyListeners (3 listeners)", iterations, NotifyListeners)
+
+    # measure with tracing enabled at the verbose level; no connections are defined,
+    # so log entries are formatted but not sent anywhere.
+    SIAuto.Si.Level = SILevel.Verbose
+    SIAuto.Si.DefaultLevel = SILevel.Verbose
+    SIAuto.Si.Enabled = True
+    for session in (SIAuto.Si.GetSession('bosesoundtouchapi.soundtouchclient'), SIAuto.Si.GetSession('bosesoundtouchapi.ws.soundtouchwebsocket')):
+        if session is not None:
+            session.Level = SILevel.Verbose
+    print("\n** SmartInspect tracing enabled (Verbose)")
+    Measure("SoundTouchClient._ProcessResponse (nowPlaying)", iterations, ProcessResponse)
+    Measure("SoundTouchWebSocket.NotifyListeners (3 listeners)", iterations, NotifyListeners)
+
+except Exception as ex:
+
+    print("** Exception: %s" % str(ex))
+
+finally:
+
+    print("\nTest Completed")